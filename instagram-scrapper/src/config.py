@@ -2,7 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +17,27 @@ class Settings(BaseSettings):
         description="Redis connection URL for BullMQ queues",
         alias="REDIS_URL",
     )
+    redis_max_connections: int = Field(
+        default=20,
+        description="Size of the Redis connection pool shared by all queues, the worker "
+        "and stores (keep above WORKER_CONCURRENCY + 2)",
+        alias="REDIS_MAX_CONNECTIONS",
+    )
+    redis_pool_timeout: float = Field(
+        default=10.0,
+        description="Seconds to wait for a free pooled Redis connection",
+        alias="REDIS_POOL_TIMEOUT",
+    )
+    redis_health_check_interval: int = Field(
+        default=30,
+        description="PING pooled Redis connections idle for longer than this many seconds",
+        alias="REDIS_HEALTH_CHECK_INTERVAL",
+    )
+    redis_stats_interval: int = Field(
+        default=300,
+        description="Log Redis pool and media refetch stats every this many seconds (0 disables)",
+        alias="REDIS_STATS_INTERVAL",
+    )
 
     # Queue Names (matching NestJS SourceQueue enum)
     instagram_fetcher_queue: str = Field(
@@ -33,7 +54,8 @@ class Settings(BaseSettings):
         default=None,
         description="Path to Instagram session file or directory containing session files. "
         "Supports both absolute and relative paths. Relative paths are resolved relative to "
-        "the project root. If a directory is provided, all session files will be tried until one works.",
+        "the project root. If a directory is provided, every valid session file is loaded and "
+        "the sessions are used in rotation.",
         alias="INSTAGRAM_SESSION_PATH",
     )
     instagram_rate_limit_delay: float = Field(
@@ -51,6 +73,174 @@ class Settings(BaseSettings):
         description="Whether to download pictures (default: False, only URLs)",
         alias="INSTAGRAM_DOWNLOAD_PICTURES",
     )
+    instagram_scrape_concurrency: int = Field(
+        default=1,
+        description="Threads running blocking instaloader calls, shared by all jobs "
+        "(independent of WORKER_CONCURRENCY; one per loaded session uses them all)",
+        alias="INSTAGRAM_SCRAPE_CONCURRENCY",
+    )
+    instagram_profile_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds a loaded profile is reused for later jobs (0 disables)",
+        alias="INSTAGRAM_PROFILE_CACHE_TTL",
+    )
+    instagram_session_cooldown: int = Field(
+        default=15 * 60,
+        description="Seconds a session is left unused after a 401/429 or rate limit error",
+        alias="INSTAGRAM_SESSION_COOLDOWN",
+    )
+    instagram_max_defer: float = Field(
+        default=3600.0,
+        description="Seconds after its creation a job waiting for a session stops being "
+        "deferred and fails instead",
+        alias="INSTAGRAM_MAX_DEFER",
+    )
+
+    # Deduplication (already emitted posts per source)
+    seen_index_enabled: bool = Field(
+        default=True,
+        description="Skip posts already emitted for a source instead of scanning for the cursor",
+        alias="SEEN_INDEX_ENABLED",
+    )
+    seen_index_max_size: int = Field(
+        default=2000,
+        description="Maximum number of emitted post shortcodes remembered per source",
+        alias="SEEN_INDEX_MAX_SIZE",
+    )
+    seen_index_ttl: int = Field(
+        default=30 * 24 * 60 * 60,
+        description="How long emitted post shortcodes are remembered, in seconds",
+        alias="SEEN_INDEX_TTL",
+    )
+    seen_stop_after: int = Field(
+        default=4,
+        description="Stop paging a profile after this many consecutive already-seen posts "
+        "(must exceed the number of pinned posts, which appear first out of order)",
+        alias="SEEN_STOP_AFTER",
+    )
+
+    # Media deduplication (uploads already queued, by URL, shared by all sources)
+    media_index_enabled: bool = Field(
+        default=True,
+        description="Reuse the storage key of media whose URL was already uploaded or queued "
+        "instead of publishing another upload job",
+        alias="MEDIA_INDEX_ENABLED",
+    )
+    media_index_ttl: int = Field(
+        default=30 * 24 * 60 * 60,
+        description="How long uploaded media URLs are remembered, in seconds",
+        alias="MEDIA_INDEX_TTL",
+    )
+    media_index_pending_ttl: int = Field(
+        default=24 * 60 * 60,
+        description="How long media URLs are remembered while their upload is pending, in "
+        "seconds (the media worker extends it to MEDIA_INDEX_TTL once uploaded)",
+        alias="MEDIA_INDEX_PENDING_TTL",
+    )
+
+    # Media pre-flight probe (HEAD/Range request per media URL before queueing its upload)
+    media_probe_enabled: bool = Field(
+        default=False,
+        description="Check media URLs before queueing uploads: drop dead, non-media and "
+        "oversized files and take content type and extension from the response",
+        alias="MEDIA_PROBE_ENABLED",
+    )
+    media_probe_concurrency: int = Field(
+        default=10,
+        description="Maximum number of media probe requests in flight",
+        alias="MEDIA_PROBE_CONCURRENCY",
+    )
+    media_probe_timeout: float = Field(
+        default=5.0,
+        description="Timeout of a media probe request in seconds (media is kept on timeout)",
+        alias="MEDIA_PROBE_TIMEOUT",
+    )
+    media_probe_max_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        description="Drop media larger than this many bytes (0 disables the limit)",
+        alias="MEDIA_PROBE_MAX_BYTES",
+    )
+
+    # Inline small media (downloaded at scrape time, shipped as a buffer upload job)
+    media_inline_enabled: bool = Field(
+        default=False,
+        description="Download small media while scraping and send it inside the upload job, "
+        "so the media worker does not fetch it from the origin again",
+        alias="MEDIA_INLINE_ENABLED",
+    )
+    media_inline_max_bytes: int = Field(
+        default=128 * 1024,
+        description="Largest media file inlined, in bytes",
+        alias="MEDIA_INLINE_MAX_BYTES",
+    )
+    media_inline_job_budget: int = Field(
+        default=1024 * 1024,
+        description="Bytes of media inlined per fetch job at most (base64 adds a third in Redis)",
+        alias="MEDIA_INLINE_JOB_BUDGET",
+    )
+    media_inline_concurrency: int = Field(
+        default=10,
+        description="Maximum number of inline media downloads in flight",
+        alias="MEDIA_INLINE_CONCURRENCY",
+    )
+    media_inline_timeout: float = Field(
+        default=10.0,
+        description="Timeout of an inline media download in seconds (falls back to a URL job)",
+        alias="MEDIA_INLINE_TIMEOUT",
+    )
+
+    # Signed media URL expiry (Instagram CDN "oe" parameter)
+    media_expiry_margin: int = Field(
+        default=15 * 60,
+        description="URLs expiring within this many seconds are not left to wait in the media "
+        "queue: they are refetched now when MEDIA_REFETCH_ENABLED, queued first otherwise",
+        alias="MEDIA_EXPIRY_MARGIN",
+    )
+    media_refetch_enabled: bool = Field(
+        default=False,
+        description="Download media of expiring URLs while scraping and ship it as buffer jobs",
+        alias="MEDIA_REFETCH_ENABLED",
+    )
+    media_refetch_max_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        description="Largest media file refetched, in bytes",
+        alias="MEDIA_REFETCH_MAX_BYTES",
+    )
+    media_refetch_job_budget: int = Field(
+        default=16 * 1024 * 1024,
+        description="Bytes of media refetched per fetch job at most",
+        alias="MEDIA_REFETCH_JOB_BUDGET",
+    )
+
+    # Result publishing
+    result_batch_enabled: bool = Field(
+        default=False,
+        description="Buffer results and write them to the results queue with addBulk",
+        alias="RESULT_BATCH_ENABLED",
+    )
+    result_batch_max_size: int = Field(
+        default=50,
+        description="Flush the result batch once it holds this many results",
+        alias="RESULT_BATCH_MAX_SIZE",
+    )
+    result_batch_max_delay_ms: int = Field(
+        default=50,
+        description="Flush the result batch at most this many milliseconds after its first result",
+        alias="RESULT_BATCH_MAX_DELAY_MS",
+    )
+
+    result_chunk_max_bytes: int = Field(
+        default=512 * 1024,
+        description="Split posts of one fetch into result jobs of at most this many bytes "
+        "of post JSON (0 disables chunking)",
+        alias="RESULT_CHUNK_MAX_BYTES",
+    )
+    result_encoding: Literal["json", "gzip", "zstd"] = Field(
+        default="json",
+        description="Store result posts as plain JSON or compressed (gzip, or zstd with the zstd "
+        "extra installed) and base64 encoded",
+        alias="RESULT_ENCODING",
+    )
 
     # Worker Configuration
     worker_concurrency: int = Field(
@@ -6,10 +6,16 @@ import signal
 import sys
 
 from src.config import get_settings
+from src.redis_client import RedisClientFactory
 from src.scraper.instagram_scraper import InstagramScraper
 from src.scraper.queue_worker import InstagramQueueWorker
 from src.scraper.result_publisher import ResultPublisher
 from src.scraper.media_upload_publisher import MediaUploadPublisher
+from src.scraper.media_index import MediaIndex
+from src.scraper.media_inline import MediaInliner
+from src.scraper.media_probe import MediaProbe
+from src.scraper.media_refetch import MediaRefetcher
+from src.scraper.seen_index import SeenIndex
 
 
 def setup_logging() -> None:
@@ -29,6 +35,9 @@ class InstagramScrapperApp:
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
         self.worker: InstagramQueueWorker | None = None
+        self.redis_factory: RedisClientFactory | None = None
+        self.media_refetcher: MediaRefetcher | None = None
+        self.stats_task: asyncio.Task | None = None
         self.shutdown_event = asyncio.Event()
 
     def setup_signal_handlers(self) -> None:
@@ -46,20 +55,50 @@ class InstagramScrapperApp:
         self.logger.info("Instagram Scrapper starting...")
 
         try:
+            # One connection pool for every queue, the worker and the stores
+            self.redis_factory = RedisClientFactory(self.settings)
+            redis_factory = self.redis_factory
+
             # Initialize components
             scraper = InstagramScraper(self.settings)
-            publisher = ResultPublisher(self.settings)
-            media_publisher = MediaUploadPublisher(self.settings)
+            publisher = ResultPublisher(self.settings, redis_factory.client())
+            media_publisher = MediaUploadPublisher(self.settings, redis_factory.client())
+            seen_index = (
+                SeenIndex(self.settings, redis_factory.client())
+                if self.settings.seen_index_enabled
+                else None
+            )
+            media_index = (
+                MediaIndex(self.settings, redis_factory.client())
+                if self.settings.media_index_enabled
+                else None
+            )
+            media_probe = MediaProbe(self.settings) if self.settings.media_probe_enabled else None
+            media_inliner = (
+                MediaInliner(self.settings) if self.settings.media_inline_enabled else None
+            )
+            self.media_refetcher = (
+                MediaRefetcher(self.settings) if self.settings.media_refetch_enabled else None
+            )
             self.worker = InstagramQueueWorker(
                 self.settings,
                 scraper,
                 publisher,
                 media_publisher,
+                seen_index,
+                media_index=media_index,
+                media_probe=media_probe,
+                media_inliner=media_inliner,
+                media_refetcher=self.media_refetcher,
+                redis=redis_factory.client(),
             )
 
             # Start the worker
             self.worker.start()
 
+            if self.settings.redis_stats_interval > 0:
+                self.stats_task = asyncio.create_task(self._log_redis_stats())
+
             self.logger.info("Instagram Scrapper initialized successfully")
             self.logger.info(
                 f"Worker listening on queue: {self.settings.instagram_fetcher_queue}",
@@ -80,13 +119,36 @@ class InstagramScrapperApp:
         finally:
             await self.stop()
 
+    async def _log_redis_stats(self) -> None:
+        """Periodically log Redis connection pool usage and media refetch results."""
+        while True:
+            await asyncio.sleep(self.settings.redis_stats_interval)
+            if self.redis_factory:
+                stats = self.redis_factory.stats()
+                self.logger.info(
+                    f"Redis pool: {stats['in_use']} in use, {stats['idle']} idle, "
+                    f"max {stats['max']}",
+                )
+            if self.media_refetcher:
+                refetch = self.media_refetcher.stats()
+                self.logger.info(
+                    f"Media refetch: {refetch['saved']} saved, {refetch['missed']} missed",
+                )
+
     async def stop(self) -> None:
         """Stop the Instagram scraper application gracefully."""
         self.logger.info("Shutting down Instagram Scrapper...")
 
+        if self.stats_task:
+            self.stats_task.cancel()
+
         if self.worker:
             await self.worker.stop()
 
+        # Close the pool last, once the worker and publishers released their clients
+        if self.redis_factory:
+            await self.redis_factory.close()
+
         self.logger.info("Instagram Scrapper stopped")
 
 
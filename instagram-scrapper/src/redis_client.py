@@ -0,0 +1,65 @@
+"""Process-wide Redis connection pool shared by queues, the worker and stores."""
+
+import logging
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import BusyLoadingError, ConnectionError, TimeoutError
+
+from src.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisClientFactory:
+    """
+    Hands out Redis clients that all draw from one bounded connection pool.
+
+    BullMQ closes the client it is given when a Queue or Worker closes. A client
+    built on an explicit pool only releases its connection on close, so the pool
+    stays usable for everyone else until the factory itself is closed.
+    """
+
+    def __init__(self, settings: Settings):
+        """Create the connection pool from settings."""
+        self.settings = settings
+        # Callers wait for a free connection instead of failing when the pool is full
+        self.pool = BlockingConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            socket_keepalive=True,
+            # BullMQ expects str responses
+            decode_responses=True,
+            # Same retry policy BullMQ applies to the connections it creates itself
+            retry=Retry(ExponentialBackoff(cap=20, base=1), 20),
+            retry_on_error=[BusyLoadingError, ConnectionError, TimeoutError],
+        )
+
+    def client(self) -> Redis:
+        """Get a client backed by the shared pool."""
+        return Redis(connection_pool=self.pool)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Dict with max, open, in_use and idle connection counts
+        """
+        in_use = len(getattr(self.pool, "_in_use_connections", ()))
+        idle = len(
+            [conn for conn in getattr(self.pool, "_available_connections", ()) if conn is not None],
+        )
+        return {
+            "max": self.settings.redis_max_connections,
+            "open": in_use + idle,
+            "in_use": in_use,
+            "idle": idle,
+        }
+
+    async def close(self) -> None:
+        """Disconnect every pooled connection."""
+        await self.pool.disconnect()
@@ -1,15 +1,21 @@
 """Instagram scraper using instaloader."""
 
 import logging
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Iterable, Optional
 
 import instaloader
 
 from src.config import Settings
+from src.scraper.instagram_sessions import InstagramSession, SessionPool
+from src.scraper.profile_cache import ProfileCache
 
 logger = logging.getLogger(__name__)
 
+# Profiles show up to three pinned posts first, out of date order
+MAX_PINNED_POSTS = 3
+
 
 class InstagramScraper:
     """Wrapper around instaloader for fetching Instagram posts."""
@@ -17,11 +23,14 @@ class InstagramScraper:
     def __init__(self, settings: Settings):
         """Initialize Instagram scraper with settings."""
         self.settings = settings
-        self.loader = self._create_loader()
+        self.sessions = SessionPool(
+            self._create_sessions(),
+            cooldown=settings.instagram_session_cooldown,
+        )
 
     def _create_loader(self) -> instaloader.Instaloader:
         """Create and configure Instaloader instance."""
-        loader = instaloader.Instaloader(
+        return instaloader.Instaloader(
             download_videos=self.settings.instagram_download_videos,
             download_pictures=self.settings.instagram_download_pictures,
             download_geotags=False,
@@ -32,44 +41,62 @@ class InstagramScraper:
             max_connection_attempts=3,
         )
 
-        # Load session if available
+    def _create_session(self, name: str, loader: instaloader.Instaloader) -> InstagramSession:
+        """Wrap a loader into a pool session."""
+        return InstagramSession(
+            name=name,
+            loader=loader,
+            profile_cache=ProfileCache(self.settings.instagram_profile_cache_ttl),
+        )
+
+    def _create_sessions(self) -> list[InstagramSession]:
+        """Load every valid session, or a single anonymous one if there is none."""
+        sessions = []
+
+        # Load sessions if available
         session_path = self.settings.get_session_file_path()
         if session_path:
+            sessions = self._load_sessions_from_directory(session_path)
 
-            self._load_sessions_from_directory(loader, session_path)
+        if not sessions:
+            sessions = [self._create_session("anonymous", self._create_loader())]
 
-        return loader
+        return sessions
 
-    def _load_sessions_from_directory(
-        self, loader: instaloader.Instaloader, session_dir: Path
-    ) -> None:
+    def _load_sessions_from_directory(self, session_dir: Path) -> list[InstagramSession]:
         """
-        Load sessions from a directory, trying each one until one works.
+        Load every valid session from a directory, each in its own Instaloader.
 
         Args:
-            loader: Instaloader instance to load sessions into
-            session_dir: Directory containing session files
+            session_dir: Directory containing session files (or a single session file)
+
+        Returns:
+            List of sessions that loaded and verified successfully
         """
         # Find all session files (files without extensions, as instaloader saves them)
-        session_files = [
-            f for f in session_dir.iterdir() if f.is_file() and not f.name.startswith(".")
-        ]
+        if session_dir.is_file():
+            session_files = [session_dir]
+        else:
+            session_files = [
+                f for f in session_dir.iterdir() if f.is_file() and not f.name.startswith(".")
+            ]
 
         if not session_files:
             logger.warning(
                 f"No session files found in directory: {session_dir}. "
                 "Continuing without authentication.",
             )
-            return
+            return []
 
         logger.info(
             f"Found {len(session_files)} session file(s) in {session_dir}. "
             "Attempting to load sessions...",
         )
 
-        # Try each session until one works
+        sessions = []
         failed_sessions = []
         for session_file in session_files:
+            loader = self._create_loader()
             try:
                 # load_session_from_file expects: username (for internal use) and filename (full path)
                 loader.load_session_from_file(
@@ -85,23 +112,25 @@ class InstagramScraper:
                     logger.info(
                         f"✓ Session {session_file.name} is valid and authenticated",
                     )
-                    return  # Successfully loaded and verified, stop trying
+                    sessions.append(self._create_session(session_file.name, loader))
                 else:
                     logger.warning(
                         f"⚠ Session {session_file.name} loaded but appears invalid or expired. "
-                        "Trying next session...",
+                        "Skipping it...",
                     )
                     failed_sessions.append(
                         (session_file.name, "Session expired or invalid"),
                     )
-                    continue
 
             except Exception as e:
                 failed_sessions.append((session_file.name, str(e)))
                 logger.debug(
-                    f"Failed to load session {session_file.name}: {e}. Trying next session...",
+                    f"Failed to load session {session_file.name}: {e}. Skipping it...",
                 )
-                continue
+
+        if sessions:
+            logger.info(f"Using {len(sessions)} Instagram session(s) in rotation")
+            return sessions
 
         # If we get here, all sessions failed
         error_details = "; ".join([f"{name}: {err}" for name, err in failed_sessions])
@@ -113,6 +142,7 @@ class InstagramScraper:
             "⚠️  Note: Instagram may return 401 errors if sessions are expired. "
             "Consider recreating your session file using the create_session.py script.",
         )
+        return []
 
     def _verify_session(self, loader: instaloader.Instaloader) -> bool:
         """
@@ -146,11 +176,44 @@ class InstagramScraper:
             logger.debug(f"Session verification failed: {e}")
             return False
 
+    def get_profile(
+        self,
+        username: str,
+        session: Optional[InstagramSession] = None,
+    ) -> instaloader.Profile:
+        """
+        Get a profile, from the session's profile cache when it was loaded recently.
+
+        Args:
+            username: Instagram username (without @)
+            session: Session to load the profile with (leased from the pool if None)
+
+        Returns:
+            Profile object
+
+        Raises:
+            instaloader.exceptions.ProfileNotExistsException: Profile not found
+        """
+        if session is None:
+            with self.sessions.lease() as session:
+                return self.get_profile(username, session)
+
+        profile = session.profile_cache.get(username)
+        if profile is None:
+            profile = instaloader.Profile.from_username(
+                session.loader.context,
+                username,
+            )
+            session.profile_cache.put(username, profile)
+        return profile
+
     def fetch_profile_posts(
         self,
         username: str,
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
+        seen_ids: Optional[AbstractSet[str]] = None,
+        session: Optional[InstagramSession] = None,
     ) -> tuple[list[instaloader.Post], Optional[str]]:
         """
         Fetch posts from an Instagram profile.
@@ -158,7 +221,12 @@ class InstagramScraper:
         Args:
             username: Instagram username (without @)
             limit: Maximum number of posts to fetch
-            cursor: Cursor for pagination (post shortcode)
+            cursor: Shortcode of the newest post processed by the previous poll; this
+                post and anything older are not fetched again
+            seen_ids: Shortcodes already emitted for this source. When given, they
+                are skipped and paging stops after a run of seen posts
+            session: Session to fetch with (leased from the pool if None). Posts stay
+                bound to it, so lazy post attributes should be read under the same lease
 
         Returns:
             Tuple of (list of Post objects, next cursor/shortcode)
@@ -167,51 +235,29 @@ class InstagramScraper:
             instaloader.exceptions.ProfileNotExistsException: Profile not found
             instaloader.exceptions.ConnectionException: Network/connection error
             instaloader.exceptions.LoginRequiredException: Authentication required
+            SessionsExhaustedError: Every session is cooling down
         """
+        if session is None:
+            with self.sessions.lease() as session:
+                return self.fetch_profile_posts(username, limit, cursor, seen_ids, session)
+
         try:
-            # Log authentication status
-            is_authenticated = self.loader.context.is_logged_in
-            auth_status = "authenticated" if is_authenticated else "not authenticated"
-            if is_authenticated:
-                logger.info(
-                    f"Using authenticated session (user: @{self.loader.context.username})",
-                )
-            else:
-                logger.warning(
-                    "⚠️  No valid session found - making unauthenticated requests. "
-                    "This may result in rate limiting or 401 errors.",
-                )
+            auth_status = self._log_auth_status(session)
 
             # Get profile
-            profile = instaloader.Profile.from_username(
-                self.loader.context,
-                username,
-            )
+            profile = self.get_profile(username, session)
 
             logger.info(
-                f"Fetching posts for profile @{username} (limit={limit}, cursor={cursor}, {auth_status})",
+                f"Fetching posts for profile @{username} "
+                f"(limit={limit}, cursor={cursor}, {auth_status})",
             )
 
-            posts = []
-            next_cursor = None
-            found_cursor = cursor is None  # If no cursor, start collecting immediately
-
-            # Iterate through posts
-            for post in profile.get_posts():
-                # If we have a cursor, skip until we find it
-                if not found_cursor:
-                    if post.shortcode == cursor:
-                        found_cursor = True
-                    continue
-
-                posts.append(post)
-
-                # Store the shortcode of the last post as next cursor
-                next_cursor = post.shortcode
-
-                # Check limit
-                if limit and len(posts) >= limit:
-                    break
+            posts, next_cursor = self._collect_posts(
+                profile.get_posts(),
+                limit,
+                cursor,
+                seen_ids,
+            )
 
             logger.info(
                 f"Fetched {len(posts)} posts for @{username}, next_cursor={next_cursor}",
@@ -246,3 +292,95 @@ class InstagramScraper:
         except Exception as e:
             logger.error(f"Unexpected error fetching @{username}: {e}")
             raise
+
+    def _collect_posts(
+        self,
+        posts: Iterable[instaloader.Post],
+        limit: Optional[int],
+        cursor: Optional[str],
+        seen_ids: Optional[AbstractSet[str]],
+    ) -> tuple[list[instaloader.Post], Optional[str]]:
+        """
+        Read a profile's posts, newest first, until the cursor or a run of seen posts.
+
+        Without a cursor, the newest posts up to the limit are returned. With one,
+        every post above it is read and, when there are more than the limit, the
+        oldest of them are returned and the cursor moves to the newest returned
+        one; the following polls work off the rest.
+
+        Returns:
+            Tuple of (list of Post objects, next cursor/shortcode)
+        """
+        cursor_id = self._cursor_mediaid(cursor)
+
+        # Once full, the window drops its newest posts, so a backlog goes out oldest first
+        window: deque[instaloader.Post] = deque(maxlen=limit or None)
+        newest: Optional[instaloader.Post] = None
+        truncated = False
+        consecutive_seen = 0
+
+        for position, post in enumerate(posts, start=1):
+            if newest is None or post.mediaid > newest.mediaid:
+                newest = post
+
+            # Media IDs grow over time, so anything not newer than the cursor is old
+            if post.shortcode == cursor or (cursor_id is not None and post.mediaid <= cursor_id):
+                # Pinned posts come first, out of order; they are skipped, not an end
+                if position <= MAX_PINNED_POSTS:
+                    continue
+                break
+
+            # Posts come newest first, so a run of seen posts means the rest is older
+            if seen_ids is not None and post.shortcode in seen_ids:
+                consecutive_seen += 1
+                if consecutive_seen >= self.settings.seen_stop_after:
+                    break
+                continue
+            consecutive_seen = 0
+
+            if limit and len(window) >= limit:
+                truncated = True
+                if cursor is None:
+                    break
+            window.append(post)
+
+        if truncated and cursor is not None:
+            # Newer posts are still pending; they are read from here on the next poll
+            newest = max(window, key=lambda post: post.mediaid)
+        return list(window), self._next_cursor(newest, cursor, cursor_id)
+
+    @staticmethod
+    def _next_cursor(
+        newest: Optional[instaloader.Post],
+        cursor: Optional[str],
+        cursor_id: Optional[int],
+    ) -> Optional[str]:
+        """Get the cursor after a poll: its newest post, unless that is not past the cursor."""
+        if newest is None or (cursor_id is not None and newest.mediaid <= cursor_id):
+            return cursor
+        return newest.shortcode
+
+    @staticmethod
+    def _log_auth_status(session: InstagramSession) -> str:
+        """Log whether the session is logged in, and return it as a status for logs."""
+        context = session.loader.context
+        if context.is_logged_in:
+            logger.info(
+                f"Using authenticated session (user: @{context.username})",
+            )
+            return "authenticated"
+        logger.warning(
+            "⚠️  No valid session found - making unauthenticated requests. "
+            "This may result in rate limiting or 401 errors.",
+        )
+        return "not authenticated"
+
+    @staticmethod
+    def _cursor_mediaid(cursor: Optional[str]) -> Optional[int]:
+        """Get the media ID of a cursor shortcode, or None when it is not one."""
+        if not cursor:
+            return None
+        try:
+            return instaloader.Post.shortcode_to_mediaid(cursor)
+        except (instaloader.exceptions.InvalidArgumentException, ValueError):
+            return None
@@ -0,0 +1,140 @@
+"""Pool of Instagram sessions shared by concurrent scrapes."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+import instaloader
+
+from src.scraper.profile_cache import ProfileCache
+
+logger = logging.getLogger(__name__)
+
+
+class SessionsExhaustedError(Exception):
+    """Every session is cooling down after being rate limited."""
+
+    def __init__(self, message: str, retry_at: datetime):
+        """Initialize error with the time a session is expected to be usable again."""
+        super().__init__(message)
+        self.retry_at = retry_at
+
+
+@dataclass(eq=False)
+class InstagramSession:
+    """One logged-in (or anonymous) Instaloader context and its state in the pool."""
+
+    name: str
+    loader: instaloader.Instaloader
+    # Profiles are bound to the context that loaded them, so each session keeps its own
+    profile_cache: ProfileCache
+    in_use: bool = False
+    cooldown_until: float = 0.0
+    last_used: float = 0.0
+
+
+class SessionPool:
+    """
+    Hands out sessions to scrapes, one scrape per session at a time.
+
+    The least recently used free session is picked, spreading requests evenly
+    over all sessions. A session that hits a rate limit or an authentication
+    error (401/429) cools down before it is used again. Scrapes run in worker
+    threads, so the pool is guarded by a condition variable.
+    """
+
+    def __init__(self, sessions: list[InstagramSession], cooldown: float):
+        """
+        Initialize session pool.
+
+        Args:
+            sessions: Sessions to rotate over (at least one)
+            cooldown: Seconds a rate-limited session is left unused
+        """
+        self.sessions = sessions
+        self.cooldown = cooldown
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def lease(self) -> Iterator[InstagramSession]:
+        """
+        Use a session for the duration of the block.
+
+        Waits while every usable session is busy with another scrape.
+
+        Raises:
+            SessionsExhaustedError: Every session is cooling down
+        """
+        session = self._acquire()
+        error: Optional[Exception] = None
+        try:
+            yield session
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._release(session, error)
+
+    def _acquire(self) -> InstagramSession:
+        """Take the least recently used session that is free and not cooling down."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                ready = [
+                    session
+                    for session in self.sessions
+                    if not session.in_use and session.cooldown_until <= now
+                ]
+                if ready:
+                    session = min(ready, key=lambda s: s.last_used)
+                    session.in_use = True
+                    session.last_used = now
+                    return session
+
+                # Nothing in use will come back: every session is cooling down
+                if not any(session.in_use for session in self.sessions):
+                    wait = min(session.cooldown_until for session in self.sessions) - now
+                    raise SessionsExhaustedError(
+                        f"All {len(self.sessions)} Instagram session(s) are cooling down",
+                        retry_at=datetime.now(timezone.utc) + timedelta(seconds=wait),
+                    )
+
+                self._condition.wait()
+
+    def _release(self, session: InstagramSession, error: Optional[Exception]) -> None:
+        """Return a session, cooling it down if the scrape was rate limited."""
+        with self._condition:
+            session.in_use = False
+            session.last_used = time.monotonic()
+            if error is not None and self._is_rate_limited(error):
+                session.cooldown_until = session.last_used + self.cooldown
+                logger.warning(
+                    f"Instagram session {session.name} rate limited, "
+                    f"cooling down for {self.cooldown:.0f}s: {error}",
+                )
+            self._condition.notify_all()
+
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """Check whether an error means the session is rate limited or rejected."""
+        if isinstance(
+            error,
+            (
+                instaloader.exceptions.TooManyRequestsException,
+                instaloader.exceptions.LoginRequiredException,
+            ),
+        ):
+            return True
+
+        if isinstance(error, instaloader.exceptions.ConnectionException):
+            error_msg = str(error).lower()
+            return any(
+                pattern in error_msg
+                for pattern in ("401", "429", "unauthorized", "please wait a few minutes")
+            )
+
+        return False
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime
+from typing import Optional
 
 import instaloader
 
@@ -22,6 +23,7 @@ class InstagramPostMapper:
     def to_fetched_post(
         post: instaloader.Post,
         source_id: str,
+        owner: Optional[instaloader.Profile] = None,
     ) -> tuple[FetchedPost, list[MediaUploadJobData]]:
         """
         Convert instaloader Post to FetchedPost format.
@@ -29,6 +31,8 @@ class InstagramPostMapper:
         Args:
             post: instaloader Post object
             source_id: Source ID for generating S3 paths
+            owner: Already loaded profile of the post's owner. Without it the
+                owner is read from the post, which may cost a profile request
 
         Returns:
             Tuple of (FetchedPost, list of MediaUploadJobData)
@@ -40,7 +44,7 @@ class InstagramPostMapper:
         )
 
         # Extract author information
-        author = InstagramPostMapper._extract_author(post)
+        author = InstagramPostMapper._extract_author(post, owner)
 
         # Extract metrics
         metrics = InstagramPostMapper._extract_metrics(post)
@@ -143,9 +147,12 @@ class InstagramPostMapper:
         return s3_paths, media_jobs
 
     @staticmethod
-    def _extract_author(post: instaloader.Post) -> PostAuthor:
+    def _extract_author(
+        post: instaloader.Post,
+        owner: Optional[instaloader.Profile] = None,
+    ) -> PostAuthor:
         """Extract author information from a post."""
-        profile = post.owner_profile
+        profile = owner if owner is not None else post.owner_profile
 
         return PostAuthor(
             username=profile.username,
@@ -0,0 +1,42 @@
+"""Expiry of signed Instagram CDN URLs."""
+
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+# BullMQ priorities run from 1 (first) to 2^21 (last)
+PRIORITY_MAX = 2**21
+# Priority steps are this many seconds of remaining URL lifetime
+PRIORITY_STEP = 60
+
+
+def url_expires_at(url: Optional[str]) -> Optional[datetime]:
+    """
+    Get when a signed CDN URL stops working.
+
+    Instagram signs display_url and video_url with "oe", the expiry as a hex
+    Unix timestamp. URLs without it do not expire.
+    """
+    if not url:
+        return None
+    values = parse_qs(urlsplit(url).query).get("oe")
+    if not values:
+        return None
+    try:
+        return datetime.fromtimestamp(int(values[0], 16), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def expiry_priority(expires_at: Optional[datetime], now: Optional[datetime] = None) -> int:
+    """
+    Get the BullMQ priority of an upload from when its URL expires.
+
+    The sooner the URL expires, the sooner the upload runs; uploads that do not
+    expire (no signed URL, inlined buffers) come last.
+    """
+    if expires_at is None:
+        return PRIORITY_MAX
+    now = now or datetime.now(timezone.utc)
+    remaining = (expires_at - now).total_seconds()
+    return max(1, min(PRIORITY_MAX - 1, int(remaining // PRIORITY_STEP)))
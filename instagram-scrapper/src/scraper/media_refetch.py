@@ -0,0 +1,79 @@
+"""Refetch of media whose signed URL expires before its upload runs."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+
+from src.config import Settings
+from src.models import MediaUploadJobData
+from src.scraper.media_expiry import url_expires_at
+from src.scraper.media_inline import MediaInliner
+
+logger = logging.getLogger(__name__)
+
+
+class MediaRefetcher(MediaInliner):
+    """
+    Downloads media whose URL expires before its upload is likely to run.
+
+    Jobs of URLs expiring within MEDIA_EXPIRY_MARGIN seconds would sit in the
+    media queue past their expiry and burn every retry on 403s. Their files are
+    downloaded now and shipped as buffer jobs, up to MEDIA_REFETCH_MAX_BYTES per
+    file and MEDIA_REFETCH_JOB_BUDGET per collector job; downloads run with the
+    concurrency and timeout of inlining. Counters of saved and missed uploads
+    are kept for the worker to report.
+    """
+
+    def __init__(self, settings: Settings, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize media refetcher with settings."""
+        super().__init__(settings, http_client)
+        self.max_bytes = settings.media_refetch_max_bytes
+        self.job_budget = settings.media_refetch_job_budget
+        self.margin = settings.media_expiry_margin
+        self.saved = 0
+        self.missed = 0
+
+    def is_expiring(self, job: MediaUploadJobData, now: Optional[datetime] = None) -> bool:
+        """Check a URL job expires within the margin."""
+        if job.source != "url":
+            return False
+        expires_at = url_expires_at(job.sourceUrl)
+        if expires_at is None:
+            return False
+        now = now or datetime.now(timezone.utc)
+        return (expires_at - now).total_seconds() < self.margin
+
+    async def refetch(self, jobs: list[MediaUploadJobData]) -> list[MediaUploadJobData]:
+        """
+        Download the media of expiring URL jobs.
+
+        Args:
+            jobs: Upload jobs of one collector job
+
+        Returns:
+            The jobs, expiring media as source="buffer" where it could be downloaded
+        """
+        now = datetime.now(timezone.utc)
+        positions = [index for index, job in enumerate(jobs) if self.is_expiring(job, now)]
+        if not positions:
+            return jobs
+
+        refetched = await self.inline([jobs[index] for index in positions])
+        result = list(jobs)
+        for index, job in zip(positions, refetched):
+            result[index] = job
+
+        saved = sum(1 for job in refetched if job.source == "buffer")
+        self.saved += saved
+        self.missed += len(refetched) - saved
+        logger.info(
+            f"Refetched {saved} of {len(refetched)} media files with expiring URLs "
+            f"({self.saved} saved, {self.missed} missed since start)",
+        )
+        return result
+
+    def stats(self) -> dict[str, int]:
+        """Get the number of uploads saved and missed by refetching."""
+        return {"saved": self.saved, "missed": self.missed}
@@ -0,0 +1,55 @@
+"""In-process cache of Instagram profiles keyed by username."""
+
+import threading
+import time
+from typing import Optional
+
+import instaloader
+
+
+class ProfileCache:
+    """
+    Expiring username -> Profile cache shared by all jobs of the process.
+
+    Scrapes run in worker threads, so access is guarded by a lock. Expired
+    entries are dropped lazily on lookup and whenever a profile is stored.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize profile cache.
+
+        Args:
+            ttl: Seconds a profile stays cached, 0 disables caching
+        """
+        self.ttl = ttl
+        self._profiles: dict[str, tuple[float, instaloader.Profile]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(username: str) -> str:
+        """Normalize a username (Instagram usernames are case-insensitive)."""
+        return username.lower().lstrip("@")
+
+    def get(self, username: str) -> Optional[instaloader.Profile]:
+        """Get a cached profile, None if missing or expired."""
+        key = self._key(username)
+        with self._lock:
+            entry = self._profiles.get(key)
+            if entry is None:
+                return None
+            expires_at, profile = entry
+            if expires_at <= time.monotonic():
+                del self._profiles[key]
+                return None
+            return profile
+
+    def put(self, username: str, profile: instaloader.Profile) -> None:
+        """Cache a profile for the configured TTL."""
+        if self.ttl <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._profiles = {key: entry for key, entry in self._profiles.items() if entry[0] > now}
+            self._profiles[self._key(username)] = (now + self.ttl, profile)
@@ -1,17 +1,26 @@
 """Queue worker for processing Instagram fetch jobs."""
 
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Optional
 
-
-from bullmq import Job, Worker
+from bullmq import DelayedError, Job, Worker
+from redis.asyncio import Redis
 
 from src.config import Settings
-from src.models import CollectorJobData
+from src.models import CollectorJobData, FetchedPost, MediaUploadJobData
 from src.scraper.instagram_scraper import InstagramScraper
 from src.scraper.mappers import InstagramPostMapper
 from src.scraper.result_publisher import ResultPublisher
 from src.scraper.media_upload_publisher import MediaUploadPublisher
+from src.scraper.media_index import MediaIndex
+from src.scraper.media_inline import MediaInliner
+from src.scraper.media_probe import MediaProbe
+from src.scraper.media_refetch import MediaRefetcher
+from src.scraper.seen_index import SeenIndex
+from src.scraper.instagram_sessions import SessionsExhaustedError
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +34,38 @@ class InstagramQueueWorker:
         scraper: InstagramScraper,
         publisher: ResultPublisher,
         media_publisher: MediaUploadPublisher,
+        seen_index: Optional[SeenIndex] = None,
+        media_index: Optional[MediaIndex] = None,
+        media_probe: Optional[MediaProbe] = None,
+        media_inliner: Optional[MediaInliner] = None,
+        media_refetcher: Optional[MediaRefetcher] = None,
+        redis: Optional[Redis] = None,
     ):
         """Initialize queue worker."""
         self.settings = settings
         self.scraper = scraper
         self.publisher = publisher
         self.media_publisher = media_publisher
+        self.seen_index = seen_index
+        self.media_index = media_index
+        self.media_probe = media_probe
+        self.media_inliner = media_inliner
+        self.media_refetcher = media_refetcher
+        self.redis = redis
         self.worker: Worker | None = None
+        # instaloader is fully synchronous (the mapper may also trigger requests), so
+        # scraping runs in its own bounded thread pool to keep the event loop, and
+        # with it BullMQ lock renewal, responsive during slow fetches
+        self.scrape_concurrency = settings.instagram_scrape_concurrency
+        if self.scrape_concurrency < len(scraper.sessions.sessions):
+            logger.warning(
+                f"INSTAGRAM_SCRAPE_CONCURRENCY={self.scrape_concurrency} is below the "
+                f"{len(scraper.sessions.sessions)} loaded sessions, some will stay idle"
+            )
+        self.scrape_executor = ThreadPoolExecutor(
+            max_workers=self.scrape_concurrency,
+            thread_name_prefix="instagram-scrape",
+        )
 
     def start(self) -> None:
         """Start the queue worker."""
@@ -43,7 +77,7 @@ class InstagramQueueWorker:
             self.settings.instagram_fetcher_queue,
             self._process_job,
             {
-                "connection": self.settings.redis_url,
+                "connection": self.redis if self.redis is not None else self.settings.redis_url,
                 "concurrency": self.settings.worker_concurrency,
             },
         )
@@ -81,31 +115,25 @@ class InstagramQueueWorker:
                 f"(sourceId={job_data.sourceId}, limit={job_data.limit}, cursor={job_data.cursor})",
             )
 
-            # Fetch posts using scraper
-            posts, next_cursor = self.scraper.fetch_profile_posts(
-                username=job_data.externalId,
-                limit=job_data.limit,
-                cursor=job_data.cursor,
+            # Load posts already emitted for this source
+            seen_ids = None
+            if self.seen_index:
+                seen_ids = await self.seen_index.load(job_data.sourceId)
+
+            # Fetch and map posts in the scrape thread pool
+            loop = asyncio.get_running_loop()
+            fetched_posts, all_media_jobs, next_cursor = await loop.run_in_executor(
+                self.scrape_executor,
+                self._scrape,
+                job_data,
+                seen_ids,
             )
 
-            # Map posts to FetchedPost format and collect media upload jobs
-            fetched_posts = []
-            all_media_jobs = []
-
-            for post in posts:
-                fetched_post, media_jobs = InstagramPostMapper.to_fetched_post(
-                    post,
-                    source_id=job_data.sourceId,
-                )
-                fetched_posts.append(fetched_post)
-                all_media_jobs.extend(media_jobs)
-
-            # Queue media upload jobs in bulk
-            if all_media_jobs:
-                await self.media_publisher.publish_bulk(all_media_jobs)
-                logger.info(
-                    f"Queued {len(all_media_jobs)} media upload jobs for source {job_data.sourceId}",
-                )
+            all_media_jobs = await self._queue_media(
+                fetched_posts,
+                all_media_jobs,
+                job_data.sourceId,
+            )
 
             # Calculate processing time
             processing_time = int(
@@ -124,50 +152,187 @@ class InstagramQueueWorker:
                 priority=job_data.priority,
             )
 
+            # Only remember emitted posts once the result is safely published
+            if self.seen_index:
+                await self.seen_index.add(
+                    job_data.sourceId,
+                    [post.externalId for post in fetched_posts],
+                )
+
             logger.info(
                 f"Successfully processed job {job_id}: {len(fetched_posts)} posts, "
                 f"{len(all_media_jobs)} media files",
             )
 
-        except Exception as error:
+        except SessionsExhaustedError as error:
+            if not self._defer_expired(job, error):
+                # Not a failure: put the job back until a session has cooled down
+                logger.info(
+                    f"Deferring job {job_id} until {error.retry_at.isoformat()}: {error}",
+                )
+                await job.moveToDelayed(int(error.retry_at.timestamp() * 1000), token)
+                raise DelayedError() from error
+
+            # No session came back for too long: fail the job like any fetch error
             error_occurred = True
-            # Calculate processing time
-            processing_time = int(
-                (time.time() * 1000) - start_time,
+            error_instance = SessionsExhaustedError(
+                f"{error}; not deferred again, the job is older than "
+                f"{self.settings.instagram_max_defer:.0f}s",
+                retry_at=error.retry_at,
             )
+            await self._publish_failure(job, job_id, error_instance, start_time)
 
+        except Exception as error:
+            error_occurred = True
             error_instance = error if isinstance(error, Exception) else Exception(str(error))
+            await self._publish_failure(job, job_id, error_instance, start_time)
 
-            logger.error(
-                f"Failed to process job {job_id}: {error_instance}",
-                exc_info=True,
+        # Re-raise error after publishing result to trigger BullMQ retry mechanism
+        if error_occurred and error_instance:
+            raise error_instance
+
+    def _scrape(
+        self,
+        job_data: CollectorJobData,
+        seen_ids: Optional[AbstractSet[str]],
+    ) -> tuple[list[FetchedPost], list[MediaUploadJobData], Optional[str]]:
+        """
+        Fetch and map posts for a job on a pooled session. Blocking, runs in the
+        scrape thread pool.
+
+        Args:
+            job_data: Collector job data
+            seen_ids: Shortcodes already emitted for the source
+
+        Returns:
+            Tuple of (fetched posts, media upload jobs, next cursor)
+
+        Raises:
+            SessionsExhaustedError: Every session is cooling down
+        """
+        # Posts load lazily through the session that fetched them, so the mapping
+        # runs under the same lease
+        with self.scraper.sessions.lease() as session:
+            posts, next_cursor = self.scraper.fetch_profile_posts(
+                username=job_data.externalId,
+                limit=job_data.limit,
+                cursor=job_data.cursor,
+                seen_ids=seen_ids,
+                session=session,
             )
 
-            # Try to get job data for error reporting
-            try:
-                job_data = CollectorJobData.model_validate(
-                    job.data,
-                    from_attributes=True,
-                )
+            # Every post of the job belongs to the fetched profile, which the scraper
+            # just cached, so authors come from it instead of one request per post
+            owner = self.scraper.get_profile(job_data.externalId, session) if posts else None
+
+            # Map posts to FetchedPost format and collect media upload jobs. Mapping
+            # loads sidecar nodes, which are network calls too
+            fetched_posts = []
+            all_media_jobs = []
 
-                # Publish error result
-                await self.publisher.publish_error(
+            for post in posts:
+                fetched_post, media_jobs = InstagramPostMapper.to_fetched_post(
+                    post,
                     source_id=job_data.sourceId,
-                    source_type=job_data.sourceType,
-                    collector_job_id=job_id,
-                    orchestrator_job_id=job_data.metadata.orchestratorJobId,
-                    error=error_instance,
-                    processing_time=processing_time,
-                    priority=job_data.priority,
-                )
-            except Exception as parse_error:
-                logger.error(
-                    f"Failed to parse job data for error reporting: {parse_error}",
+                    owner=owner,
                 )
+                fetched_posts.append(fetched_post)
+                all_media_jobs.extend(media_jobs)
 
-        # Re-raise error after publishing result to trigger BullMQ retry mechanism
-        if error_occurred and error_instance:
-            raise error_instance
+        return fetched_posts, all_media_jobs, next_cursor
+
+    async def _queue_media(
+        self,
+        posts: list[FetchedPost],
+        media_jobs: list[MediaUploadJobData],
+        source_id: str,
+    ) -> list[MediaUploadJobData]:
+        """
+        Check, deduplicate, inline and refetch the media upload jobs of posts, then queue them.
+
+        Args:
+            posts: Posts whose mediaUrls follow the changes made to the jobs
+            media_jobs: Upload jobs of the posts' media
+            source_id: Source the posts belong to
+
+        Returns:
+            The upload jobs that were queued
+        """
+        # Drop dead, non-media and oversized files, fix guessed types and extensions
+        if self.media_probe and media_jobs:
+            media_jobs = await self.media_probe.check(posts, media_jobs)
+
+        # Media already uploaded or queued (for any post or source) keeps its key
+        if self.media_index:
+            media_jobs = await self.media_index.claim(posts, media_jobs)
+
+        # Ship small files inside their jobs, saving the media worker a download
+        if self.media_inliner and media_jobs:
+            media_jobs = await self.media_inliner.inline(media_jobs)
+
+        # Signed URLs that would expire while queued are downloaded now
+        if self.media_refetcher and media_jobs:
+            media_jobs = await self.media_refetcher.refetch(media_jobs)
+
+        # Queue media upload jobs in bulk
+        if media_jobs:
+            try:
+                await self.media_publisher.publish_bulk(media_jobs)
+            except Exception:
+                # Later posts must not resolve to uploads that were never queued
+                if self.media_index:
+                    await self.media_index.release(media_jobs)
+                raise
+            logger.info(
+                f"Queued {len(media_jobs)} media upload jobs for source {source_id}",
+            )
+
+        return media_jobs
+
+    def _defer_expired(self, job: Job, error: SessionsExhaustedError) -> bool:
+        """Check a deferred job would wait past INSTAGRAM_MAX_DEFER after its creation."""
+        deadline = job.timestamp / 1000 + self.settings.instagram_max_defer
+        return error.retry_at.timestamp() > deadline
+
+    async def _publish_failure(
+        self,
+        job: Job,
+        job_id: str,
+        error: Exception,
+        start_time: float,
+    ) -> None:
+        """Log a failed job and publish its error result."""
+        # Calculate processing time
+        processing_time = int(
+            (time.time() * 1000) - start_time,
+        )
+
+        logger.error(
+            f"Failed to process job {job_id}: {error}",
+            exc_info=True,
+        )
+
+        # Try to get job data for error reporting
+        try:
+            job_data = CollectorJobData.model_validate(
+                job.data,
+                from_attributes=True,
+            )
+
+            # Publish error result
+            await self.publisher.publish_error(
+                source_id=job_data.sourceId,
+                source_type=job_data.sourceType,
+                collector_job_id=job_id,
+                orchestrator_job_id=job_data.metadata.orchestratorJobId,
+                error=error,
+                processing_time=processing_time,
+                priority=job_data.priority,
+            )
+        except Exception as parse_error:
+            logger.error(
+                f"Failed to parse job data for error reporting: {parse_error}",
+            )
 
     async def stop(self) -> None:
         """Stop the queue worker gracefully."""
@@ -176,7 +341,21 @@ class InstagramQueueWorker:
         if self.worker:
             await self.worker.close()
 
+        # Jobs are done once the worker is closed, so no scrape is left running
+        self.scrape_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Closing the publisher flushes results still waiting in a batch
         await self.publisher.close()
         await self.media_publisher.close()
+        if self.seen_index:
+            await self.seen_index.close()
+        if self.media_index:
+            await self.media_index.close()
+        if self.media_probe:
+            await self.media_probe.close()
+        if self.media_inliner:
+            await self.media_inliner.close()
+        if self.media_refetcher:
+            await self.media_refetcher.close()
 
         logger.info("Instagram queue worker stopped")
@@ -0,0 +1,66 @@
+"""Optional compression of the posts array in result jobs."""
+
+import base64
+import gzip
+import json
+from typing import Any, Literal
+
+PostsEncoding = Literal["gzip", "zstd"]
+
+
+def check_codec(encoding: str) -> None:
+    """
+    Fail unless the package of an encoding is installed.
+
+    zstd needs the optional zstandard package (the zstd extra).
+    """
+    if encoding != "zstd":
+        return
+
+    try:
+        import zstandard  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError(
+            "RESULT_ENCODING=zstd requires the zstandard package (pip install zstandard)",
+        ) from e
+
+
+def _compress(data: bytes, encoding: PostsEncoding) -> bytes:
+    """Compress bytes with the given codec."""
+    if encoding == "gzip":
+        # Level 3 gets most of level 6's ratio on post text at about a third of the CPU
+        return gzip.compress(data, compresslevel=3, mtime=0)
+
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _decompress(data: bytes, encoding: PostsEncoding) -> bytes:
+    """Decompress bytes with the given codec."""
+    if encoding == "gzip":
+        return gzip.decompress(data)
+
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def encode_posts(posts: list[dict[str, Any]], encoding: PostsEncoding) -> str:
+    """
+    Serialize posts to JSON, compress and base64 encode them.
+
+    Args:
+        posts: Posts as JSON-compatible dicts (model_dump(mode="json") output)
+        encoding: Compression codec
+
+    Returns:
+        Base64 string to store in ResultJobData.postsEncoded
+    """
+    raw = json.dumps(posts, ensure_ascii=False, separators=(",", ":")).encode()
+    return base64.b64encode(_compress(raw, encoding)).decode("ascii")
+
+
+def decode_posts(data: str, encoding: PostsEncoding) -> list[dict[str, Any]]:
+    """Reverse encode_posts."""
+    return json.loads(_decompress(base64.b64decode(data), encoding))
@@ -7,3 +7,13 @@ import pytest
 def sample_username() -> str:
     """Return a sample Instagram username for testing."""
     return "test_user"
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Settings instance built from a minimal test environment."""
+    from src.config import Settings
+
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+
+    return Settings(_env_file=None)
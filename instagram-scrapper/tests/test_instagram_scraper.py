@@ -0,0 +1,95 @@
+"""Tests for incremental polling in the Instagram scraper."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import instaloader
+
+from src.scraper.instagram_scraper import InstagramScraper
+from src.scraper.instagram_sessions import InstagramSession
+from src.scraper.profile_cache import ProfileCache
+
+USERNAME = "test_user"
+
+
+def shortcode(mediaid: int) -> str:
+    """Encode a media ID as a shortcode, the reverse of Post.shortcode_to_mediaid."""
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    code = ""
+    while mediaid:
+        mediaid, digit = divmod(mediaid, 64)
+        code = alphabet[digit] + code
+    return code
+
+
+def make_scraper(settings, mediaids: list[int]) -> tuple[InstagramScraper, InstagramSession]:
+    """Create a scraper and a session whose cached profile lists posts newest first."""
+    posts = [SimpleNamespace(shortcode=shortcode(mediaid), mediaid=mediaid) for mediaid in mediaids]
+    session = InstagramSession(name="test", loader=MagicMock(), profile_cache=ProfileCache(60))
+    session.profile_cache.put(USERNAME, SimpleNamespace(get_posts=lambda: iter(posts)))
+    return InstagramScraper(settings), session
+
+
+def poll(scraper, session, **kwargs) -> tuple[list[int], str]:
+    """Fetch the profile and return the media IDs of the posts and the next cursor."""
+    posts, next_cursor = scraper.fetch_profile_posts(USERNAME, session=session, **kwargs)
+    return [post.mediaid for post in posts], next_cursor
+
+
+class TestIncrementalPolling:
+    """Test fetch_profile_posts across polls."""
+
+    def test_shortcode_helper_matches_instaloader(self):
+        """Test the test helper encodes media IDs the way instaloader decodes them."""
+        assert instaloader.Post.shortcode_to_mediaid(shortcode(3185212371249305473)) == (
+            3185212371249305473
+        )
+
+    def test_stops_at_cursor(self, settings):
+        """Test only posts newer than the cursor are returned."""
+        scraper, session = make_scraper(settings, list(range(1000, 900, -1)))
+
+        posts, next_cursor = poll(scraper, session, cursor=shortcode(997))
+
+        assert posts == [1000, 999, 998]
+        assert next_cursor == shortcode(1000)
+
+    def test_pinned_posts_are_not_an_end(self, settings):
+        """Test old pinned posts at the top do not end the poll."""
+        scraper, session = make_scraper(settings, [500, 600, 1000, 999, 998])
+
+        posts, next_cursor = poll(scraper, session, cursor=shortcode(998))
+
+        assert posts == [1000, 999]
+        assert next_cursor == shortcode(1000)
+
+    def test_cursor_is_honored_with_an_empty_seen_set(self, settings):
+        """Test a seen set that was never filled (or expired) does not re-emit old posts."""
+        scraper, session = make_scraper(settings, list(range(1000, 900, -1)))
+
+        posts, next_cursor = poll(scraper, session, cursor=shortcode(998), seen_ids=set())
+
+        assert posts == [1000, 999]
+        assert next_cursor == shortcode(1000)
+
+    def test_backlog_larger_than_limit_is_worked_off_across_polls(self, settings):
+        """Test a poll cut by the limit loses no post, with or without a seen set."""
+        for use_seen in (False, True):
+            scraper, session = make_scraper(settings, list(range(1100, 900, -1)))
+            seen_ids: set[str] = set()
+            emitted: list[int] = []
+            cursor = shortcode(1000)
+
+            for _ in range(10):
+                posts, cursor = poll(
+                    scraper,
+                    session,
+                    limit=12,
+                    cursor=cursor,
+                    seen_ids=seen_ids if use_seen else None,
+                )
+                emitted.extend(posts)
+                seen_ids.update(shortcode(mediaid) for mediaid in posts)
+
+            assert sorted(emitted) == list(range(1001, 1101))
+            assert cursor == shortcode(1100)
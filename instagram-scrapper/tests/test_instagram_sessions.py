@@ -0,0 +1,101 @@
+"""Tests for the Instagram session pool."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import instaloader
+import pytest
+
+from src.scraper.instagram_sessions import InstagramSession, SessionPool, SessionsExhaustedError
+from src.scraper.profile_cache import ProfileCache
+
+
+def make_pool(count: int, cooldown: float = 60) -> SessionPool:
+    """Create a pool of count sessions with mocked loaders."""
+    sessions = [
+        InstagramSession(name=f"session{i}", loader=MagicMock(), profile_cache=ProfileCache(0))
+        for i in range(count)
+    ]
+    return SessionPool(sessions, cooldown=cooldown)
+
+
+class TestSessionPool:
+    """Test SessionPool."""
+
+    def test_sessions_rotate_least_recently_used(self):
+        """Test consecutive leases go round the sessions."""
+        pool = make_pool(3)
+
+        names = []
+        for _ in range(6):
+            with pool.lease() as session:
+                names.append(session.name)
+
+        assert names == ["session0", "session1", "session2"] * 2
+
+    def test_rate_limited_session_cools_down(self):
+        """Test a session that hit a 429 is skipped until its cooldown ends."""
+        pool = make_pool(2)
+
+        with pytest.raises(instaloader.exceptions.TooManyRequestsException):
+            with pool.lease() as session:
+                assert session.name == "session0"
+                raise instaloader.exceptions.TooManyRequestsException("429 Too Many Requests")
+
+        for _ in range(3):
+            with pool.lease() as session:
+                assert session.name == "session1"
+
+    def test_other_errors_do_not_cool_down(self):
+        """Test errors unrelated to rate limits keep the session usable."""
+        pool = make_pool(1)
+
+        with pytest.raises(instaloader.exceptions.ProfileNotExistsException):
+            with pool.lease():
+                raise instaloader.exceptions.ProfileNotExistsException("no such profile")
+
+        with pool.lease() as session:
+            assert session.name == "session0"
+
+    def test_all_sessions_cooling_down_raises(self):
+        """Test leasing fails with a retry time when every session cools down."""
+        pool = make_pool(1, cooldown=120)
+
+        with pytest.raises(instaloader.exceptions.ConnectionException):
+            with pool.lease():
+                raise instaloader.exceptions.ConnectionException("401 Unauthorized")
+
+        with pytest.raises(SessionsExhaustedError) as exc_info:
+            with pool.lease():
+                pass
+
+        assert exc_info.value.retry_at is not None
+
+    def test_parallel_fetches_across_sessions(self):
+        """Test scrapes run in parallel, one per session, and wait for a free one."""
+        pool = make_pool(2)
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def scrape() -> None:
+            nonlocal active, max_active
+            with pool.lease():
+                with lock:
+                    active += 1
+                    max_active = max(max_active, active)
+                time.sleep(0.1)
+                with lock:
+                    active -= 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(scrape) for _ in range(4)]:
+                future.result()
+        elapsed = time.perf_counter() - started
+
+        assert max_active == 2
+        # Two rounds of two parallel scrapes
+        assert 0.2 <= elapsed < 0.35
@@ -0,0 +1,101 @@
+"""Tests for signed media URL expiry and the refetch of expiring media."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.models import MediaUploadJobData
+from src.scraper.media_expiry import PRIORITY_MAX, expiry_priority, url_expires_at
+from src.scraper.media_refetch import MediaRefetcher
+from src.scraper.media_upload_publisher import job_options, with_expiry
+
+CDN_URL = "https://scontent.cdninstagram.com/v/t51.2885-15/123_n.jpg"
+
+
+def signed_url(expires_in: int) -> str:
+    """Build a CDN URL that expires in the given number of seconds."""
+    return f"{CDN_URL}?stp=dst-jpg_e35&oh=00_abc&oe={int(time.time()) + expires_in:X}"
+
+
+def make_job(url: str, index: int = 1) -> MediaUploadJobData:
+    """Create an upload job for a media URL."""
+    return MediaUploadJobData(
+        sourceType="instagram",
+        sourceId="src-1",
+        postExternalId="CxY2Ab3pQ",
+        mediaIndex=index,
+        targetPath=f"instagram/src-1/CxY2Ab3pQ/{index}.jpg",
+        contentType="image/jpeg",
+        source="url",
+        sourceUrl=url,
+    )
+
+
+class TestUrlExpiry:
+    """Test url_expires_at and expiry_priority."""
+
+    def test_oe_is_a_hex_unix_timestamp(self):
+        """Test the expiry is read from the signed URL."""
+        assert url_expires_at(f"{CDN_URL}?oh=00_abc&oe=6750A1B2") == datetime.fromtimestamp(
+            0x6750A1B2,
+            tz=timezone.utc,
+        )
+        assert url_expires_at(CDN_URL) is None
+        assert url_expires_at(f"{CDN_URL}?oe=not-hex") is None
+
+    def test_sooner_expiry_runs_first(self):
+        """Test priorities follow the remaining lifetime, unexpiring uploads last."""
+        now = datetime.now(timezone.utc)
+
+        soon = expiry_priority(now + timedelta(minutes=5), now)
+        later = expiry_priority(now + timedelta(days=2), now)
+
+        assert 1 <= soon < later < PRIORITY_MAX
+        assert expiry_priority(now - timedelta(minutes=5), now) == 1
+        assert expiry_priority(None, now) == PRIORITY_MAX
+
+    def test_publisher_sets_deadline_and_priority(self):
+        """Test URL jobs carry their expiry and buffer jobs run last."""
+        job = with_expiry(make_job(signed_url(600)))
+        inlined = with_expiry(job.model_copy(update={"source": "buffer", "buffer": "eA=="}))
+
+        assert job.model_dump(mode="json", by_alias=True)["expiresAt"] is not None
+        assert job_options(job, 3600)["priority"] < PRIORITY_MAX
+        assert job_options(inlined, 3600)["priority"] == PRIORITY_MAX
+
+
+class TestMediaRefetcher:
+    """Test MediaRefetcher."""
+
+    @pytest.mark.asyncio
+    async def test_only_expiring_urls_are_downloaded(self, settings):
+        """Test URLs expiring within the margin become buffer jobs and are counted."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(str(request.url))
+            if request.url.params.get("oh") == "00_dead":
+                return httpx.Response(403)
+            return httpx.Response(200, headers={"Content-Type": "image/jpeg"}, content=b"x" * 10)
+
+        settings.media_expiry_margin = 900
+        refetcher = MediaRefetcher(
+            settings,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        jobs = [
+            make_job(signed_url(300), 1),
+            make_job(signed_url(3 * 24 * 3600), 2),
+            make_job(signed_url(60).replace("oh=00_abc", "oh=00_dead"), 3),
+            make_job(CDN_URL, 4),
+        ]
+
+        refetched = await refetcher.refetch(jobs)
+        await refetcher.close()
+
+        assert [job.source for job in refetched] == ["buffer", "url", "url", "url"]
+        assert refetched[1:] == jobs[1:]
+        assert len(requests) == 2
+        assert refetcher.stats() == {"saved": 1, "missed": 1}
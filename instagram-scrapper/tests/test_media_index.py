@@ -0,0 +1,81 @@
+"""Tests for the media dedup index."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models import FetchedPost, MediaUploadJobData, PostAuthor
+from src.scraper.media_index import MediaIndex, normalize_media_url
+
+CDN_PATH = "/v/t51.2885-15/123_456_n.jpg"
+
+
+class TestNormalizeMediaUrl:
+    """Test normalize_media_url."""
+
+    def test_signed_cdn_urls_of_one_file_match(self):
+        """Test edge host, signature and cache parameters are ignored."""
+        first = normalize_media_url(
+            f"https://scontent-ams2-1.cdninstagram.com{CDN_PATH}"
+            "?stp=dst-jpg_e35&_nc_ht=scontent-ams2-1&_nc_cat=1&oh=00_abc&oe=6750A1B2",
+        )
+        second = normalize_media_url(
+            f"https://instagram.fxyz1-1.fna.fbcdn.net{CDN_PATH}"
+            "?_nc_cat=2&stp=dst-jpg_e35&oe=6751C3D4&oh=00_def",
+        )
+
+        assert first == second
+
+    def test_renditions_stay_apart(self):
+        """Test the rendition parameter still tells files apart."""
+        assert normalize_media_url(
+            f"https://scontent.cdninstagram.com{CDN_PATH}?stp=dst-jpg_s150x150",
+        ) != normalize_media_url(f"https://scontent.cdninstagram.com{CDN_PATH}?stp=dst-jpg_e35")
+
+
+class TestMediaIndex:
+    """Test MediaIndex."""
+
+    @pytest.mark.asyncio
+    async def test_known_urls_resolve_to_existing_keys(self, settings):
+        """Test a file queued for an earlier post is not queued again."""
+        store: dict[str, str] = {}
+
+        async def claim(keys, args):
+            result = [store.get(key) for key in keys]
+            for key, target in zip(keys, args[1:]):
+                store.setdefault(key, target)
+            return result
+
+        redis = MagicMock()
+        redis.register_script = MagicMock(side_effect=[AsyncMock(side_effect=claim), AsyncMock()])
+        index = MediaIndex(settings, redis)
+
+        def make_post(shortcode: str, oh: str) -> tuple[FetchedPost, list[MediaUploadJobData]]:
+            job = MediaUploadJobData(
+                sourceType="instagram",
+                sourceId="src-1",
+                postExternalId=shortcode,
+                mediaIndex=1,
+                targetPath=f"instagram/src-1/{shortcode}/1.jpg",
+                contentType="image/jpeg",
+                source="url",
+                sourceUrl=f"https://scontent.cdninstagram.com{CDN_PATH}?oh={oh}",
+            )
+            post = FetchedPost(
+                externalId=shortcode,
+                content="",
+                mediaUrls=[job.targetPath],
+                publishedAt="2025-12-01T00:00:00+00:00",
+                author=PostAuthor(username="someone", displayName="Someone"),
+            )
+            return post, [job]
+
+        first, first_jobs = make_post("ABC", "00_abc")
+        second, second_jobs = make_post("DEF", "00_def")
+
+        (claimed,) = await index.claim([first], first_jobs)
+        assert claimed.targetPath == first_jobs[0].targetPath
+        assert store == {claimed.mediaIndexKey: claimed.targetPath}
+        assert await index.claim([second], second_jobs) == []
+        assert second.mediaUrls == ["instagram/src-1/ABC/1.jpg"]
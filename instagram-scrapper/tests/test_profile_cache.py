@@ -0,0 +1,54 @@
+"""Tests for the Instagram profile cache."""
+
+from unittest.mock import MagicMock, patch
+
+from src.scraper.instagram_scraper import InstagramScraper
+from src.scraper.profile_cache import ProfileCache
+
+
+class TestProfileCache:
+    """Test ProfileCache."""
+
+    def test_get_returns_cached_profile(self):
+        """Test a stored profile is returned for the same username."""
+        cache = ProfileCache(ttl=60)
+        profile = MagicMock()
+
+        cache.put("Someone", profile)
+
+        assert cache.get("someone") is profile
+        assert cache.get("@SOMEONE") is profile
+        assert cache.get("other") is None
+
+    def test_expired_profile_is_dropped(self):
+        """Test profiles are not returned once their TTL has passed."""
+        cache = ProfileCache(ttl=60)
+        cache.put("someone", MagicMock())
+
+        with patch("src.scraper.profile_cache.time.monotonic", return_value=1e12):
+            assert cache.get("someone") is None
+
+    def test_zero_ttl_disables_cache(self):
+        """Test nothing is cached with a TTL of 0."""
+        cache = ProfileCache(ttl=0)
+        cache.put("someone", MagicMock())
+
+        assert cache.get("someone") is None
+
+
+class TestScraperProfileLookup:
+    """Profiles are loaded once and reused across lookups."""
+
+    def test_get_profile_loads_profile_once(self, settings):
+        """Test repeated lookups for a username make a single profile request."""
+        scraper = InstagramScraper(settings)
+        profile = MagicMock()
+
+        with patch(
+            "src.scraper.instagram_scraper.instaloader.Profile.from_username",
+            return_value=profile,
+        ) as from_username:
+            for _ in range(50):
+                assert scraper.get_profile("someone") is profile
+
+        from_username.assert_called_once()
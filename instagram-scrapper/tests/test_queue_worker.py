@@ -0,0 +1,145 @@
+"""Tests for the Instagram queue worker."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bullmq import DelayedError
+from bullmq.lock_manager import LockManager
+
+from src.scraper.instagram_sessions import SessionsExhaustedError
+from src.scraper.queue_worker import InstagramQueueWorker
+
+
+def make_job(job_id: str, username: str) -> SimpleNamespace:
+    """Build a minimal BullMQ-like job for a collector request."""
+    return SimpleNamespace(
+        id=job_id,
+        timestamp=int(time.time() * 1000),
+        data={
+            "sourceId": f"src-{job_id}",
+            "sourceType": "instagram",
+            "externalId": username,
+            "priority": 1,
+            "metadata": {
+                "orchestratorJobId": "orch-1",
+                "scheduledAt": datetime.now(timezone.utc).isoformat(),
+                "sourceMetadata": {},
+            },
+        },
+    )
+
+
+def make_worker(settings, fetch_delay: float) -> InstagramQueueWorker:
+    """Create a worker whose scraper blocks for fetch_delay seconds."""
+
+    def fetch_profile_posts(**kwargs):
+        time.sleep(fetch_delay)
+        return [], None
+
+    scraper = MagicMock()
+    scraper.fetch_profile_posts = MagicMock(side_effect=fetch_profile_posts)
+    publisher = MagicMock()
+    publisher.publish_success = AsyncMock()
+    publisher.publish_error = AsyncMock()
+    publisher.close = AsyncMock()
+    media_publisher = MagicMock()
+    media_publisher.publish_bulk = AsyncMock(return_value=[])
+    media_publisher.close = AsyncMock()
+
+    return InstagramQueueWorker(settings, scraper, publisher, media_publisher)
+
+
+class TestScrapeExecutor:
+    """Blocking instaloader calls must not stall the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_lock_renewal_continues_during_slow_fetch(self, settings):
+        """BullMQ keeps renewing the job lock while a fetch blocks its thread."""
+        worker = make_worker(settings, fetch_delay=0.6)
+
+        # BullMQ's own renewal loop, renewing every 50ms against a mocked backend
+        bullmq_worker = SimpleNamespace(
+            backend=SimpleNamespace(extendLocks=AsyncMock(return_value=[])),
+            emit=MagicMock(),
+        )
+        lock_manager = LockManager(
+            bullmq_worker,
+            lock_renew_time=100,
+            lock_duration=200,
+            worker_id="test",
+        )
+        lock_manager.start()
+        lock_manager.track_job("1", "token", int(time.time() * 1000))
+
+        await worker._process_job(make_job("1", "someone"), "token")
+        await lock_manager.close()
+        await worker.stop()
+
+        assert worker.publisher.publish_success.await_count == 1
+        # About one renewal every 50ms over the 600ms fetch
+        assert bullmq_worker.backend.extendLocks.await_count >= 5
+
+    @pytest.mark.asyncio
+    async def test_scrape_concurrency_is_bounded(self, settings):
+        """Jobs beyond the scrape concurrency wait for a free scrape thread."""
+        settings.instagram_scrape_concurrency = 2
+        worker = make_worker(settings, fetch_delay=0.2)
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(worker._process_job(make_job(str(i), f"user{i}"), "token") for i in range(4)),
+        )
+        elapsed = time.perf_counter() - started
+        await worker.stop()
+
+        assert worker.publisher.publish_success.await_count == 4
+        # Two rounds of two parallel fetches
+        assert 0.4 <= elapsed < 0.7
+
+
+class TestJobDeferral:
+    """Jobs are deferred while every session cools down, up to INSTAGRAM_MAX_DEFER."""
+
+    @staticmethod
+    def make_exhausted_worker(settings) -> InstagramQueueWorker:
+        """Create a worker whose sessions are all cooling down for five more minutes."""
+        worker = make_worker(settings, fetch_delay=0)
+        worker.scraper.sessions.lease.side_effect = SessionsExhaustedError(
+            "All sessions are cooling down",
+            retry_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+        )
+        return worker
+
+    @pytest.mark.asyncio
+    async def test_exhausted_sessions_defer_job(self, settings):
+        """Test a young job is moved to delayed until a session has cooled down."""
+        worker = self.make_exhausted_worker(settings)
+        job = make_job("1", "someone")
+        job.moveToDelayed = AsyncMock()
+
+        with pytest.raises(DelayedError):
+            await worker._process_job(job, "token")
+        await worker.stop()
+
+        job.moveToDelayed.assert_awaited_once()
+        worker.publisher.publish_error.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_job_past_max_defer_fails_instead(self, settings):
+        """Test a job still without a session INSTAGRAM_MAX_DEFER after its creation fails."""
+        settings.instagram_max_defer = 3600
+        worker = self.make_exhausted_worker(settings)
+        job = make_job("1", "someone")
+        job.timestamp -= 3590 * 1000
+        job.moveToDelayed = AsyncMock()
+
+        with pytest.raises(SessionsExhaustedError):
+            await worker._process_job(job, "token")
+        await worker.stop()
+
+        job.moveToDelayed.assert_not_awaited()
+        worker.publisher.publish_error.assert_awaited_once()
@@ -0,0 +1,139 @@
+"""
+Benchmark feed parsing per entry: feedparser against the fast path.
+
+The feedparser column is what RSS_PARSER_MODE=feedparser does for a fetched
+body (feedparser.parse, then RssScraper._parse_entry on every entry); the fast
+column is parse_feed_document (RSS_PARSER_MODE=fast).
+
+Usage:
+    python -m scripts.bench_feed_parser [feed.xml|feed.json ...]
+
+Without arguments built-in RSS 2.0, Atom and JSON Feed documents of 50
+WordPress-style entries are used.
+"""
+
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+import feedparser
+
+from src.config import Settings
+from src.scraper.fast_parser import parse_feed_document
+from src.scraper.rss_scraper import RssScraper
+
+FEED_URL = "https://example.com/feed"
+ENTRIES = 50
+CONTENT = (
+    "<p>The <a href='https://example.com/story?id=1&amp;ref=rss'>city council</a> voted on "
+    "<strong>Tuesday</strong>. " + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    + "</p><figure><img src='https://example.com/photo.jpg' /></figure>"
+)
+
+
+def rss_document() -> bytes:
+    """RSS 2.0 document with content:encoded, categories and an enclosure per item."""
+    items = "".join(
+        f"<item><title>Article {i}</title><link>https://example.com/{i}</link>"
+        f"<guid isPermaLink='false'>post-{i}</guid>"
+        "<pubDate>Mon, 01 Dec 2025 10:00:00 GMT</pubDate><dc:creator>Jane Doe</dc:creator>"
+        "<category>News</category><category>City</category>"
+        f"<description>Summary of article {i}</description>"
+        f"<content:encoded><![CDATA[{CONTENT}]]></content:encoded>"
+        f"<enclosure url='https://example.com/{i}.jpg' type='image/jpeg' length='1000'/></item>"
+        for i in range(ENTRIES)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/"><channel><title>Bench</title>'
+        f"<link>https://example.com</link><description>Bench feed</description>{items}"
+        "</channel></rss>"
+    ).encode()
+
+
+def atom_document() -> bytes:
+    """Atom document with HTML content per entry."""
+    escaped = CONTENT.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    entries = "".join(
+        f"<entry><title>Article {i}</title><link href='https://example.com/{i}'/>"
+        f"<id>urn:post:{i}</id><published>2025-12-01T10:00:00Z</published>"
+        "<author><name>Jane Doe</name></author><category term='News'/>"
+        f"<content type='html'>{escaped}</content></entry>"
+        for i in range(ENTRIES)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Bench</title><link href='https://example.com'/><id>urn:bench</id>{entries}"
+        "</feed>"
+    ).encode()
+
+
+def json_feed_document() -> bytes:
+    """JSON Feed 1.1 document."""
+    return json.dumps(
+        {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": "Bench",
+            "home_page_url": "https://example.com",
+            "items": [
+                {
+                    "id": f"post-{i}",
+                    "url": f"https://example.com/{i}",
+                    "title": f"Article {i}",
+                    "content_html": CONTENT,
+                    "date_published": "2025-12-01T10:00:00Z",
+                    "authors": [{"name": "Jane Doe"}],
+                    "tags": ["News", "City"],
+                    "attachments": [
+                        {"url": f"https://example.com/{i}.jpg", "mime_type": "image/jpeg"},
+                    ],
+                }
+                for i in range(ENTRIES)
+            ],
+        },
+    ).encode()
+
+
+def bench(func: Callable[[], object], number: int = 20) -> float:
+    """Best time of several runs, in seconds per call."""
+    return min(timeit.Timer(func).repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    """Run the benchmark."""
+    os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
+    scraper = RssScraper(Settings(_env_file=None))
+
+    if len(sys.argv) > 1:
+        documents = {Path(path).name: Path(path).read_bytes() for path in sys.argv[1:]}
+    else:
+        documents = {
+            "rss": rss_document(),
+            "atom": atom_document(),
+            "json feed": json_feed_document(),
+        }
+
+    for name, body in documents.items():
+        _, entries = parse_feed_document(FEED_URL, body)
+        count = len(entries) or 1
+
+        def with_feedparser() -> None:
+            parsed = feedparser.parse(body)
+            scraper._extract_feed_info(parsed.feed, FEED_URL)
+            for entry in parsed.entries:
+                scraper._parse_entry(entry)
+
+        slow = bench(with_feedparser) / count
+        fast = bench(lambda: parse_feed_document(FEED_URL, body)) / count
+        print(
+            f"{name:<12} {len(entries):4d} entries  feedparser {slow * 1e6:8.1f} us/entry  "
+            f"fast {fast * 1e6:7.1f} us/entry  ({slow / fast:.1f}x)",
+        )
+
+
+if __name__ == "__main__":
+    main()
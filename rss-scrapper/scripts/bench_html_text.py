@@ -0,0 +1,118 @@
+"""
+Micro-benchmark for HTML to text conversion.
+
+Compares the shared strip_html_tags against the previous multi-pass
+implementation on long content:encoded bodies.
+
+Usage:
+    python -m scripts.bench_html_text [feed.xml ...]
+
+Without arguments a built-in WordPress-style article is used. Given feed
+files, the content of every entry is used as the corpus.
+"""
+
+import html
+import re
+import sys
+import timeit
+from pathlib import Path
+
+import feedparser
+
+from src.scraper.html_text import strip_html_tags
+
+PROSE = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud "
+    "exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. "
+) * 3
+
+SECTION = (
+    '<p>The <a href="https://example.com/story?id=1&amp;ref=rss" rel="noopener">'
+    "city council</a> "
+    f"voted on <strong>Tuesday</strong> &mdash; {PROSE} "
+    "&ldquo;We are pleased,&rdquo; she said.</p>\n"
+    '<figure class="wp-block-image size-large"><img src="https://example.com/photo.jpg" '
+    'alt="Council chamber" width="1024" height="683" />'
+    "<figcaption>Photo: Staff photographer</figcaption></figure>\n"
+    f"<h2>Background</h2>\n<p>{PROSE}<br />\n{PROSE}</p>\n"
+    "<ul>\n<li>Schools &amp; libraries</li>\n<li>Roads</li>\n<li>Parks</li>\n</ul>\n"
+)
+
+BUILTIN_CORPUS = [SECTION * 20]
+
+
+def legacy_strip_html_tags_single_line(text: str) -> str:
+    """Previous implementation from rss_scraper.py, kept for comparison."""
+    if not text:
+        return ""
+    clean = re.sub(r"<[^>]+>", "", text)
+    clean = html.unescape(clean)
+    clean = re.sub(r"\s+", " ", clean).strip()
+    return clean
+
+
+def legacy_strip_html_tags(text: str) -> str:
+    """Previous implementation from mappers.py, kept for comparison."""
+    if not text:
+        return ""
+    clean = re.sub(r"<[^>]+>", "", text)
+    clean = html.unescape(clean)
+    clean = re.sub(r"[ \t]+", " ", clean)
+    clean = re.sub(r"\n\s*\n", "\n\n", clean)
+    lines = [line.strip() for line in clean.split("\n")]
+    clean = "\n".join(lines)
+    return clean.strip()
+
+
+def load_corpus(paths: list[str]) -> list[str]:
+    """Load entry bodies from feed files."""
+    corpus = []
+    for path in paths:
+        parsed = feedparser.parse(Path(path).read_bytes())
+        for entry in parsed.entries:
+            if entry.get("content"):
+                corpus.append(entry.content[0].get("value", ""))
+            elif entry.get("summary"):
+                corpus.append(entry.summary)
+    return corpus
+
+
+def bench(func, corpus: list[str], number: int = 50) -> float:
+    """Best time of several runs, in seconds per pass over the corpus."""
+    timer = timeit.Timer(lambda: [func(body) for body in corpus])
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    """Run the benchmark."""
+    corpus = load_corpus(sys.argv[1:]) if len(sys.argv) > 1 else BUILTIN_CORPUS
+    if not corpus:
+        print("No entry content found in the given feeds")
+        return
+
+    size = sum(len(body) for body in corpus)
+    print(f"Corpus: {len(corpus)} bodies, {size / 1024:.1f} KiB")
+
+    results = [
+        (
+            "single line",
+            bench(legacy_strip_html_tags_single_line, corpus),
+            bench(strip_html_tags, corpus),
+        ),
+        (
+            "keep paragraphs",
+            bench(legacy_strip_html_tags, corpus),
+            bench(lambda body: strip_html_tags(body, keep_paragraphs=True), corpus),
+        ),
+    ]
+
+    for name, legacy, shared in results:
+        print(
+            f"{name:<16} legacy {legacy * 1000:8.2f} ms  shared {shared * 1000:8.2f} ms  "
+            f"({legacy / shared:.1f}x)",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Benchmark the feed HTTP client against a local stand-in feed server.
+
+Runs the same batch of fetches with httpx's default client (what the scraper
+used before pool tuning) and with the client RssScraper builds from settings,
+and reports the connections opened (one TCP/TLS handshake each) and request
+latency percentiles. The stand-in server delays the first response on every
+new connection to stand in for the round trips of a TLS handshake.
+
+Usage:
+    python -m scripts.bench_http_client [--fetches 1000] [--concurrency 20]
+
+Fetches run in waves separated by a pause, like polls of the scheduler, so
+keep-alive connections have to survive idle gaps (--waves 1 disables them).
+The stand-in server speaks HTTP/1.1 only, so RSS_HTTP2 is measured with --url
+against a real https feed host.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import time
+from typing import Optional
+
+import httpx
+
+from src.config import Settings
+from src.scraper.rss_scraper import RssScraper
+
+
+def feed_body(items: int = 20) -> bytes:
+    """RSS feed of the given number of items."""
+    entries = "".join(
+        f"<item><title>Article {i}</title><link>https://example.com/{i}</link>"
+        f"<guid>https://example.com/{i}</guid><description>{'Lorem ipsum. ' * 40}"
+        "</description></item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        f"<title>Bench</title><link>https://example.com</link>{entries}</channel></rss>"
+    ).encode()
+
+
+class FeedServer:
+    """Minimal HTTP/1.1 keep-alive server serving one feed on every path."""
+
+    def __init__(self, latency: float, handshake: float, connections: "multiprocessing.Value"):
+        self.body = feed_body()
+        self.latency = latency
+        self.handshake = handshake
+        self.connections = connections
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it."""
+        with self.connections.get_lock():
+            self.connections.value += 1
+        await asyncio.sleep(self.handshake)
+        head = (
+            "HTTP/1.1 200 OK\r\nContent-Type: application/rss+xml\r\n"
+            f"Content-Length: {len(self.body)}\r\n\r\n"
+        ).encode()
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(self.latency)
+                writer.write(head + self.body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def serve(
+    latency: float,
+    handshake: float,
+    connections: "multiprocessing.Value",
+    port: "multiprocessing.Value",
+) -> None:
+    """Run the stand-in server until the process is terminated."""
+
+    async def main() -> None:
+        server = FeedServer(latency, handshake, connections)
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port.value = listener.sockets[0].getsockname()[1]
+        await listener.serve_forever()
+
+    asyncio.run(main())
+
+
+def make_settings() -> Settings:
+    """Settings from the environment, with a placeholder Redis URL."""
+    os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
+    return Settings(_env_file=None)
+
+
+async def run(
+    client: httpx.AsyncClient,
+    base_url: str,
+    fetches: int,
+    concurrency: int,
+    waves: int,
+    pause: float,
+) -> list[float]:
+    """Fetch fetches feed URLs, concurrency at a time, and return the latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def fetch(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(base_url.format(index=index))
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    per_wave = fetches // waves
+    for wave in range(waves):
+        if wave:
+            await asyncio.sleep(pause)
+        await asyncio.gather(*(fetch(wave * per_wave + i) for i in range(per_wave)))
+    return latencies
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Value below which the given fraction of values falls."""
+    return statistics.quantiles(values, n=100)[int(fraction * 100) - 1]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run every client configuration and print the results."""
+    server: Optional[multiprocessing.Process] = None
+    # Connections accepted by the stand-in server
+    connections = multiprocessing.Value("i", 0)
+    if args.url:
+        base_url = args.url
+    else:
+        # Its own process, so serving does not compete with the client for the GIL
+        port = multiprocessing.Value("i", 0)
+        server = multiprocessing.Process(
+            target=serve,
+            args=(args.latency_ms / 1000, args.handshake_ms / 1000, connections, port),
+            daemon=True,
+        )
+        server.start()
+        while not port.value:
+            await asyncio.sleep(0.05)
+        # Every feed on one host, like feeds behind a shared CDN
+        base_url = f"http://localhost:{port.value}/feeds/{{index}}.xml"
+
+    scraper = RssScraper(make_settings())
+    clients = {
+        "httpx defaults": httpx.AsyncClient(timeout=30),
+        "tuned": scraper.http_client,
+    }
+
+    print(f"{args.fetches} fetches, concurrency {args.concurrency}, {args.waves} wave(s)")
+    for name, client in clients.items():
+        connections.value = 0
+        latencies = await run(
+            client, base_url, args.fetches, args.concurrency, args.waves, args.pause
+        )
+        line = (
+            f"  {name:<15} p50 {percentile(latencies, 0.5) * 1000:7.1f} ms"
+            f"  p95 {percentile(latencies, 0.95) * 1000:7.1f} ms"
+        )
+        if server is not None:
+            line += f"  handshakes {connections.value:5d}"
+        if client is scraper.http_client:
+            stats = scraper.connection_stats()
+            line += (
+                f"  (client: {stats.connections} connections, {stats.reused} reused, "
+                f"{stats.dns_lookups} DNS lookups)"
+            )
+        print(line)
+        await client.aclose()
+
+    if server is not None:
+        server.terminate()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fetches", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--waves", type=int, default=2, help="Split fetches into waves")
+    parser.add_argument("--pause", type=float, default=6.0, help="Seconds between waves")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Server time per request")
+    parser.add_argument(
+        "--handshake-ms",
+        type=float,
+        default=30.0,
+        help="Server delay on every new connection",
+    )
+    parser.add_argument("--url", help="Fetch this URL ({index} is replaced) instead")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
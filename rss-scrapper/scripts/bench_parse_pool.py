@@ -0,0 +1,100 @@
+"""
+Benchmark feed parsing throughput with and without the parse process pool.
+
+Parses the same batch of bodies concurrently, like WORKER_CONCURRENCY jobs
+would, once in the event loop process (RSS_PARSE_PROCESSES=0) and then with a
+ParsePool of 1, 2, 4, ... processes up to the core count, and reports feeds
+parsed per second and the longest the event loop was blocked (how late other
+jobs' network I/O would have been served).
+
+Usage:
+    python -m scripts.bench_parse_pool [--feeds 200] [--parser-mode feedparser]
+        [--processes 1 2 4]
+
+The default feedparser mode is the CPU-heavy case the pool is for; the fast
+mode parses 15-25x cheaper, so it needs much larger feeds to gain from it.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from scripts.bench_feed_parser import atom_document, rss_document
+from src.scraper.parse_pool import ParsePool
+from src.scraper.rss_scraper import parse_feed_body
+
+FEED_URL = "https://example.com/feed"
+
+
+async def run(
+    bodies: list[bytes],
+    parser_mode: str,
+    pool: ParsePool | None,
+) -> tuple[float, float]:
+    """Parse every body, all at once, and return feeds per second and the longest loop stall."""
+    stall = 0.0
+
+    async def watch_loop() -> None:
+        nonlocal stall
+        while True:
+            ticked = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - ticked - 0.001)
+
+    async def parse(body: bytes) -> None:
+        # Jobs reach their parse step one at a time, after awaiting their download
+        await asyncio.sleep(0)
+        if pool is None:
+            parse_feed_body(FEED_URL, body, "utf-8", parser_mode)
+        else:
+            await pool.parse(FEED_URL, body, "utf-8", parser_mode)
+
+    watcher = asyncio.create_task(watch_loop())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(parse(body) for body in bodies))
+    elapsed = time.perf_counter() - started
+    # Let the watcher see the last stall before stopping it
+    await asyncio.sleep(0.002)
+    watcher.cancel()
+    return len(bodies) / elapsed, stall
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run every pool size and print the results."""
+    documents = [rss_document(), atom_document()]
+    bodies = [documents[i % len(documents)] for i in range(args.feeds)]
+    cores = os.cpu_count() or 1
+    processes = args.processes or [n for n in (1, 2, 4, 8, 16, 32) if n <= cores]
+
+    print(
+        f"{args.feeds} feeds of {len(bodies[0]) // 1024} KiB, "
+        f"{args.parser_mode} mode, {cores} cores",
+    )
+    inline, stall = await run(bodies, args.parser_mode, None)
+    print(f"  in process     {inline:8.1f} feeds/s  max loop stall {stall * 1000:7.1f} ms")
+
+    for count in processes:
+        pool = ParsePool(count)
+        # Start the workers (and their imports) outside of the measurement
+        await asyncio.gather(*(run(bodies[:1], args.parser_mode, pool) for _ in range(count)))
+        rate, stall = await run(bodies, args.parser_mode, pool)
+        pool.close()
+        print(
+            f"  {count:2d} processes   {rate:8.1f} feeds/s  max loop stall {stall * 1000:7.1f} ms"
+            f"  ({rate / inline:.2f}x)",
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--feeds", type=int, default=200)
+    parser.add_argument("--parser-mode", default="feedparser", choices=["feedparser", "fast"])
+    parser.add_argument("--processes", type=int, nargs="*", help="Pool sizes to measure")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
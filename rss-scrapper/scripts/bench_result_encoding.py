@@ -0,0 +1,212 @@
+"""
+Benchmark result job encodings.
+
+Builds realistic RSS, Twitter and Instagram result batches and reports, per
+encoding, the size of the job data BullMQ stores in Redis and the time spent
+serializing it.
+
+Usage:
+    python -m scripts.bench_result_encoding [--redis-url redis://localhost:6379]
+
+With --redis-url each payload is also written to a temporary hash, like
+BullMQ does, and MEMORY USAGE is reported.
+"""
+
+import argparse
+import json
+import random
+import timeit
+from typing import Any, Optional
+
+from redis import Redis
+
+from src.scraper.result_encoding import encode_posts
+
+WORDS = (
+    "the council budget city school road park year plan vote new public said would "
+    "million report police water local state health service week people project "
+    "government market price energy first after their over could more which about "
+    "residents officials meeting program funding community development housing"
+).split()
+
+HASHTAGS = ["#travel", "#food", "#photography", "#news", "#sunset", "#coffee", "#art"]
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    """Random sentence from a small news vocabulary."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + "."
+
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    """Random paragraph."""
+    return " ".join(sentence(rng, rng.randint(8, 25)) for _ in range(sentences))
+
+
+def author(name: str, avatar: Optional[str] = None) -> dict[str, Any]:
+    """Post author as serialized by the collectors."""
+    return {"username": name.lower(), "displayName": name, "avatarUrl": avatar}
+
+
+def rss_batch(rng: random.Random) -> list[dict[str, Any]]:
+    """50 full-content articles, as with RSS_MAX_ENTRIES=50."""
+    posts = []
+    for i in range(50):
+        body = "\n\n".join(paragraph(rng, rng.randint(3, 6)) for _ in range(rng.randint(8, 14)))
+        posts.append(
+            {
+                "externalId": f"https://news.example.com/2025/12/01/article-{i}",
+                "content": f"{sentence(rng, 10)}\n\n{body}\n\n#news #local",
+                "mediaUrls": [f"https://cdn.example.com/wp-content/uploads/2025/12/photo-{i}.jpg"],
+                "publishedAt": "2025-12-01T10:00:00+00:00",
+                "author": author("Example News", "https://news.example.com/logo.png"),
+                "metrics": None,
+                "link": f"https://news.example.com/2025/12/01/article-{i}",
+                "title": sentence(rng, 10),
+            },
+        )
+    return posts
+
+
+def twitter_batch(rng: random.Random) -> list[dict[str, Any]]:
+    """40 tweets with metrics and media."""
+    posts = []
+    for i in range(40):
+        posts.append(
+            {
+                "externalId": str(1865000000000000000 + i),
+                "content": sentence(rng, rng.randint(10, 40)) + " https://t.co/AbCdEf1234",
+                "mediaUrls": [
+                    f"https://pbs.twimg.com/media/G{rng.randrange(16**12):012x}.jpg?name=orig",
+                ]
+                if i % 3 == 0
+                else [],
+                "publishedAt": "2025-12-01T10:00:00+00:00",
+                "author": author(
+                    "ExampleCity",
+                    "https://pbs.twimg.com/profile_images/1234567890/avatar_normal.jpg",
+                ),
+                "metrics": {
+                    "likes": rng.randint(0, 5000),
+                    "comments": rng.randint(0, 300),
+                    "shares": rng.randint(0, 800),
+                },
+            },
+        )
+    return posts
+
+
+def instagram_batch(rng: random.Random) -> list[dict[str, Any]]:
+    """12 posts with captions and signed CDN URLs."""
+    posts = []
+    for i in range(12):
+        media = [
+            f"https://scontent-fra5-1.cdninstagram.com/v/t51.29350-15/{rng.randrange(10**17)}_n.jpg"
+            f"?stp=dst-jpg_e35&_nc_ht=scontent-fra5-1.cdninstagram.com&_nc_cat=1"
+            f"&_nc_ohc={rng.randrange(16**16):016x}&edm=ABfd0MgBAAAA&ccb=7-5"
+            f"&oh=00_{rng.randrange(16**40):040x}&oe={rng.randrange(16**8):08X}&_nc_sid=bc0c2c"
+            for _ in range(rng.randint(1, 4))
+        ]
+        posts.append(
+            {
+                "externalId": f"C{rng.randrange(36**10):010d}",
+                "content": paragraph(rng, rng.randint(2, 5)) + "\n\n" + " ".join(HASHTAGS),
+                "mediaUrls": media,
+                "publishedAt": "2025-12-01T10:00:00+00:00",
+                "author": author("example.city", media[0]),
+                "metrics": {"likes": rng.randint(0, 20000), "comments": rng.randint(0, 500)},
+            },
+        )
+    return posts
+
+
+def job_data(posts: list[dict[str, Any]], encoding: str) -> dict[str, Any]:
+    """Build result job data the way ResultPublisher does."""
+    data: dict[str, Any] = {
+        "sourceId": "src_123",
+        "sourceType": "rss",
+        "status": "success",
+        "posts": posts,
+        "nextCursor": posts[0]["externalId"],
+        "chunkIndex": None,
+        "chunkTotal": None,
+        "encoding": None,
+        "postsEncoded": None,
+        "error": None,
+        "processingTime": 1234,
+        "metadata": {
+            "collectorJobId": "1",
+            "orchestratorJobId": "2",
+            "fetchedAt": "2025-12-01T10:00:00",
+        },
+    }
+    if encoding != "json":
+        data["postsEncoded"] = encode_posts(data.pop("posts"), encoding)
+        data["posts"] = None
+        data["encoding"] = encoding
+    return data
+
+
+def serialize(posts: list[dict[str, Any]], encoding: str) -> str:
+    """Serialize job data to the string BullMQ stores."""
+    return json.dumps(job_data(posts, encoding))
+
+
+def available_encodings() -> list[str]:
+    """Encodings usable in this environment."""
+    encodings = ["json", "gzip"]
+    try:
+        import zstandard  # noqa: F401
+
+        encodings.append("zstd")
+    except ImportError:
+        pass
+    return encodings
+
+
+def redis_memory(redis: Redis, payload: str) -> int:
+    """Memory used by a job-like hash holding the payload."""
+    key = "bench:result-encoding"
+    redis.hset(key, mapping={"name": "process-result", "data": payload, "opts": "{}"})
+    try:
+        return redis.memory_usage(key, samples=0) or 0
+    finally:
+        redis.delete(key)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--redis-url", help="Also measure MEMORY USAGE in this Redis")
+    args = parser.parse_args()
+
+    redis = Redis.from_url(args.redis_url) if args.redis_url else None
+    rng = random.Random(42)
+    batches = {
+        "rss": rss_batch(rng),
+        "twitter": twitter_batch(rng),
+        "instagram": instagram_batch(rng),
+    }
+
+    for name, posts in batches.items():
+        print(f"{name} ({len(posts)} posts)")
+        baseline = None
+        for encoding in available_encodings():
+            payload = serialize(posts, encoding)
+            size = len(payload.encode())
+            timer = timeit.Timer(lambda: serialize(posts, encoding))
+            seconds = min(timer.repeat(repeat=5, number=20)) / 20
+            if baseline is None:
+                baseline = size
+
+            line = (
+                f"  {encoding:<5} {size / 1024:9.1f} KiB ({size / baseline:6.1%})"
+                f"  serialize {seconds * 1000:7.2f} ms"
+            )
+            if redis is not None:
+                line += f"  redis {redis_memory(redis, payload) / 1024:9.1f} KiB"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Configuration management using Pydantic settings."""
 
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +16,27 @@ class Settings(BaseSettings):
         description="Redis connection URL for BullMQ queues",
         alias="REDIS_URL",
     )
+    redis_max_connections: int = Field(
+        default=20,
+        description="Size of the Redis connection pool shared by all queues, the worker "
+        "and stores (keep above WORKER_CONCURRENCY + 2)",
+        alias="REDIS_MAX_CONNECTIONS",
+    )
+    redis_pool_timeout: float = Field(
+        default=10.0,
+        description="Seconds to wait for a free pooled Redis connection",
+        alias="REDIS_POOL_TIMEOUT",
+    )
+    redis_health_check_interval: int = Field(
+        default=30,
+        description="PING pooled Redis connections idle for longer than this many seconds",
+        alias="REDIS_HEALTH_CHECK_INTERVAL",
+    )
+    redis_stats_interval: int = Field(
+        default=300,
+        description="Log Redis pool statistics every this many seconds (0 disables)",
+        alias="REDIS_STATS_INTERVAL",
+    )
 
     # Queue Names (matching NestJS SourceQueue enum)
     rss_fetcher_queue: str = Field(
@@ -38,11 +59,228 @@ class Settings(BaseSettings):
         description="User agent for RSS feed requests",
         alias="RSS_USER_AGENT",
     )
+    rss_max_response_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Abort feed responses larger than this many (decompressed) bytes "
+        "(0 disables the limit)",
+        alias="RSS_MAX_RESPONSE_BYTES",
+    )
+    rss_http_max_connections: int = Field(
+        default=100,
+        description="Maximum number of open connections of the feed HTTP client",
+        alias="RSS_HTTP_MAX_CONNECTIONS",
+    )
+    rss_http_max_keepalive_connections: int = Field(
+        default=50,
+        description="Maximum number of idle connections kept open for reuse",
+        alias="RSS_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+    )
+    rss_http_keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle connection is kept open for reuse",
+        alias="RSS_HTTP_KEEPALIVE_EXPIRY",
+    )
+    rss_http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with feed hosts that support it, multiplexing "
+        "requests over one connection (needs the h2 package: pip install 'httpx[http2]')",
+        alias="RSS_HTTP2",
+    )
+    rss_dns_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds resolved feed host addresses are reused (0 disables the cache)",
+        alias="RSS_DNS_CACHE_TTL",
+    )
     rss_max_entries: int = Field(
         default=50,
         description="Maximum number of entries to fetch per feed",
         alias="RSS_MAX_ENTRIES",
     )
+    rss_conditional_requests: bool = Field(
+        default=True,
+        description="Send If-None-Match/If-Modified-Since and skip unchanged feeds",
+        alias="RSS_CONDITIONAL_REQUESTS",
+    )
+    rss_validator_ttl: int = Field(
+        default=7 * 24 * 60 * 60,
+        description="How long feed validators (ETag, Last-Modified, hash) are kept, in seconds",
+        alias="RSS_VALIDATOR_TTL",
+    )
+    rss_parser_mode: Literal["feedparser", "fast", "streaming"] = Field(
+        default="fast",
+        description="fast parses well-formed RSS 2.0/Atom/JSON Feed with expat/json and falls "
+        "back to feedparser; feedparser parses everything with feedparser; streaming parses "
+        "RSS/Atom incrementally and stops downloading once the cursor or limit is reached",
+        alias="RSS_PARSER_MODE",
+    )
+    rss_parse_processes: int = Field(
+        default=0,
+        description="Parse fetched feed bodies in a pool of this many worker processes "
+        "(0 parses in the event loop process)",
+        alias="RSS_PARSE_PROCESSES",
+    )
+    rss_parse_process_min_bytes: int = Field(
+        default=64 * 1024,
+        description="Bodies smaller than this are parsed in the event loop process even with "
+        "a parse pool, as sending them to a worker costs more than parsing them",
+        alias="RSS_PARSE_PROCESS_MIN_BYTES",
+    )
+
+    # Per-host politeness (shared by all replicas through Redis)
+    rss_host_limit_enabled: bool = Field(
+        default=True,
+        description="Limit concurrent and back-to-back requests per feed host",
+        alias="RSS_HOST_LIMIT_ENABLED",
+    )
+    rss_host_max_concurrency: int = Field(
+        default=2,
+        description="Maximum number of requests in flight to one host",
+        alias="RSS_HOST_MAX_CONCURRENCY",
+    )
+    rss_host_min_interval_ms: int = Field(
+        default=500,
+        description="Minimum time between the starts of two requests to one host, in ms",
+        alias="RSS_HOST_MIN_INTERVAL_MS",
+    )
+    rss_host_max_wait: float = Field(
+        default=30.0,
+        description="Seconds a fetch waits for its host before the job is deferred",
+        alias="RSS_HOST_MAX_WAIT",
+    )
+    rss_host_retry_after_default: float = Field(
+        default=60.0,
+        description="Seconds a host answering 429/503 without Retry-After is left alone",
+        alias="RSS_HOST_RETRY_AFTER_DEFAULT",
+    )
+    rss_host_max_defer: float = Field(
+        default=3600.0,
+        description="Seconds after its creation a job throttled by its host stops being "
+        "deferred and fails instead",
+        alias="RSS_HOST_MAX_DEFER",
+    )
+    rss_host_stats_interval: int = Field(
+        default=300,
+        description="Log per-host queueing delay and HTTP connection reuse every this many "
+        "seconds (0 disables)",
+        alias="RSS_HOST_STATS_INTERVAL",
+    )
+
+    # Deduplication (already emitted entries per source)
+    seen_index_enabled: bool = Field(
+        default=True,
+        description="Skip entries already emitted for a source instead of scanning for the cursor",
+        alias="SEEN_INDEX_ENABLED",
+    )
+    seen_index_max_size: int = Field(
+        default=2000,
+        description="Maximum number of emitted entry IDs remembered per source",
+        alias="SEEN_INDEX_MAX_SIZE",
+    )
+    seen_index_ttl: int = Field(
+        default=30 * 24 * 60 * 60,
+        description="How long emitted entry IDs are remembered, in seconds",
+        alias="SEEN_INDEX_TTL",
+    )
+
+    # Media deduplication (uploads already queued, by URL, shared by all sources)
+    media_index_enabled: bool = Field(
+        default=True,
+        description="Reuse the storage key of media whose URL was already uploaded or queued "
+        "instead of publishing another upload job",
+        alias="MEDIA_INDEX_ENABLED",
+    )
+    media_index_ttl: int = Field(
+        default=30 * 24 * 60 * 60,
+        description="How long uploaded media URLs are remembered, in seconds",
+        alias="MEDIA_INDEX_TTL",
+    )
+    media_index_pending_ttl: int = Field(
+        default=24 * 60 * 60,
+        description="How long media URLs are remembered while their upload is pending, in "
+        "seconds (the media worker extends it to MEDIA_INDEX_TTL once uploaded)",
+        alias="MEDIA_INDEX_PENDING_TTL",
+    )
+
+    # Media pre-flight probe (HEAD/Range request per media URL before queueing its upload)
+    media_probe_enabled: bool = Field(
+        default=False,
+        description="Check media URLs before queueing uploads: drop dead, non-media and "
+        "oversized files and take content type and extension from the response",
+        alias="MEDIA_PROBE_ENABLED",
+    )
+    media_probe_concurrency: int = Field(
+        default=10,
+        description="Maximum number of media probe requests in flight",
+        alias="MEDIA_PROBE_CONCURRENCY",
+    )
+    media_probe_timeout: float = Field(
+        default=5.0,
+        description="Timeout of a media probe request in seconds (media is kept on timeout)",
+        alias="MEDIA_PROBE_TIMEOUT",
+    )
+    media_probe_max_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        description="Drop media larger than this many bytes (0 disables the limit)",
+        alias="MEDIA_PROBE_MAX_BYTES",
+    )
+
+    # Inline small media (downloaded at scrape time, shipped as a buffer upload job)
+    media_inline_enabled: bool = Field(
+        default=False,
+        description="Download small media while scraping and send it inside the upload job, "
+        "so the media worker does not fetch it from the origin again",
+        alias="MEDIA_INLINE_ENABLED",
+    )
+    media_inline_max_bytes: int = Field(
+        default=128 * 1024,
+        description="Largest media file inlined, in bytes",
+        alias="MEDIA_INLINE_MAX_BYTES",
+    )
+    media_inline_job_budget: int = Field(
+        default=1024 * 1024,
+        description="Bytes of media inlined per fetch job at most (base64 adds a third in Redis)",
+        alias="MEDIA_INLINE_JOB_BUDGET",
+    )
+    media_inline_concurrency: int = Field(
+        default=10,
+        description="Maximum number of inline media downloads in flight",
+        alias="MEDIA_INLINE_CONCURRENCY",
+    )
+    media_inline_timeout: float = Field(
+        default=10.0,
+        description="Timeout of an inline media download in seconds (falls back to a URL job)",
+        alias="MEDIA_INLINE_TIMEOUT",
+    )
+
+    # Result publishing
+    result_batch_enabled: bool = Field(
+        default=False,
+        description="Buffer results and write them to the results queue with addBulk",
+        alias="RESULT_BATCH_ENABLED",
+    )
+    result_batch_max_size: int = Field(
+        default=50,
+        description="Flush the result batch once it holds this many results",
+        alias="RESULT_BATCH_MAX_SIZE",
+    )
+    result_batch_max_delay_ms: int = Field(
+        default=50,
+        description="Flush the result batch at most this many milliseconds after its first result",
+        alias="RESULT_BATCH_MAX_DELAY_MS",
+    )
+
+    result_chunk_max_bytes: int = Field(
+        default=512 * 1024,
+        description="Split posts of one fetch into result jobs of at most this many bytes "
+        "of post JSON (0 disables chunking)",
+        alias="RESULT_CHUNK_MAX_BYTES",
+    )
+    result_encoding: Literal["json", "gzip", "zstd"] = Field(
+        default="json",
+        description="Store result posts as plain JSON or compressed (gzip, or zstd with the zstd "
+        "extra installed) and base64 encoded",
+        alias="RESULT_ENCODING",
+    )
 
     # Worker Configuration
     worker_concurrency: int = Field(
@@ -6,6 +6,14 @@ import signal
 import sys
 
 from src.config import get_settings
+from src.redis_client import RedisClientFactory
+from src.scraper.feed_cache import FeedValidatorStore
+from src.scraper.host_limiter import HostLimiter
+from src.scraper.parse_pool import ParsePool
+from src.scraper.media_index import MediaIndex
+from src.scraper.media_inline import MediaInliner
+from src.scraper.media_probe import MediaProbe
+from src.scraper.seen_index import SeenIndex
 from src.scraper.rss_scraper import RssScraper
 from src.scraper.queue_worker import RssQueueWorker
 from src.scraper.result_publisher import ResultPublisher
@@ -29,6 +37,11 @@ class RssScrapperApp:
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
         self.worker: RssQueueWorker | None = None
+        self.redis_factory: RedisClientFactory | None = None
+        self.scraper: RssScraper | None = None
+        self.host_limiter: HostLimiter | None = None
+        self.stats_task: asyncio.Task | None = None
+        self.host_stats_task: asyncio.Task | None = None
         self.shutdown_event = asyncio.Event()
 
     def setup_signal_handlers(self) -> None:
@@ -46,20 +59,68 @@ class RssScrapperApp:
         self.logger.info("RSS Scrapper starting...")
 
         try:
+            # One connection pool for every queue, the worker and the stores
+            self.redis_factory = RedisClientFactory(self.settings)
+            redis_factory = self.redis_factory
+
             # Initialize components
-            scraper = RssScraper(self.settings)
-            publisher = ResultPublisher(self.settings)
-            media_publisher = MediaUploadPublisher(self.settings)
+            if self.settings.rss_host_limit_enabled:
+                self.host_limiter = HostLimiter(self.settings, redis_factory.client())
+            parse_pool = (
+                ParsePool(self.settings.rss_parse_processes)
+                if self.settings.rss_parse_processes > 0
+                else None
+            )
+            scraper = RssScraper(self.settings, self.host_limiter, parse_pool)
+            self.scraper = scraper
+            publisher = ResultPublisher(self.settings, redis_factory.client())
+            media_publisher = MediaUploadPublisher(self.settings, redis_factory.client())
+            validator_store = (
+                FeedValidatorStore(self.settings, redis_factory.client())
+                if self.settings.rss_conditional_requests
+                else None
+            )
+            seen_index = (
+                SeenIndex(self.settings, redis_factory.client())
+                if self.settings.seen_index_enabled
+                else None
+            )
+            media_index = (
+                MediaIndex(self.settings, redis_factory.client())
+                if self.settings.media_index_enabled
+                else None
+            )
+            media_probe = (
+                MediaProbe(self.settings)
+                if self.settings.media_probe_enabled
+                else None
+            )
+            media_inliner = (
+                MediaInliner(self.settings)
+                if self.settings.media_inline_enabled
+                else None
+            )
             self.worker = RssQueueWorker(
                 self.settings,
                 scraper,
                 publisher,
                 media_publisher,
+                validator_store,
+                seen_index,
+                media_index=media_index,
+                media_probe=media_probe,
+                media_inliner=media_inliner,
+                redis=redis_factory.client(),
             )
 
             # Start the worker
             self.worker.start()
 
+            if self.settings.redis_stats_interval > 0:
+                self.stats_task = asyncio.create_task(self._log_redis_stats())
+            if self.settings.rss_host_stats_interval > 0:
+                self.host_stats_task = asyncio.create_task(self._log_host_stats())
+
             self.logger.info("RSS Scrapper initialized successfully")
             self.logger.info(
                 f"Worker listening on queue: {self.settings.rss_fetcher_queue}",
@@ -80,13 +141,60 @@ class RssScrapperApp:
         finally:
             await self.stop()
 
+    async def _log_redis_stats(self) -> None:
+        """Periodically log Redis connection pool usage."""
+        while True:
+            await asyncio.sleep(self.settings.redis_stats_interval)
+            if self.redis_factory:
+                stats = self.redis_factory.stats()
+                self.logger.info(
+                    f"Redis pool: {stats['in_use']} in use, {stats['idle']} idle, "
+                    f"max {stats['max']}",
+                )
+
+    async def _log_host_stats(self) -> None:
+        """Periodically log HTTP connection reuse and how long fetches queued per host."""
+        while True:
+            await asyncio.sleep(self.settings.rss_host_stats_interval)
+            if self.scraper:
+                connections = self.scraper.connection_stats()
+                self.logger.info(
+                    f"HTTP client: {connections.requests} requests over "
+                    f"{connections.connections} connections ({connections.reused} reused), "
+                    f"DNS {connections.dns_lookups} lookups, "
+                    f"{connections.dns_cache_hits} cache hits",
+                )
+            if not self.host_limiter:
+                continue
+            stats = self.host_limiter.stats()
+            for host, host_stats in sorted(
+                stats.items(),
+                key=lambda item: item[1].total_wait,
+                reverse=True,
+            ):
+                average = host_stats.total_wait / host_stats.requests if host_stats.requests else 0
+                self.logger.info(
+                    f"Host {host}: {host_stats.requests} requests, "
+                    f"{host_stats.throttled} throttled, queueing delay avg {average:.2f}s "
+                    f"max {host_stats.max_wait:.2f}s",
+                )
+
     async def stop(self) -> None:
         """Stop the RSS scraper application gracefully."""
         self.logger.info("Shutting down RSS Scrapper...")
 
+        if self.stats_task:
+            self.stats_task.cancel()
+        if self.host_stats_task:
+            self.host_stats_task.cancel()
+
         if self.worker:
             await self.worker.stop()
 
+        # Close the pool last, once the worker and publishers released their clients
+        if self.redis_factory:
+            await self.redis_factory.close()
+
         self.logger.info("RSS Scrapper stopped")
 
 
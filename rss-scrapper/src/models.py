@@ -103,6 +103,13 @@ class ResultJobData(BaseModel):
     status: Literal["success", "error"]
     posts: Optional[list[FetchedPost]] = None
     nextCursor: Optional[str] = Field(None, alias="nextCursor")
+    # Set only when the posts of one fetch are split over several result jobs
+    chunkIndex: Optional[int] = Field(None, alias="chunkIndex")  # 0-based
+    chunkTotal: Optional[int] = Field(None, alias="chunkTotal")
+    # Set when posts are compressed: posts is None and postsEncoded holds the
+    # base64 of the compressed JSON array
+    encoding: Optional[Literal["gzip", "zstd"]] = None
+    postsEncoded: Optional[str] = Field(None, alias="postsEncoded")
     error: Optional[ErrorData] = None
     processingTime: int = Field(..., alias="processingTime")  # Milliseconds
     metadata: ResultJobMetadata
@@ -123,6 +130,9 @@ class MediaUploadJobData(BaseModel):
     source: Literal["url", "buffer"]
     sourceUrl: Optional[str] = Field(None, alias="sourceUrl")
     buffer: Optional[str] = None  # Base64 encoded
+    # Media index claim of sourceUrl, kept for mediaIndexTtl seconds once uploaded
+    mediaIndexKey: Optional[str] = Field(None, alias="mediaIndexKey")
+    mediaIndexTtl: Optional[int] = Field(None, alias="mediaIndexTtl")
 
     class Config:
         populate_by_name = True
@@ -0,0 +1,134 @@
+"""Fast path for parsing well-formed RSS 2.0, Atom and JSON Feed documents."""
+
+import codecs
+import hashlib
+import json
+from typing import Any, Optional
+
+from src.scraper.feed_stream import FeedStreamError, FeedStreamParser, parse_date
+from src.scraper.html_text import strip_html_tags
+from src.scraper.rss_scraper import RssFeedEntry, RssFeedInfo
+
+
+def parse_feed_document(feed_url: str, body: bytes) -> tuple[RssFeedInfo, list[RssFeedEntry]]:
+    """
+    Parse a whole feed document without feedparser.
+
+    XML goes through the expat-based FeedStreamParser in one chunk, JSON Feed
+    through json. Neither runs feedparser's encoding detection, sanitizing or
+    date heuristics, so anything unusual is left to feedparser.
+
+    Args:
+        feed_url: URL of the feed (fallback title and link)
+        body: Raw response body
+
+    Returns:
+        Tuple of (feed info, entries in document order)
+
+    Raises:
+        FeedStreamError: The document is malformed or not RSS 2.0/Atom/JSON Feed
+    """
+    if body.removeprefix(codecs.BOM_UTF8).lstrip()[:1] in (b"{", b"["):
+        return _parse_json_feed(feed_url, body)
+
+    parser = FeedStreamParser(feed_url)
+    entries = list(parser.feed(body))
+    entries.extend(parser.close())
+    return parser.feed_info(), entries
+
+
+def _parse_json_feed(feed_url: str, body: bytes) -> tuple[RssFeedInfo, list[RssFeedEntry]]:
+    """Parse a JSON Feed (1.0 or 1.1) document."""
+    try:
+        document = json.loads(body)
+    except ValueError as e:
+        raise FeedStreamError(f"Malformed JSON feed: {e}") from e
+
+    if (
+        not isinstance(document, dict)
+        or not str(document.get("version", "")).startswith("https://jsonfeed.org/version/")
+        or not isinstance(document.get("items"), list)
+    ):
+        raise FeedStreamError("JSON document is not a JSON Feed")
+
+    author, _ = _json_author(document)
+    feed_info = RssFeedInfo(
+        title=strip_html_tags(_string(document.get("title"))) or feed_url,
+        link=_string(document.get("home_page_url")) or feed_url,
+        description=strip_html_tags(_string(document.get("description"))),
+        author=author,
+        image_url=_string(document.get("icon")) or _string(document.get("favicon")) or None,
+    )
+
+    entries = [_parse_json_item(item) for item in document["items"] if isinstance(item, dict)]
+    return feed_info, entries
+
+
+def _parse_json_item(item: dict[str, Any]) -> RssFeedEntry:
+    """Convert a JSON Feed item into RssFeedEntry."""
+    title = _string(item.get("title"))
+    link = _string(item.get("url")) or _string(item.get("external_url"))
+    # id is required, but may be a number in the wild
+    entry_id = (
+        _string(item.get("id"))
+        or link
+        or title
+        or hashlib.sha1(json.dumps(item).encode()).hexdigest()
+    )
+
+    enclosures = []
+    for attachment in item.get("attachments") or []:
+        if isinstance(attachment, dict) and _string(attachment.get("url")):
+            enclosures.append(
+                {
+                    "url": _string(attachment.get("url")),
+                    "type": _string(attachment.get("mime_type")),
+                    "length": _string(attachment.get("size_in_bytes")),
+                },
+            )
+    for key in ("image", "banner_image"):
+        if _string(item.get(key)):
+            # Like Media RSS thumbnails, item images are usually JPEGs
+            enclosures.append({"url": _string(item.get(key)), "type": "image/jpeg", "length": ""})
+
+    author, author_email = _json_author(item)
+
+    return RssFeedEntry(
+        id=entry_id,
+        title=strip_html_tags(title),
+        content=(
+            _string(item.get("content_html"))
+            or _string(item.get("content_text"))
+            or _string(item.get("summary"))
+        ),
+        link=link,
+        published=(
+            parse_date(_string(item.get("date_published")))
+            or parse_date(_string(item.get("date_modified")))
+        ),
+        author=author,
+        author_email=author_email,
+        enclosures=enclosures,
+        tags=[_string(tag) for tag in item.get("tags") or [] if _string(tag)],
+    )
+
+
+def _json_author(obj: dict[str, Any]) -> tuple[Optional[str], Optional[str]]:
+    """Get name and email of the first author (1.1 authors, or 1.0 author)."""
+    authors = obj.get("authors")
+    author = authors[0] if isinstance(authors, list) and authors else obj.get("author")
+    if not isinstance(author, dict):
+        return None, None
+
+    url = _string(author.get("url"))
+    email = url.removeprefix("mailto:") if url.startswith("mailto:") else None
+    return _string(author.get("name")) or None, email
+
+
+def _string(value: Any) -> str:
+    """Get a JSON scalar as stripped text, empty string for anything else."""
+    if isinstance(value, bool) or value is None:
+        return ""
+    if isinstance(value, (str, int, float)):
+        return str(value).strip()
+    return ""
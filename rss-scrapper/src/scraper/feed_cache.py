@@ -0,0 +1,95 @@
+"""Persistent HTTP cache validators for RSS feeds."""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FeedValidators:
+    """HTTP cache validators captured from the last successful feed fetch."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+
+class FeedValidatorStore:
+    """Redis-backed store of feed validators keyed by the feed's external ID."""
+
+    KEY_PREFIX = "rss:feed-validators"
+
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
+        """Initialize validator store with settings."""
+        self.settings = settings
+        self.ttl = settings.rss_validator_ttl
+        self.redis = (
+            redis
+            if redis is not None
+            else Redis.from_url(settings.redis_url, decode_responses=True)
+        )
+
+    def _key(self, external_id: str) -> str:
+        """Build the Redis key for a feed (hashed so long URLs stay compact)."""
+        digest = hashlib.sha1(external_id.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    async def get(self, external_id: str) -> Optional[FeedValidators]:
+        """
+        Get stored validators for a feed.
+
+        Args:
+            external_id: Feed URL (CollectorJobData.externalId)
+
+        Returns:
+            Stored validators, or None if the feed has not been fetched yet
+        """
+        try:
+            data = await self.redis.hgetall(self._key(external_id))
+        except Exception as e:
+            # A cache miss only costs a full download, never fail the job on it
+            logger.warning(f"Failed to read feed validators for {external_id}: {e}")
+            return None
+
+        if not data:
+            return None
+
+        return FeedValidators(
+            etag=data.get("etag") or None,
+            last_modified=data.get("last_modified") or None,
+            content_hash=data.get("content_hash") or None,
+        )
+
+    async def save(self, external_id: str, validators: FeedValidators) -> None:
+        """
+        Save validators for a feed.
+
+        Args:
+            external_id: Feed URL (CollectorJobData.externalId)
+            validators: Validators from the latest successful fetch
+        """
+        key = self._key(external_id)
+        mapping = {
+            "etag": validators.etag or "",
+            "last_modified": validators.last_modified or "",
+            "content_hash": validators.content_hash or "",
+        }
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to save feed validators for {external_id}: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.redis.aclose()
@@ -0,0 +1,318 @@
+"""Incremental RSS 2.0/Atom parser for streamed feed bodies."""
+
+import hashlib
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser, tostring
+
+from src.scraper.html_text import strip_html_tags
+from src.scraper.rss_scraper import RssFeedEntry, RssFeedInfo
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+ATOM_FEED = f"{{{ATOM_NS}}}feed"
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+
+
+class FeedStreamError(Exception):
+    """Document cannot be parsed incrementally (malformed or unsupported format)."""
+
+    pass
+
+
+def _text(element: Optional[Element]) -> str:
+    """Get stripped text of an element, empty string if missing."""
+    if element is None or element.text is None:
+        return ""
+    return element.text.strip()
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date."""
+    if not value:
+        return None
+
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class FeedStreamParser:
+    """
+    Push parser that turns chunks of a feed body into RssFeedEntry objects.
+
+    Entries are yielded as soon as their closing tag arrives and are then
+    detached from the tree, so memory stays bounded by the largest single entry
+    rather than the whole document. Channel/feed metadata (which precedes the
+    entries in practice) is kept for feed_info().
+    """
+
+    def __init__(self, feed_url: str):
+        """Initialize parser for a feed."""
+        self.feed_url = feed_url
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: list[Element] = []
+        self._format: Optional[str] = None  # "rss" or "atom"
+        self._channel: Optional[Element] = None
+
+    def feed(self, data: bytes) -> Iterator[RssFeedEntry]:
+        """
+        Feed a chunk of the document and yield entries completed by it.
+
+        Raises:
+            FeedStreamError: The document is malformed or not RSS 2.0/Atom
+        """
+        try:
+            self._parser.feed(data)
+        except ParseError as e:
+            raise FeedStreamError(f"Malformed feed: {e}") from e
+
+        yield from self._drain_events()
+
+    def close(self) -> Iterator[RssFeedEntry]:
+        """
+        Signal end of document and yield any remaining entries.
+
+        Raises:
+            FeedStreamError: The document ended prematurely
+        """
+        try:
+            self._parser.close()
+        except ParseError as e:
+            raise FeedStreamError(f"Malformed feed: {e}") from e
+
+        yield from self._drain_events()
+
+    def _drain_events(self) -> Iterator[RssFeedEntry]:
+        """Process pending parser events."""
+        try:
+            # Errors found while feeding are raised when the events are read
+            events = list(self._parser.read_events())
+        except ParseError as e:
+            raise FeedStreamError(f"Malformed feed: {e}") from e
+
+        for event, element in events:
+            if event == "start":
+                self._on_start(element)
+                continue
+
+            self._stack.pop()
+            parent = self._stack[-1] if self._stack else None
+
+            if parent is not None and parent is self._channel and self._is_entry(element):
+                yield self._parse_entry(element)
+                # Detach the entry so the tree does not grow with the document
+                parent.remove(element)
+
+    def _on_start(self, element: Element) -> None:
+        """Track element nesting and detect the feed format from the root."""
+        depth = len(self._stack)
+        self._stack.append(element)
+
+        if depth == 0:
+            if element.tag == "rss":
+                self._format = "rss"
+            elif element.tag == ATOM_FEED:
+                self._format = "atom"
+                self._channel = element
+            else:
+                raise FeedStreamError(f"Unsupported feed root element: {element.tag}")
+        elif depth == 1 and self._format == "rss" and element.tag == "channel":
+            self._channel = element
+
+    def _is_entry(self, element: Element) -> bool:
+        """Check whether an element is a feed entry."""
+        if self._format == "atom":
+            return element.tag == ATOM_ENTRY
+        return element.tag == "item"
+
+    def _parse_entry(self, element: Element) -> RssFeedEntry:
+        """Convert an entry element into RssFeedEntry."""
+        if self._format == "atom":
+            return self._parse_atom_entry(element)
+        return self._parse_rss_item(element)
+
+    def feed_info(self) -> RssFeedInfo:
+        """Build feed metadata from the channel/feed elements seen so far."""
+        channel = self._channel
+        if channel is None:
+            return RssFeedInfo(
+                title=self.feed_url,
+                link=self.feed_url,
+                description="",
+                author=None,
+                image_url=None,
+            )
+
+        if self._format == "atom":
+            return RssFeedInfo(
+                title=strip_html_tags(_text(channel.find(f"{{{ATOM_NS}}}title"))) or self.feed_url,
+                link=self._atom_link(channel) or self.feed_url,
+                description=strip_html_tags(_text(channel.find(f"{{{ATOM_NS}}}subtitle"))),
+                author=_text(channel.find(f"{{{ATOM_NS}}}author/{{{ATOM_NS}}}name")) or None,
+                image_url=(
+                    _text(channel.find(f"{{{ATOM_NS}}}logo"))
+                    or _text(channel.find(f"{{{ATOM_NS}}}icon"))
+                    or None
+                ),
+            )
+
+        return RssFeedInfo(
+            title=strip_html_tags(_text(channel.find("title"))) or self.feed_url,
+            link=_text(channel.find("link")) or self.feed_url,
+            description=strip_html_tags(_text(channel.find("description"))),
+            author=(
+                _text(channel.find("managingEditor"))
+                or _text(channel.find(f"{{{DC_NS}}}creator"))
+                or _text(channel.find("webMaster"))
+                or None
+            ),
+            image_url=_text(channel.find("image/url")) or None,
+        )
+
+    def _parse_rss_item(self, item: Element) -> RssFeedEntry:
+        """Convert an RSS 2.0 <item> into RssFeedEntry."""
+        title = _text(item.find("title"))
+        link = _text(item.find("link"))
+        guid = _text(item.find("guid"))
+
+        content = _text(item.find(f"{{{CONTENT_NS}}}encoded")) or _text(item.find("description"))
+
+        published = parse_date(_text(item.find("pubDate"))) or parse_date(
+            _text(item.find(f"{{{DC_NS}}}date")),
+        )
+
+        author, author_email = self._split_rss_author(_text(item.find("author")))
+        author = author or _text(item.find(f"{{{DC_NS}}}creator")) or None
+
+        enclosures = []
+        for enclosure in item.findall("enclosure"):
+            self._append_enclosure(
+                enclosures,
+                enclosure.get("url", ""),
+                enclosure.get("type", ""),
+                enclosure.get("length", ""),
+            )
+        self._append_media_rss(enclosures, item)
+
+        tags = [_text(category) for category in item.findall("category") if _text(category)]
+
+        return RssFeedEntry(
+            id=guid or link or title or hashlib.sha1(tostring(item)).hexdigest(),
+            title=strip_html_tags(title),
+            content=content,
+            link=link,
+            published=published,
+            author=author,
+            author_email=author_email,
+            enclosures=enclosures,
+            tags=tags,
+        )
+
+    def _parse_atom_entry(self, entry: Element) -> RssFeedEntry:
+        """Convert an Atom <entry> into RssFeedEntry."""
+        title = _text(entry.find(f"{{{ATOM_NS}}}title"))
+        link = self._atom_link(entry)
+        entry_id = _text(entry.find(f"{{{ATOM_NS}}}id"))
+
+        content = self._atom_content(entry.find(f"{{{ATOM_NS}}}content")) or self._atom_content(
+            entry.find(f"{{{ATOM_NS}}}summary"),
+        )
+
+        published = parse_date(_text(entry.find(f"{{{ATOM_NS}}}published"))) or parse_date(
+            _text(entry.find(f"{{{ATOM_NS}}}updated")),
+        )
+
+        enclosures: list[dict[str, str]] = []
+        for link_element in entry.findall(f"{{{ATOM_NS}}}link"):
+            if link_element.get("rel") == "enclosure":
+                self._append_enclosure(
+                    enclosures,
+                    link_element.get("href", ""),
+                    link_element.get("type", ""),
+                    link_element.get("length", ""),
+                )
+        self._append_media_rss(enclosures, entry)
+
+        tags = []
+        for category in entry.findall(f"{{{ATOM_NS}}}category"):
+            term = category.get("term") or category.get("label")
+            if term:
+                tags.append(term)
+
+        return RssFeedEntry(
+            id=entry_id or link or title or hashlib.sha1(tostring(entry)).hexdigest(),
+            title=strip_html_tags(title),
+            content=content,
+            link=link,
+            published=published,
+            author=_text(entry.find(f"{{{ATOM_NS}}}author/{{{ATOM_NS}}}name")) or None,
+            author_email=_text(entry.find(f"{{{ATOM_NS}}}author/{{{ATOM_NS}}}email")) or None,
+            enclosures=enclosures,
+            tags=tags,
+        )
+
+    @staticmethod
+    def _atom_link(element: Element) -> str:
+        """Get the alternate link of an Atom feed or entry."""
+        for link in element.findall(f"{{{ATOM_NS}}}link"):
+            if link.get("rel", "alternate") == "alternate" and link.get("href"):
+                return link.get("href", "")
+        return ""
+
+    @staticmethod
+    def _atom_content(element: Optional[Element]) -> str:
+        """Get Atom content/summary, serializing inline XHTML if present."""
+        if element is None:
+            return ""
+        if element.get("type") == "xhtml":
+            return "".join(tostring(child, encoding="unicode") for child in element).strip()
+        return _text(element)
+
+    @staticmethod
+    def _split_rss_author(value: str) -> tuple[Optional[str], Optional[str]]:
+        """Split an RSS author field ("email (Name)") into name and email."""
+        if not value:
+            return None, None
+        if "(" in value and value.endswith(")"):
+            email, name = value[:-1].split("(", 1)
+            return name.strip() or None, email.strip() or None
+        if "@" in value and " " not in value:
+            return None, value
+        return value, None
+
+    @staticmethod
+    def _append_enclosure(
+        enclosures: list[dict[str, str]],
+        url: str,
+        content_type: str,
+        length: str,
+    ) -> None:
+        """Append an enclosure if it has a URL."""
+        if url:
+            enclosures.append({"url": url, "type": content_type, "length": length})
+
+    def _append_media_rss(self, enclosures: list[dict[str, str]], element: Element) -> None:
+        """Append Media RSS content and thumbnails (direct or inside media:group)."""
+        media_content = element.findall(f"{{{MEDIA_NS}}}content") + element.findall(
+            f"{{{MEDIA_NS}}}group/{{{MEDIA_NS}}}content",
+        )
+        for media in media_content:
+            self._append_enclosure(enclosures, media.get("url", ""), media.get("type", ""), "")
+
+        thumbnails = element.findall(f"{{{MEDIA_NS}}}thumbnail") + element.findall(
+            f"{{{MEDIA_NS}}}group/{{{MEDIA_NS}}}thumbnail",
+        )
+        for thumbnail in thumbnails:
+            # Thumbnails are usually images
+            self._append_enclosure(enclosures, thumbnail.get("url", ""), "image/jpeg", "")
@@ -0,0 +1,253 @@
+"""Per-host politeness limits for feed requests, shared by all replicas through Redis."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Optional
+from uuid import uuid4
+
+import httpx
+from redis.asyncio import Redis
+
+from src.config import Settings
+from src.scraper.rss_scraper import RssFetchError
+
+logger = logging.getLogger(__name__)
+
+# Takes a request slot for a host. Returns 0 when the slot was taken, the number
+# of milliseconds to wait when the host is blocked or paced, and -1 when every
+# slot is taken (leases end when requests finish, so the caller polls).
+# KEYS: leases (zset token -> expiry), next allowed request time, blocked until
+# ARGV: token, max concurrency, min interval ms, lease ms
+ACQUIRE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local blocked_until = tonumber(redis.call('GET', KEYS[3]) or '0')
+if blocked_until > now then
+    return blocked_until - now
+end
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return -1
+end
+
+local next_at = tonumber(redis.call('GET', KEYS[2]) or '0')
+if next_at > now then
+    return next_at - now
+end
+
+local lease_ms = tonumber(ARGV[4])
+redis.call('ZADD', KEYS[1], now + lease_ms, ARGV[1])
+redis.call('PEXPIRE', KEYS[1], lease_ms)
+
+local interval_ms = tonumber(ARGV[3])
+if interval_ms > 0 then
+    redis.call('SET', KEYS[2], now + interval_ms, 'PX', interval_ms)
+end
+return 0
+"""
+
+# Blocks a host for ARGV[1] milliseconds unless it is already blocked for longer
+# (SET rejects a PX of 0, so the delay is at least 1 ms)
+BLOCK_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local delay_ms = math.max(1, tonumber(ARGV[1]))
+
+local blocked_until = tonumber(redis.call('GET', KEYS[1]) or '0')
+if now + delay_ms > blocked_until then
+    redis.call('SET', KEYS[1], now + delay_ms, 'PX', delay_ms)
+end
+return 0
+"""
+
+
+class HostThrottledError(RssFetchError):
+    """The feed's host asked us to back off or has no free slot; retry the job later."""
+
+    def __init__(self, message: str, retry_at: datetime):
+        """Initialize error with the time the host is expected to accept requests."""
+        super().__init__(message)
+        self.retry_at = retry_at
+
+
+@dataclass
+class HostStats:
+    """Queueing statistics of one host since the last report."""
+
+    requests: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostLimiter:
+    """
+    Limits concurrent and back-to-back requests per feed host.
+
+    Feeds cluster on a few hosts (Substack, Medium, WordPress.com, feedburner), so
+    without a limit a busy worker sends them bursts while other hosts idle. Each
+    host gets a number of request slots and a minimum interval between request
+    starts, kept in Redis so the limits hold across replicas. A host answering
+    429/503 is blocked for its Retry-After. Limits are per host, so a throttled
+    host never delays requests to other hosts.
+    """
+
+    KEY_PREFIX = "rss:host"
+    # How often a request waiting for a slot checks again
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
+        """Initialize host limiter with settings."""
+        self.settings = settings
+        self.max_wait = settings.rss_host_max_wait
+        # A lease outlives any healthy request; it only expires for crashed workers
+        self.lease_ms = int(settings.rss_request_timeout * 4 * 1000)
+        self.redis = (
+            redis
+            if redis is not None
+            else Redis.from_url(settings.redis_url, decode_responses=True)
+        )
+        self._acquire_script = self.redis.register_script(ACQUIRE_SCRIPT)
+        self._block_script = self.redis.register_script(BLOCK_SCRIPT)
+        self._stats: dict[str, HostStats] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Get the host a URL is rate limited under."""
+        return (httpx.URL(url).host or url).lower()
+
+    def _keys(self, host: str) -> list[str]:
+        """Build the Redis keys of a host (hash tagged so they share a cluster slot)."""
+        prefix = f"{self.KEY_PREFIX}:{{{host}}}"
+        return [f"{prefix}:leases", f"{prefix}:next", f"{prefix}:blocked"]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold a request slot of the URL's host for the duration of the block.
+
+        Waits up to rss_host_max_wait seconds for the host to accept a request.
+
+        Raises:
+            HostThrottledError: The host does not accept a request in time
+        """
+        host = self.host_of(url)
+        token = uuid4().hex
+        await self._acquire(host, token)
+        try:
+            yield
+        finally:
+            try:
+                await self.redis.zrem(self._keys(host)[0], token)
+            except Exception as e:
+                # The lease expires on its own
+                logger.warning(f"Failed to release request slot for {host}: {e}")
+
+    async def _acquire(self, host: str, token: str) -> None:
+        """Take a slot of the host, waiting while it is blocked, paced or full."""
+        stats = self._stats.setdefault(host, HostStats())
+        started = time.monotonic()
+
+        while True:
+            try:
+                wait_ms = int(
+                    await self._acquire_script(
+                        keys=self._keys(host),
+                        args=[
+                            token,
+                            self.settings.rss_host_max_concurrency,
+                            self.settings.rss_host_min_interval_ms,
+                            self.lease_ms,
+                        ],
+                    ),
+                )
+            except Exception as e:
+                # Politeness is best effort, never fail the fetch on it
+                logger.warning(f"Failed to take request slot for {host}: {e}")
+                wait_ms = 0
+
+            waited = time.monotonic() - started
+            if wait_ms == 0:
+                stats.requests += 1
+                stats.total_wait += waited
+                stats.max_wait = max(stats.max_wait, waited)
+                if waited >= self.POLL_INTERVAL:
+                    logger.info(f"Waited {waited:.2f}s for a request slot of {host}")
+                return
+
+            wait = wait_ms / 1000 if wait_ms > 0 else self.POLL_INTERVAL
+            if waited + wait > self.max_wait:
+                stats.throttled += 1
+                # A full host frees up as requests finish, so retry after the usual wait
+                retry_in = wait if wait_ms > 0 else self.max_wait
+                raise HostThrottledError(
+                    f"Host {host} is throttled, no request slot within {self.max_wait:.0f}s",
+                    retry_at=datetime.now(timezone.utc) + timedelta(seconds=retry_in),
+                )
+
+            await asyncio.sleep(wait)
+
+    async def block(self, url: str, delay: float) -> None:
+        """
+        Stop sending requests to the URL's host for a while.
+
+        Args:
+            url: Any URL of the host
+            delay: Seconds to block the host for (from Retry-After)
+        """
+        host = self.host_of(url)
+        if delay <= 0:
+            # Retry-After: 0 or a date already past, there is nothing to wait for
+            return
+        logger.warning(f"Host {host} asked to back off, blocking it for {delay:.0f}s")
+        try:
+            await self._block_script(keys=self._keys(host)[2:], args=[int(delay * 1000)])
+        except Exception as e:
+            logger.warning(f"Failed to block host {host}: {e}")
+
+    def stats(self) -> dict[str, HostStats]:
+        """
+        Get queueing statistics per host since the previous call.
+
+        Returns:
+            Dict of host to its request count, throttled count and waits in seconds
+        """
+        stats, self._stats = self._stats, {}
+        return stats
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.redis.aclose()
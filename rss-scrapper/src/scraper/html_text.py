@@ -0,0 +1,87 @@
+"""HTML to plain text conversion shared by the scraper and mappers."""
+
+import html
+import re
+
+# Patterns are compiled once; each starts with a literal "<" so the regex
+# engine can skip straight to candidate tags instead of testing every character.
+_BLOCK_TAG_RE = re.compile(
+    r"</?(?:address|article|aside|blockquote|dd|div|dl|dt|figcaption|figure|footer"
+    r"|h[1-6]|header|li|ol|p|pre|section|table|tr|ul)\b[^>]*>\s*",
+    re.IGNORECASE,
+)
+_LINE_BREAK_TAG_RE = re.compile(r"<(?:br|hr)\b[^>]*>\s*", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Whitespace other than plain spaces and newlines (\xa0 comes from &nbsp;)
+_INLINE_WHITESPACE = "\t\r\f\v\xa0"
+_ALL_WHITESPACE = "\n" + _INLINE_WHITESPACE
+# Entities that may decode to whitespace (any numeric reference, like &#10;)
+_WHITESPACE_ENTITY_RE = re.compile(r"&(?:#|nbsp|NonBreakingSpace|Tab|NewLine)")
+
+
+def _normalize_whitespace(text: str, keep_paragraphs: bool) -> str:
+    """Collapse whitespace, optionally keeping lines and single blank lines."""
+    # str.replace guarded by "in" is much cheaper than a character-class regex,
+    # which has to test every position of a long body
+    for char in _INLINE_WHITESPACE if keep_paragraphs else _ALL_WHITESPACE:
+        if char in text:
+            text = text.replace(char, " ")
+
+    while "  " in text:
+        text = text.replace("  ", " ")
+
+    if not keep_paragraphs:
+        return text.strip()
+
+    lines: list[str] = []
+    previous_blank = True
+    for line in text.split("\n"):
+        line = line.strip()
+        if line:
+            lines.append(line)
+            previous_blank = False
+        elif not previous_blank:
+            lines.append("")
+            previous_blank = True
+
+    if lines and not lines[-1]:
+        lines.pop()
+
+    return "\n".join(lines)
+
+
+def strip_html_tags(text: str, keep_paragraphs: bool = False) -> str:
+    """
+    Remove HTML tags from text and decode HTML entities.
+
+    Args:
+        text: Text potentially containing HTML
+        keep_paragraphs: Keep line breaks (block tags and <br> become breaks) and
+            collapse blank lines into a single paragraph break, instead of joining
+            everything into one line
+
+    Returns:
+        Clean text without HTML tags
+    """
+    if not text:
+        return ""
+
+    if "<" in text:
+        text = _BLOCK_TAG_RE.sub("\n\n" if keep_paragraphs else " ", text)
+        text = _LINE_BREAK_TAG_RE.sub("\n" if keep_paragraphs else " ", text)
+        text = _TAG_RE.sub("", text)
+
+    # Whitespace is normalized before decoding entities: until then the body is
+    # usually plain ASCII, which str operations handle fastest
+    text = _normalize_whitespace(text, keep_paragraphs)
+
+    # Decode HTML entities (e.g., &amp; -> &, &lt; -> <), normalizing again when
+    # some of them may have decoded to whitespace
+    if "&" in text:
+        encoded_whitespace = _WHITESPACE_ENTITY_RE.search(text) is not None
+        text = html.unescape(text)
+        if encoded_whitespace:
+            text = _normalize_whitespace(text, keep_paragraphs)
+
+    return text
@@ -0,0 +1,313 @@
+"""HTTP transport for feed requests with a DNS cache and connection reuse statistics."""
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import socket
+import time
+import typing
+import urllib.request
+from dataclasses import dataclass
+
+import httpcore
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConnectionStats:
+    """Counters of the HTTP transport since it was created."""
+
+    requests: int = 0
+    # Every new connection costs a TCP (and for https a TLS) handshake
+    connections: int = 0
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests sent over an already open (keep-alive or HTTP/2) connection."""
+        return max(0, self.requests - self.connections)
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that caches DNS results and counts new connections.
+
+    getaddrinfo runs in the default thread pool and feeds hosts are resolved
+    over and over, so results are kept for a fixed TTL (the resolver does not
+    report record TTLs). TLS still uses the hostname for SNI and certificate
+    checks, only the TCP connect goes to the cached address.
+    """
+
+    def __init__(self, ttl: float, stats: ConnectionStats):
+        """
+        Initialize backend.
+
+        Args:
+            ttl: Seconds a resolved address is reused (0 disables the cache)
+            stats: Counters to update
+        """
+        self.ttl = ttl
+        self.stats = stats
+        self._backend = httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self._lookups: dict[tuple[str, int], asyncio.Future[list[str]]] = {}
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: typing.Optional[float] = None,
+        local_address: typing.Optional[str] = None,
+        socket_options: typing.Optional[typing.Iterable[typing.Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a TCP connection to the first reachable address of the host."""
+        self.stats.connections += 1
+        addresses = await self._resolve(host, port, timeout)
+
+        error: Exception = httpcore.ConnectError(f"No address for {host}")
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+
+        # The host may have moved, resolve it again next time
+        self._cache.pop((host, port), None)
+        raise error
+
+    async def _resolve(self, host: str, port: int, timeout: typing.Optional[float]) -> list[str]:
+        """Resolve a host to its addresses, from the cache while they are fresh."""
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        key = (host, port)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self.stats.dns_cache_hits += 1
+            return cached[1]
+
+        # Connections opened at the same time share one lookup
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            self.stats.dns_lookups += 1
+            lookup = asyncio.ensure_future(self._lookup(host, port))
+            self._lookups[key] = lookup
+            lookup.add_done_callback(lambda _: self._lookups.pop(key, None))
+        else:
+            self.stats.dns_cache_hits += 1
+
+        try:
+            # Shielded: a caller timing out must not cancel the lookup for the others
+            return await asyncio.wait_for(asyncio.shield(lookup), timeout)
+        except asyncio.TimeoutError as e:
+            raise httpcore.ConnectTimeout(f"Timed out resolving {host}") from e
+
+    async def _lookup(self, host: str, port: int) -> list[str]:
+        """Resolve a host with the system resolver and cache the result."""
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            raise httpcore.ConnectError(f"Failed to resolve {host}: {e}") from e
+
+        # Keep the resolver's order (address family preference) without duplicates
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        if self.ttl > 0:
+            self._cache[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: typing.Optional[float] = None,
+        socket_options: typing.Optional[typing.Iterable[typing.Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a Unix socket connection."""
+        self.stats.connections += 1
+        return await self._backend.connect_unix_socket(
+            path,
+            timeout=timeout,
+            socket_options=socket_options,
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep (used between connect retries)."""
+        await self._backend.sleep(seconds)
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport over an httpcore connection pool that resolves through
+    CachingNetworkBackend.
+
+    httpx.AsyncHTTPTransport does not take a network backend, so the pool is
+    built here and requests, responses and errors are translated the way
+    httpx does it.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool, dns_cache_ttl: float):
+        """
+        Initialize transport.
+
+        Args:
+            limits: Connection pool limits
+            http2: Negotiate HTTP/2 with hosts that support it (needs the h2 package)
+            dns_cache_ttl: Seconds resolved addresses are reused (0 disables the cache)
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise RuntimeError(
+                    "RSS_HTTP2=true requires the h2 package (pip install 'httpx[http2]')",
+                ) from e
+
+        self.stats = ConnectionStats()
+        self.pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=CachingNetworkBackend(dns_cache_ttl, self.stats),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, counting it for the reuse statistics."""
+        self.stats.requests += 1
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with map_httpcore_errors():
+            response = await self.pool.handle_async_request(core_request)
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        await self.pool.aclose()
+
+
+class ResponseStream(httpx.AsyncByteStream):
+    """Body of a pooled response, with httpcore errors raised as httpx errors."""
+
+    def __init__(self, stream: typing.AsyncIterable[bytes]):
+        """Wrap an httpcore response stream."""
+        self._stream = stream
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        """Yield the body chunks."""
+        with map_httpcore_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        """Release the connection back to the pool."""
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+# Most specific first: the first match decides which httpx error is raised
+HTTPCORE_ERRORS: list[tuple[type[Exception], type[httpx.HTTPError]]] = [
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+]
+
+
+@contextlib.contextmanager
+def map_httpcore_errors() -> typing.Iterator[None]:
+    """Raise httpcore errors as the matching httpx errors, which callers handle."""
+    try:
+        yield
+    except Exception as e:
+        for core_error, httpx_error in HTTPCORE_ERRORS:
+            if isinstance(e, core_error):
+                raise httpx_error(str(e)) from e
+        raise
+
+
+def proxy_mounts(
+    limits: httpx.Limits,
+    http2: bool,
+) -> dict[str, typing.Optional[httpx.AsyncBaseTransport]]:
+    """
+    Build client mounts for the proxies configured in the environment.
+
+    httpx only reads HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY when the
+    client has no custom transport, so feed requests would otherwise bypass
+    them. Proxied requests go through a plain httpx transport (the proxy
+    resolves the feed host) and are not counted in the connection statistics.
+    Hosts in NO_PROXY map to None, which httpx treats as the default transport.
+    """
+    proxies = urllib.request.getproxies()
+    mounts: dict[str, typing.Optional[httpx.AsyncBaseTransport]] = {}
+
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            if "://" not in url:
+                url = f"http://{url}"
+            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(
+                proxy=url,
+                limits=limits,
+                http2=http2,
+            )
+
+    for host in (host.strip() for host in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            pattern = host if host.lower() == "localhost" else f"*{host}"
+        else:
+            pattern = f"[{host}]" if address.version == 6 else host
+        mounts[f"all://{pattern}"] = None
+
+    return mounts
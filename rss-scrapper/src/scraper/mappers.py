@@ -1,6 +1,5 @@
 """Mappers to transform RSS feed data to FetchedPost format."""
 
-import html
 import logging
 import re
 from datetime import datetime, timezone
@@ -8,42 +7,12 @@ from typing import Optional
 from urllib.parse import urlparse
 
 from src.models import FetchedPost, MediaUploadJobData, PostAuthor, PostMetrics
+from src.scraper.html_text import strip_html_tags
 from src.scraper.rss_scraper import RssFeedEntry, RssFeedInfo
 
 logger = logging.getLogger(__name__)
 
 
-def strip_html_tags(text: str) -> str:
-    """
-    Remove HTML tags from text and decode HTML entities.
-
-    Args:
-        text: Text potentially containing HTML
-
-    Returns:
-        Clean text without HTML tags
-    """
-    if not text:
-        return ""
-
-    # Remove HTML tags
-    clean = re.sub(r"<[^>]+>", "", text)
-
-    # Decode HTML entities (e.g., &amp; -> &, &lt; -> <)
-    clean = html.unescape(clean)
-
-    # Normalize whitespace (but preserve paragraph breaks)
-    # First, normalize multiple spaces to single space
-    clean = re.sub(r"[ \t]+", " ", clean)
-    # Normalize multiple newlines to double newline (paragraph break)
-    clean = re.sub(r"\n\s*\n", "\n\n", clean)
-    # Trim each line
-    lines = [line.strip() for line in clean.split("\n")]
-    clean = "\n".join(lines)
-
-    return clean.strip()
-
-
 def generate_media_key(
     source_type: str,
     source_id: str,
@@ -300,7 +269,7 @@ class RssEntryMapper:
 
         # Clean the content (strip HTML tags)
         if entry.content:
-            clean_content = strip_html_tags(entry.content)
+            clean_content = strip_html_tags(entry.content, keep_paragraphs=True)
             if clean_content:
                 content_parts.append(clean_content)
 
@@ -0,0 +1,123 @@
+"""Download small media at scrape time and ship it inside the upload job."""
+
+import asyncio
+import base64
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from src.config import Settings
+from src.models import MediaUploadJobData
+from src.scraper.media_probe import GENERIC_TYPE, MEDIA_TYPE_PREFIXES
+
+logger = logging.getLogger(__name__)
+
+INLINED_TYPE_PREFIXES = (*MEDIA_TYPE_PREFIXES, GENERIC_TYPE)
+
+
+@dataclass
+class InlineBudget:
+    """Bytes a collector job may still inline, shared by its downloads."""
+
+    remaining: int
+
+
+class MediaInliner:
+    """
+    Turns upload jobs of small media into buffer jobs.
+
+    The media worker otherwise downloads every file from its origin again,
+    a second network hop that fails once signed CDN links expire. Files up to
+    MEDIA_INLINE_MAX_BYTES are downloaded here, concurrently, until the
+    collector job has used MEDIA_INLINE_JOB_BUDGET bytes; everything else
+    (larger files, failed downloads, budget exhausted) stays a URL job.
+    """
+
+    def __init__(self, settings: Settings, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize media inliner with settings."""
+        self.settings = settings
+        self.max_bytes = settings.media_inline_max_bytes
+        self.job_budget = settings.media_inline_job_budget
+        self.semaphore = asyncio.Semaphore(settings.media_inline_concurrency)
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=settings.media_inline_timeout,
+            headers={"User-Agent": settings.rss_user_agent},
+            follow_redirects=True,
+        )
+
+    async def inline(self, jobs: list[MediaUploadJobData]) -> list[MediaUploadJobData]:
+        """
+        Download small media of a collector job into its upload jobs.
+
+        Args:
+            jobs: Upload jobs of one collector job
+
+        Returns:
+            The jobs, small media as source="buffer" (sourceUrl is kept)
+        """
+        budget = InlineBudget(self.job_budget)
+
+        async def inline_job(job: MediaUploadJobData) -> MediaUploadJobData:
+            if job.source != "url" or not job.sourceUrl:
+                return job
+            content = await self._download(job.sourceUrl, budget)
+            if not content:
+                return job
+            return job.model_copy(
+                update={"source": "buffer", "buffer": base64.b64encode(content).decode("ascii")},
+            )
+
+        inlined = await asyncio.gather(*(inline_job(job) for job in jobs))
+
+        count = sum(1 for job in inlined if job.source == "buffer")
+        if count:
+            logger.debug(
+                f"Inlined {count} of {len(jobs)} media files "
+                f"({self.job_budget - budget.remaining} bytes)",
+            )
+        return list(inlined)
+
+    async def _download(self, url: str, budget: InlineBudget) -> Optional[bytes]:
+        """
+        Download a file if it fits the size limit and the remaining budget.
+
+        Bytes are taken from the budget as they arrive and given back when the
+        download is abandoned.
+
+        Returns:
+            The content, or None to leave the file to the media worker
+        """
+        taken = 0
+        async with self.semaphore:
+            try:
+                async with self.http_client.stream("GET", url) as response:
+                    content_type = response.headers.get("Content-Type", "").split(";")[0]
+                    length = response.headers.get("Content-Length", "")
+                    limit = min(self.max_bytes, budget.remaining)
+                    if (
+                        not response.is_success
+                        # An error page served with 200 is not inlined in place of the media
+                        or not content_type.strip().lower().startswith(INLINED_TYPE_PREFIXES)
+                        or (length.isdigit() and int(length) > limit)
+                    ):
+                        return None
+
+                    chunks = []
+                    async for chunk in response.aiter_bytes():
+                        if taken + len(chunk) > self.max_bytes or len(chunk) > budget.remaining:
+                            budget.remaining += taken
+                            return None
+                        budget.remaining -= len(chunk)
+                        taken += len(chunk)
+                        chunks.append(chunk)
+                    return b"".join(chunks)
+            except httpx.HTTPError as e:
+                logger.debug(f"Inlining media {url} failed: {e}")
+                budget.remaining += taken
+                return None
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self.http_client.aclose()
@@ -0,0 +1,193 @@
+"""Pre-flight check of media URLs before their upload jobs are queued."""
+
+import asyncio
+import logging
+import posixpath
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from src.config import Settings
+from src.models import FetchedPost, MediaUploadJobData
+from src.scraper.mappers import get_extension_from_content_type
+
+logger = logging.getLogger(__name__)
+
+# Responses that mean the media is gone for good
+DEAD_STATUSES = (httpx.codes.NOT_FOUND, httpx.codes.GONE)
+# Servers that refuse HEAD (or answer it without headers) are asked for one byte instead
+HEAD_REFUSED_STATUSES = (
+    httpx.codes.FORBIDDEN,
+    httpx.codes.METHOD_NOT_ALLOWED,
+    httpx.codes.NOT_IMPLEMENTED,
+)
+# Declared types that are uploaded; anything else (an HTML error page) is dropped
+MEDIA_TYPE_PREFIXES = ("image/", "video/", "audio/", "application/pdf")
+GENERIC_TYPE = "application/octet-stream"
+
+
+@dataclass
+class ProbeResult:
+    """What the media server reported for a URL."""
+
+    status_code: int
+    content_type: Optional[str]
+    size: Optional[int]
+
+
+class MediaProbe:
+    """
+    Checks media URLs with HEAD (or a one byte Range GET) before uploading them.
+
+    Extensions and content types are otherwise guessed from the URL, and every
+    URL is queued, dead links and huge videos included, for the media worker to
+    download. The probe drops URLs that are gone, not media or larger than
+    MEDIA_PROBE_MAX_BYTES, and fixes the content type and extension of the rest.
+    Probe failures (timeouts, 5xx) keep the job as it is.
+    """
+
+    def __init__(self, settings: Settings, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize media probe with settings."""
+        self.settings = settings
+        self.max_bytes = settings.media_probe_max_bytes
+        self.semaphore = asyncio.Semaphore(settings.media_probe_concurrency)
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=settings.media_probe_timeout,
+            headers={"User-Agent": settings.rss_user_agent},
+            follow_redirects=True,
+        )
+
+    async def check(
+        self,
+        posts: list[FetchedPost],
+        jobs: list[MediaUploadJobData],
+    ) -> list[MediaUploadJobData]:
+        """
+        Probe the URLs of upload jobs and drop or correct the jobs.
+
+        mediaUrls of the posts follow: dropped media is removed and corrected
+        extensions are renamed.
+
+        Args:
+            posts: Posts the jobs were created for
+            jobs: Upload jobs of the posts
+
+        Returns:
+            Jobs to publish
+        """
+        urls = {job.sourceUrl for job in jobs if job.sourceUrl}
+        results = dict(zip(urls, await asyncio.gather(*(self._probe(url) for url in urls))))
+
+        kept: list[MediaUploadJobData] = []
+        renamed: dict[str, Optional[str]] = {}
+        for job in jobs:
+            result = results.get(job.sourceUrl or "")
+            if result is None:
+                kept.append(job)
+                continue
+
+            reason = self._rejection(result)
+            if reason:
+                logger.info(
+                    f"Dropping media {job.sourceUrl} of post {job.postExternalId}: {reason}",
+                )
+                renamed[job.targetPath] = None
+                continue
+
+            checked = self._apply(job, result)
+            if checked.targetPath != job.targetPath:
+                renamed[job.targetPath] = checked.targetPath
+            kept.append(checked)
+
+        if renamed:
+            for post in posts:
+                post.mediaUrls = [
+                    renamed.get(path, path)
+                    for path in post.mediaUrls
+                    if renamed.get(path, path) is not None
+                ]
+
+        return kept
+
+    async def _probe(self, url: str) -> Optional[ProbeResult]:
+        """Get status, type and size of a URL, or None when the server could not tell."""
+        async with self.semaphore:
+            try:
+                response = await self.http_client.head(url)
+                if response.status_code in HEAD_REFUSED_STATUSES or (
+                    response.is_success and "Content-Type" not in response.headers
+                ):
+                    return await self._probe_range(url)
+            except httpx.HTTPError as e:
+                logger.debug(f"Probing media {url} failed: {e}")
+                return None
+
+        if response.status_code in DEAD_STATUSES or response.is_success:
+            length = response.headers.get("Content-Length", "")
+            return ProbeResult(
+                status_code=response.status_code,
+                content_type=self._media_type(response),
+                size=int(length) if length.isdigit() else None,
+            )
+        return None
+
+    async def _probe_range(self, url: str) -> Optional[ProbeResult]:
+        """Ask for the first byte; the total size comes from Content-Range."""
+        async with self.http_client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+            if not (response.status_code in DEAD_STATUSES or response.is_success):
+                return None
+
+            # "bytes 0-0/12345"; a server ignoring Range sends the whole length instead
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+            if not total.isdigit():
+                total = response.headers.get("Content-Length", "")
+            return ProbeResult(
+                status_code=response.status_code,
+                content_type=self._media_type(response),
+                size=int(total) if total.isdigit() else None,
+            )
+
+    @staticmethod
+    def _media_type(response: httpx.Response) -> Optional[str]:
+        """Get the declared type without parameters."""
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        return content_type or None
+
+    def _rejection(self, result: ProbeResult) -> Optional[str]:
+        """Get why a probed URL must not be uploaded, or None to upload it."""
+        if result.status_code in DEAD_STATUSES:
+            return f"HTTP {result.status_code}"
+        content_type = result.content_type
+        # application/octet-stream is all some servers declare for media
+        if content_type not in (None, GENERIC_TYPE) and not self._is_media(content_type):
+            return f"not media ({content_type})"
+        if self.max_bytes and result.size is not None and result.size > self.max_bytes:
+            return f"{result.size} bytes, more than the {self.max_bytes} allowed"
+        return None
+
+    @staticmethod
+    def _is_media(content_type: str) -> bool:
+        """Check a declared type is one of the uploaded media types."""
+        return content_type.startswith(MEDIA_TYPE_PREFIXES)
+
+    @classmethod
+    def _apply(cls, job: MediaUploadJobData, result: ProbeResult) -> MediaUploadJobData:
+        """Set the probed content type, and the extension that goes with it."""
+        if not result.content_type or not cls._is_media(result.content_type):
+            return job
+
+        extension = get_extension_from_content_type(result.content_type)
+        target_path = job.targetPath
+        if extension != "bin":
+            # Only the file name's extension: directories may contain dots too
+            directory, name = posixpath.split(target_path)
+            target_path = posixpath.join(directory, f"{posixpath.splitext(name)[0]}.{extension}")
+
+        return job.model_copy(
+            update={"contentType": result.content_type, "targetPath": target_path},
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self.http_client.aclose()
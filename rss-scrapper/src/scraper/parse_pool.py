@@ -0,0 +1,100 @@
+"""Process pool that parses feed bodies on other cores than the event loop."""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional
+
+from src.scraper.rss_scraper import RssFeedEntry, RssFeedInfo, RssParseError, parse_feed_body
+
+logger = logging.getLogger(__name__)
+
+# Field values of a dataclass, in field order: pickles without a class reference and
+# attribute names per entry
+CompactRecord = tuple[Any, ...]
+
+
+def _parse_compact(
+    feed_url: str,
+    body: bytes,
+    encoding: Optional[str],
+    parser_mode: str,
+) -> tuple[CompactRecord, list[CompactRecord]]:
+    """Parse a body in a worker process and return it as plain tuples."""
+    feed_info, entries = parse_feed_body(feed_url, body, encoding, parser_mode)
+    return tuple(vars(feed_info).values()), [tuple(vars(entry).values()) for entry in entries]
+
+
+class ParsePool:
+    """
+    Parses feed bodies in worker processes.
+
+    Parsing (feedparser in particular) and HTML stripping are CPU-bound and hold
+    the GIL, so with one process WORKER_CONCURRENCY only overlaps downloads.
+    Fetching stays in the event loop; the raw body is sent to a worker, which
+    returns compact tuples that are turned back into RssFeedEntry here.
+    """
+
+    def __init__(self, processes: int):
+        """
+        Initialize pool.
+
+        Args:
+            processes: Number of worker processes (started on first use)
+        """
+        self.processes = processes
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create the executor; spawned, as forking a process running an event loop is unsafe."""
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    async def parse(
+        self,
+        feed_url: str,
+        body: bytes,
+        encoding: Optional[str],
+        parser_mode: str,
+    ) -> tuple[RssFeedInfo, list[RssFeedEntry]]:
+        """
+        Parse a feed body in a worker process.
+
+        Args:
+            feed_url: URL of the feed
+            body: Raw response body
+            encoding: Charset of the response
+            parser_mode: RSS_PARSER_MODE
+
+        Returns:
+            Feed info and entries in document order
+
+        Raises:
+            RssParseError: No feed data found, or the worker process died
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            feed_info, entries = await loop.run_in_executor(
+                executor,
+                functools.partial(_parse_compact, feed_url, body, encoding, parser_mode),
+            )
+        except BrokenProcessPool as e:
+            # A dead worker (e.g. killed for memory) breaks the whole executor,
+            # so replace it for the next bodies; other jobs may have replaced it already
+            if self._executor is executor:
+                logger.error(f"Parse worker process died parsing {feed_url}, restarting pool")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+            raise RssParseError(f"Parse worker process died parsing {feed_url}") from e
+
+        return RssFeedInfo(*feed_info), [RssFeedEntry(*entry) for entry in entries]
+
+    def close(self) -> None:
+        """Stop the worker processes without waiting for queued bodies."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,12 +2,25 @@
 
 import logging
 import time
+from typing import Optional
 
-from bullmq import Job, Worker
+from bullmq import DelayedError, Job, UnrecoverableError, Worker
+from redis.asyncio import Redis
 
 from src.config import Settings
-from src.models import CollectorJobData
-from src.scraper.rss_scraper import RssScraper
+from src.models import CollectorJobData, FetchedPost, MediaUploadJobData
+from src.scraper.feed_cache import FeedValidators, FeedValidatorStore
+from src.scraper.host_limiter import HostThrottledError
+from src.scraper.rss_scraper import (
+    RssFetchError,
+    RssFetchResult,
+    RssResponseRejectedError,
+    RssScraper,
+)
+from src.scraper.media_index import MediaIndex
+from src.scraper.media_inline import MediaInliner
+from src.scraper.media_probe import MediaProbe
+from src.scraper.seen_index import SeenIndex
 from src.scraper.mappers import RssEntryMapper
 from src.scraper.result_publisher import ResultPublisher
 from src.scraper.media_upload_publisher import MediaUploadPublisher
@@ -24,12 +37,24 @@ class RssQueueWorker:
         scraper: RssScraper,
         publisher: ResultPublisher,
         media_publisher: MediaUploadPublisher,
+        validator_store: Optional[FeedValidatorStore] = None,
+        seen_index: Optional[SeenIndex] = None,
+        media_index: Optional[MediaIndex] = None,
+        media_probe: Optional[MediaProbe] = None,
+        media_inliner: Optional[MediaInliner] = None,
+        redis: Optional[Redis] = None,
     ):
         """Initialize queue worker."""
         self.settings = settings
         self.scraper = scraper
         self.publisher = publisher
         self.media_publisher = media_publisher
+        self.validator_store = validator_store
+        self.seen_index = seen_index
+        self.media_index = media_index
+        self.media_probe = media_probe
+        self.media_inliner = media_inliner
+        self.redis = redis
         self.worker: Worker | None = None
 
     def start(self) -> None:
@@ -42,7 +67,7 @@ class RssQueueWorker:
             self.settings.rss_fetcher_queue,
             self._process_job,
             {
-                "connection": self.settings.redis_url,
+                "connection": self.redis if self.redis is not None else self.settings.redis_url,
                 "concurrency": self.settings.worker_concurrency,
             },
         )
@@ -80,32 +105,35 @@ class RssQueueWorker:
                 f"(sourceId={job_data.sourceId}, limit={job_data.limit}, cursor={job_data.cursor})",
             )
 
+            validators, seen_ids = await self._load_poll_state(job_data)
+
             # Fetch RSS feed using scraper
-            entries, feed_info, next_cursor = self.scraper.fetch_feed(
+            result = await self.scraper.fetch_feed(
                 feed_url=job_data.externalId,
                 limit=job_data.limit,
                 cursor=job_data.cursor,
+                validators=validators,
+                seen_ids=seen_ids,
             )
 
             # Map entries to FetchedPost format and collect media upload jobs
             fetched_posts = []
             all_media_jobs = []
 
-            for entry in entries:
+            for entry in result.entries:
                 fetched_post, media_jobs = RssEntryMapper.to_fetched_post(
                     entry,
-                    feed_info,
+                    result.feed_info,
                     source_id=job_data.sourceId,
                 )
                 fetched_posts.append(fetched_post)
                 all_media_jobs.extend(media_jobs)
 
-            # Queue media upload jobs in bulk
-            if all_media_jobs:
-                await self.media_publisher.publish_bulk(all_media_jobs)
-                logger.info(
-                    f"Queued {len(all_media_jobs)} media upload jobs for source {job_data.sourceId}",
-                )
+            all_media_jobs = await self._queue_media(
+                fetched_posts,
+                all_media_jobs,
+                job_data.sourceId,
+            )
 
             # Calculate processing time
             processing_time = int(
@@ -119,55 +147,168 @@ class RssQueueWorker:
                 collector_job_id=job_id,
                 orchestrator_job_id=job_data.metadata.orchestratorJobId,
                 posts=fetched_posts,
-                next_cursor=next_cursor,
+                next_cursor=result.next_cursor,
                 processing_time=processing_time,
                 priority=job_data.priority,
             )
 
+            # Only remember emitted entries and validators once the result is safely
+            # published, so a retried job re-reads the feed instead of skipping it
+            await self._save_poll_state(job_data, fetched_posts, result)
+
             logger.info(
                 f"Successfully processed job {job_id}: {len(fetched_posts)} posts, "
                 f"{len(all_media_jobs)} media files",
             )
 
-        except Exception as error:
+        except HostThrottledError as error:
+            if not self._defer_expired(job, error):
+                # Not a failure: put the job back until the host accepts requests again
+                logger.info(
+                    f"Deferring job {job_id} until {error.retry_at.isoformat()}: {error}",
+                )
+                await job.moveToDelayed(int(error.retry_at.timestamp() * 1000), token)
+                raise DelayedError() from error
+
+            # The host kept refusing for too long: fail the job like any fetch error
             error_occurred = True
-            # Calculate processing time
-            processing_time = int(
-                (time.time() * 1000) - start_time,
+            error_instance = RssFetchError(
+                f"{error}; not deferred again, the job is older than "
+                f"{self.settings.rss_host_max_defer:.0f}s",
             )
+            await self._publish_failure(job, job_id, error_instance, start_time)
 
+        except Exception as error:
+            error_occurred = True
             error_instance = error if isinstance(error, Exception) else Exception(str(error))
+            await self._publish_failure(job, job_id, error_instance, start_time)
 
-            logger.error(
-                f"Failed to process job {job_id}: {error_instance}",
-                exc_info=True,
+        # Re-raise error after publishing result to trigger BullMQ retry mechanism
+        if error_occurred and error_instance:
+            if isinstance(error_instance, RssResponseRejectedError):
+                # Fail the job for good instead of downloading the same response again
+                raise UnrecoverableError(str(error_instance)) from error_instance
+            raise error_instance
+
+    async def _load_poll_state(
+        self,
+        job_data: CollectorJobData,
+    ) -> tuple[Optional[FeedValidators], Optional[set[str]]]:
+        """Load the validators of the previous fetch and the entries already emitted."""
+        # Validators from the previous fetch allow a conditional GET
+        validators = None
+        if self.validator_store:
+            validators = await self.validator_store.get(job_data.externalId)
+
+        seen_ids = None
+        if self.seen_index:
+            seen_ids = await self.seen_index.load(job_data.sourceId)
+
+        return validators, seen_ids
+
+    async def _save_poll_state(
+        self,
+        job_data: CollectorJobData,
+        posts: list[FetchedPost],
+        result: RssFetchResult,
+    ) -> None:
+        """Remember the emitted entries and the validators of this fetch."""
+        if self.seen_index:
+            await self.seen_index.add(
+                job_data.sourceId,
+                [post.externalId for post in posts],
             )
+        if self.validator_store and result.validators:
+            await self.validator_store.save(job_data.externalId, result.validators)
+
+    async def _queue_media(
+        self,
+        posts: list[FetchedPost],
+        media_jobs: list[MediaUploadJobData],
+        source_id: str,
+    ) -> list[MediaUploadJobData]:
+        """
+        Check, deduplicate and inline the media upload jobs of posts, then queue them.
+
+        Args:
+            posts: Posts whose mediaUrls follow the changes made to the jobs
+            media_jobs: Upload jobs of the posts' media
+            source_id: Source the posts belong to
+
+        Returns:
+            The upload jobs that were queued
+        """
+        # Drop dead, non-media and oversized files, fix guessed types and extensions
+        if self.media_probe and media_jobs:
+            media_jobs = await self.media_probe.check(posts, media_jobs)
+
+        # Media already uploaded or queued (for any post or source) keeps its key
+        if self.media_index:
+            media_jobs = await self.media_index.claim(posts, media_jobs)
 
-            # Try to get job data for error reporting
+        # Ship small files inside their jobs, saving the media worker a download
+        if self.media_inliner and media_jobs:
+            media_jobs = await self.media_inliner.inline(media_jobs)
+
+        # Queue media upload jobs in bulk
+        if media_jobs:
             try:
-                job_data = CollectorJobData.model_validate(
-                    job.data,
-                    from_attributes=True,
-                )
+                await self.media_publisher.publish_bulk(media_jobs)
+            except Exception:
+                # Later posts must not resolve to uploads that were never queued
+                if self.media_index:
+                    await self.media_index.release(media_jobs)
+                raise
+            logger.info(
+                f"Queued {len(media_jobs)} media upload jobs for source {source_id}",
+            )
 
-                # Publish error result
-                await self.publisher.publish_error(
-                    source_id=job_data.sourceId,
-                    source_type=job_data.sourceType,
-                    collector_job_id=job_id,
-                    orchestrator_job_id=job_data.metadata.orchestratorJobId,
-                    error=error_instance,
-                    processing_time=processing_time,
-                    priority=job_data.priority,
-                )
-            except Exception as parse_error:
-                logger.error(
-                    f"Failed to parse job data for error reporting: {parse_error}",
-                )
+        return media_jobs
 
-        # Re-raise error after publishing result to trigger BullMQ retry mechanism
-        if error_occurred and error_instance:
-            raise error_instance
+    def _defer_expired(self, job: Job, error: HostThrottledError) -> bool:
+        """Check a throttled job would be deferred past RSS_HOST_MAX_DEFER after its creation."""
+        deadline = job.timestamp / 1000 + self.settings.rss_host_max_defer
+        return error.retry_at.timestamp() > deadline
+
+    async def _publish_failure(
+        self,
+        job: Job,
+        job_id: str,
+        error: Exception,
+        start_time: float,
+    ) -> None:
+        """Log a failed job and publish its error result."""
+        # Calculate processing time
+        processing_time = int(
+            (time.time() * 1000) - start_time,
+        )
+
+        logger.error(
+            f"Failed to process job {job_id}: {error}",
+            exc_info=True,
+        )
+
+        # Try to get job data for error reporting
+        try:
+            job_data = CollectorJobData.model_validate(
+                job.data,
+                from_attributes=True,
+            )
+
+            # Publish error result
+            await self.publisher.publish_error(
+                source_id=job_data.sourceId,
+                source_type=job_data.sourceType,
+                collector_job_id=job_id,
+                orchestrator_job_id=job_data.metadata.orchestratorJobId,
+                error=error,
+                processing_time=processing_time,
+                priority=job_data.priority,
+            )
+        except Exception as parse_error:
+            logger.error(
+                f"Failed to parse job data for error reporting: {parse_error}",
+            )
 
     async def stop(self) -> None:
         """Stop the queue worker gracefully."""
@@ -176,9 +317,20 @@ class RssQueueWorker:
         if self.worker:
             await self.worker.close()
 
-        self.scraper.close()
+        await self.scraper.close()
+        # Closing the publisher flushes results still waiting in a batch
         await self.publisher.close()
         await self.media_publisher.close()
+        if self.validator_store:
+            await self.validator_store.close()
+        if self.seen_index:
+            await self.seen_index.close()
+        if self.media_index:
+            await self.media_index.close()
+        if self.media_probe:
+            await self.media_probe.close()
+        if self.media_inliner:
+            await self.media_inliner.close()
 
         logger.info("RSS queue worker stopped")
 
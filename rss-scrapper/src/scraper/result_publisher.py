@@ -1,28 +1,72 @@
 """Result publisher for posting results to BullMQ results queue."""
 
+import asyncio
 import logging
 from datetime import datetime
+from typing import Any, Optional
 
 from bullmq import Queue
+from redis.asyncio import Redis
 
 from src.config import Settings
 from src.models import ErrorData, FetchedPost, ResultJobData, ResultJobMetadata
+from src.scraper.result_encoding import check_codec, encode_posts
+from src.scraper.rss_scraper import RssFetchError, RssParseError, RssResponseRejectedError
 
 logger = logging.getLogger(__name__)
 
+# Error codes of messages containing any of the patterns, the first match wins
+ErrorCodeTable = tuple[tuple[tuple[str, ...], str], ...]
+
+FETCH_ERROR_CODES: ErrorCodeTable = (
+    (("404", "not found"), "FEED_NOT_FOUND_ERROR"),
+    (("401", "403"), "FEED_ACCESS_DENIED_ERROR"),
+    (("timeout",), "TIMEOUT_ERROR"),
+)
+HTTP_ERROR_CODES: ErrorCodeTable = (
+    (("404",), "FEED_NOT_FOUND_ERROR"),
+    (("401", "403"), "FEED_ACCESS_DENIED_ERROR"),
+    (("429",), "RATE_LIMIT_ERROR"),
+    (("500", "502", "503"), "SERVER_ERROR"),
+)
+GENERIC_ERROR_CODES: ErrorCodeTable = (
+    (("connection", "network"), "CONNECTION_ERROR"),
+    (("timeout",), "TIMEOUT_ERROR"),
+)
+
+# Scraper errors, or errors whose message has the keyword: (types, keyword,
+# codes by message, code when no message pattern matches)
+ERROR_TYPE_CODES: tuple[tuple[type[Exception], str, ErrorCodeTable, str], ...] = (
+    (RssFetchError, "fetch", FETCH_ERROR_CODES, "FETCH_ERROR"),
+    (RssParseError, "parse", (), "PARSE_ERROR"),
+)
+
+
+def _match_error_code(error_message: str, codes: ErrorCodeTable) -> Optional[str]:
+    """Get the code of the first entry with a pattern in the message."""
+    for patterns, code in codes:
+        if any(pattern in error_message for pattern in patterns):
+            return code
+    return None
+
 
 class ResultPublisher:
     """Publisher for posting fetch results to BullMQ results queue."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
         """Initialize result publisher with settings."""
+        check_codec(settings.result_encoding)
         self.settings = settings
         self.queue = Queue(
             settings.fetch_results_queue,
             {
-                "connection": settings.redis_url,
+                "connection": redis if redis is not None else settings.redis_url,
             },
         )
+        # Pending results when batching is enabled: (job data, job options, future
+        # resolved once the batch containing the result has been added)
+        self._batch: list[tuple[dict[str, Any], dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def publish_success(
         self,
@@ -47,41 +91,50 @@ class ResultPublisher:
             next_cursor: Next cursor for pagination
             processing_time: Processing time in milliseconds
             priority: Job priority
-        """
-        result_job = ResultJobData(
-            sourceId=source_id,
-            sourceType=source_type,
-            status="success",
-            posts=posts,
-            nextCursor=next_cursor,
-            processingTime=processing_time,
-            metadata=ResultJobMetadata(
-                collectorJobId=collector_job_id,
-                orchestratorJobId=orchestrator_job_id,
-                fetchedAt=datetime.utcnow(),
-            ),
-        )
 
-        # Convert to dict for BullMQ (handling datetime serialization)
-        job_data = result_job.model_dump(mode="json", by_alias=True)
-
-        await self.queue.add(
-            "process-result",
-            job_data,
-            {
-                "priority": priority,
-                "attempts": 5,
-                "backoff": {
-                    "type": "exponential",
-                    "delay": 2000,
-                },
-                "removeOnComplete": 100,
-                "removeOnFail": 1000,
-            },
-        )
+        Posts larger than result_chunk_max_bytes in total are split over several
+        result jobs. Each carries chunkIndex/chunkTotal, and only the last one
+        carries next_cursor so the consumer advances the cursor once.
+        """
+        chunks = self._chunk_posts(posts, self.settings.result_chunk_max_bytes)
+        chunked = len(chunks) > 1
+        fetched_at = datetime.utcnow()
+
+        jobs_data = []
+        for index, chunk in enumerate(chunks):
+            is_last = index == len(chunks) - 1
+            result_job = ResultJobData(
+                sourceId=source_id,
+                sourceType=source_type,
+                status="success",
+                posts=chunk,
+                nextCursor=next_cursor if is_last else None,
+                chunkIndex=index if chunked else None,
+                chunkTotal=len(chunks) if chunked else None,
+                processingTime=processing_time,
+                metadata=ResultJobMetadata(
+                    collectorJobId=collector_job_id,
+                    orchestratorJobId=orchestrator_job_id,
+                    fetchedAt=fetched_at,
+                ),
+            )
+
+            # Convert to dict for BullMQ (handling datetime serialization)
+            job_data = result_job.model_dump(mode="json", by_alias=True)
+            if self.settings.result_encoding != "json":
+                job_data["postsEncoded"] = encode_posts(
+                    job_data.pop("posts"),
+                    self.settings.result_encoding,
+                )
+                job_data["posts"] = None
+                job_data["encoding"] = self.settings.result_encoding
+            jobs_data.append(job_data)
+
+        await self._add(jobs_data, priority)
 
         logger.info(
-            f"Published success result for source {source_id}: {len(posts)} posts",
+            f"Published success result for source {source_id}: {len(posts)} posts"
+            + (f" in {len(chunks)} chunks" if chunked else ""),
         )
 
     async def publish_error(
@@ -131,67 +184,136 @@ class ResultPublisher:
         # Convert to dict for BullMQ
         job_data = result_job.model_dump(mode="json", by_alias=True)
 
-        await self.queue.add(
-            "process-result",
-            job_data,
-            {
-                "priority": priority,
-                "attempts": 5,
-                "backoff": {
-                    "type": "exponential",
-                    "delay": 2000,
-                },
-                "removeOnComplete": 100,
-                "removeOnFail": 1000,
-            },
-        )
+        await self._add([job_data], priority)
 
         logger.info(
             f"Published error result for source {source_id}: {error_code} - {str(error)}",
         )
 
+    @staticmethod
+    def _chunk_posts(posts: list[FetchedPost], max_bytes: int) -> list[list[FetchedPost]]:
+        """
+        Split posts into consecutive chunks of at most max_bytes of JSON each.
+
+        A single post larger than max_bytes gets a chunk of its own. There is
+        always at least one (possibly empty) chunk.
+        """
+        if max_bytes <= 0:
+            return [posts]
+
+        chunks: list[list[FetchedPost]] = []
+        current: list[FetchedPost] = []
+        current_size = 0
+
+        for post in posts:
+            size = len(post.model_dump_json(by_alias=True).encode())
+            if current and current_size + size > max_bytes:
+                chunks.append(current)
+                current = []
+                current_size = 0
+            current.append(post)
+            current_size += size
+
+        chunks.append(current)
+        return chunks
+
+    async def _add(self, jobs_data: list[dict[str, Any]], priority: int) -> None:
+        """
+        Add result jobs, either directly or through the current batch.
+
+        With batching enabled the call returns once the batch holding the results
+        has been written, so callers can rely on the results being queued.
+        """
+        opts = {
+            "priority": priority,
+            "attempts": 5,
+            "backoff": {
+                "type": "exponential",
+                "delay": 2000,
+            },
+            "removeOnComplete": 100,
+            "removeOnFail": 1000,
+        }
+
+        if not self.settings.result_batch_enabled:
+            # One by one, in order, so the chunk carrying the cursor is queued last
+            for job_data in jobs_data:
+                await self.queue.add("process-result", job_data, opts)
+            return
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for job_data in jobs_data:
+            future = loop.create_future()
+            self._batch.append((job_data, opts, future))
+            futures.append(future)
+
+        if len(self._batch) >= self.settings.result_batch_max_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+        await asyncio.gather(*futures)
+
+    async def _flush_after_delay(self) -> None:
+        """Flush the current batch once the maximum delay has passed."""
+        await asyncio.sleep(self.settings.result_batch_max_delay_ms / 1000)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered results to the queue in a single addBulk call."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        try:
+            await self.queue.addBulk(
+                [
+                    {"name": "process-result", "data": job_data, "opts": opts}
+                    for job_data, opts, _ in batch
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish batch of {len(batch)} results: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+        logger.debug(f"Published batch of {len(batch)} results")
+
     async def close(self) -> None:
-        """Close the queue connection."""
+        """Flush buffered results and close the queue connection."""
+        await self.flush()
         await self.queue.close()
 
     @staticmethod
     def _get_error_code(error: Exception) -> str:
         """Get error code based on error type."""
-        error_name = type(error).__name__
-        error_message = str(error).lower()
-
-        # Check for specific RSS errors
-        if "RssFetchError" in error_name or "fetch" in error_message:
-            if "404" in error_message or "not found" in error_message:
-                return "FEED_NOT_FOUND_ERROR"
-            if "401" in error_message or "403" in error_message:
-                return "FEED_ACCESS_DENIED_ERROR"
-            if "timeout" in error_message:
-                return "TIMEOUT_ERROR"
-            return "FETCH_ERROR"
+        # Responses rejected before parsing carry their own code
+        if isinstance(error, RssResponseRejectedError):
+            return error.code
 
-        if "RssParseError" in error_name or "parse" in error_message:
-            return "PARSE_ERROR"
+        error_message = str(error).lower()
+        for error_types, keyword, message_codes, default in ERROR_TYPE_CODES:
+            if isinstance(error, error_types) or keyword in error_message:
+                return _match_error_code(error_message, message_codes) or default
 
-        # Check for HTTP status codes
+        # Generic errors are classified by their message only
         if "http" in error_message:
-            if "404" in error_message:
-                return "FEED_NOT_FOUND_ERROR"
-            if "401" in error_message or "403" in error_message:
-                return "FEED_ACCESS_DENIED_ERROR"
-            if "429" in error_message:
-                return "RATE_LIMIT_ERROR"
-            if "500" in error_message or "502" in error_message or "503" in error_message:
-                return "SERVER_ERROR"
-
-        # Check for connection errors
-        if "connection" in error_message or "network" in error_message:
-            return "CONNECTION_ERROR"
-
-        if "timeout" in error_message:
-            return "TIMEOUT_ERROR"
-
-        return "COLLECTION_ERROR"
+            code = _match_error_code(error_message, HTTP_ERROR_CODES)
+            if code:
+                return code
+        return _match_error_code(error_message, GENERIC_ERROR_CODES) or "COLLECTION_ERROR"
 
     @staticmethod
     def _is_retryable_error(error: Exception) -> bool:
@@ -199,6 +321,10 @@ class ResultPublisher:
         error_name = type(error).__name__
         error_message = str(error).lower()
 
+        # The source's URL does not serve a feed, fetching it again will not change that
+        if isinstance(error, RssResponseRejectedError):
+            return False
+
         # Non-retryable errors
         non_retryable_patterns = [
             "404",
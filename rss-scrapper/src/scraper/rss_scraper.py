@@ -1,43 +1,38 @@
 """RSS feed scraper using feedparser."""
 
-import html
+import codecs
+import hashlib
 import logging
-import re
+from collections import deque
+from contextlib import aclosing, nullcontext
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, AbstractSet, Any, AsyncContextManager, AsyncIterator, Optional
 
 import feedparser
 import httpx
 
 from src.config import Settings
+from src.scraper.feed_cache import FeedValidators
+from src.scraper.html_text import strip_html_tags
+from src.scraper.http_transport import ConnectionStats, PooledTransport, proxy_mounts
 
-logger = logging.getLogger(__name__)
-
-
-def strip_html_tags(text: str) -> str:
-    """
-    Remove HTML tags from text and decode HTML entities.
-
-    Args:
-        text: Text potentially containing HTML
-
-    Returns:
-        Clean text without HTML tags
-    """
-    if not text:
-        return ""
-
-    # Remove HTML tags
-    clean = re.sub(r"<[^>]+>", "", text)
+if TYPE_CHECKING:
+    from src.scraper.feed_stream import FeedStreamParser
+    from src.scraper.host_limiter import HostLimiter
+    from src.scraper.parse_pool import ParsePool
 
-    # Decode HTML entities (e.g., &amp; -> &, &lt; -> <)
-    clean = html.unescape(clean)
+logger = logging.getLogger(__name__)
 
-    # Normalize whitespace
-    clean = re.sub(r"\s+", " ", clean).strip()
+# Error codes of responses that are rejected without being parsed
+FEED_TOO_LARGE_ERROR = "FEED_TOO_LARGE_ERROR"
+NOT_A_FEED_ERROR = "NOT_A_FEED_ERROR"
 
-    return clean
+# Bytes at the start of a body sniffed to tell feeds from other documents
+SNIFF_BYTES = 1024
+FEED_MARKERS = (b"<rss", b"<feed", b"<rdf")
+# Declared types that are never a feed (feeds are often served as text/html, so that is sniffed)
+REJECTED_CONTENT_TYPES = ("audio/", "video/", "image/", "application/pdf", "application/zip")
 
 
 @dataclass
@@ -70,9 +65,70 @@ class RssFeedInfo:
 class RssFetchResult:
     """Result of RSS feed fetch."""
 
-    feed_info: RssFeedInfo
+    feed_info: Optional[RssFeedInfo]  # None when the feed was not modified
     entries: list[RssFeedEntry]
-    next_cursor: Optional[str]  # Last processed entry ID for pagination
+    next_cursor: Optional[str]  # Newest processed entry ID, where the next poll stops
+    not_modified: bool = False  # 304 response or identical body, nothing was parsed
+    validators: Optional[FeedValidators] = None  # Validators to store once results are published
+
+
+class EntryWindow:
+    """
+    Picks the entries a poll returns from a feed read newest first.
+
+    The cursor is the newest entry returned by an earlier poll, so reading stops
+    at it, and entries in the seen set are skipped. Without a cursor, the newest
+    entries up to the limit are returned. With one, when more entries than the
+    limit are newer than the cursor, the oldest of them are returned and the
+    cursor moves to the newest returned one; the following polls work off the rest.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int],
+        cursor: Optional[str],
+        seen_ids: Optional[AbstractSet[str]],
+    ):
+        """Initialize an empty window."""
+        self.limit = limit
+        self.cursor = cursor
+        self.seen_ids = seen_ids
+        # Once full, the window drops its newest entries, so a backlog goes out oldest first
+        self.entries: deque[RssFeedEntry] = deque(maxlen=limit or None)
+        self.first_id: Optional[str] = None
+        self.truncated = False
+
+    def add(self, entry: RssFeedEntry) -> bool:
+        """
+        Offer the next entry of the feed.
+
+        Returns:
+            False once the rest of the feed does not need to be read
+        """
+        if self.first_id is None:
+            self.first_id = entry.id
+
+        # Everything from the cursor on was processed by an earlier poll
+        if self.cursor is not None and entry.id == self.cursor:
+            return False
+
+        if self.seen_ids is not None and entry.id in self.seen_ids:
+            return True
+
+        if self.limit and len(self.entries) >= self.limit:
+            self.truncated = True
+            if self.cursor is None:
+                return False
+        self.entries.append(entry)
+        return True
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Get the cursor the next poll starts from."""
+        if self.truncated and self.cursor is not None:
+            # Newer entries are still pending; they are read from here on the next poll
+            return self.entries[0].id
+        return self.first_id or self.cursor
 
 
 class RssParseError(Exception):
@@ -87,17 +143,47 @@ class RssFetchError(Exception):
     pass
 
 
+class RssResponseRejectedError(RssFetchError):
+    """The response cannot be a feed; retrying the same URL will not help."""
+
+    def __init__(self, message: str, code: str):
+        """Initialize error with its result error code."""
+        super().__init__(message)
+        self.code = code
+
+
 class RssScraper:
     """Wrapper around feedparser for fetching RSS/Atom feeds."""
 
-    def __init__(self, settings: Settings):
-        """Initialize RSS scraper with settings."""
+    def __init__(
+        self,
+        settings: Settings,
+        host_limiter: Optional["HostLimiter"] = None,
+        parse_pool: Optional["ParsePool"] = None,
+    ):
+        """Initialize RSS scraper with settings, an optional per-host limiter and parse pool."""
         self.settings = settings
+        self.host_limiter = host_limiter
+        self.parse_pool = parse_pool
         self.http_client = self._create_http_client()
 
-    def _create_http_client(self) -> httpx.Client:
-        """Create and configure HTTP client."""
-        return httpx.Client(
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create and configure async HTTP client."""
+        # Many feeds share a host or CDN, so connections are kept open for reuse
+        limits = httpx.Limits(
+            max_connections=self.settings.rss_http_max_connections,
+            max_keepalive_connections=self.settings.rss_http_max_keepalive_connections,
+            keepalive_expiry=self.settings.rss_http_keepalive_expiry,
+        )
+        self.transport = PooledTransport(
+            limits=limits,
+            http2=self.settings.rss_http2,
+            dns_cache_ttl=self.settings.rss_dns_cache_ttl,
+        )
+        return httpx.AsyncClient(
+            transport=self.transport,
+            # A custom transport turns off the environment's proxies, so they are mounted
+            mounts=proxy_mounts(limits, self.settings.rss_http2),
             timeout=self.settings.rss_request_timeout,
             headers={
                 "User-Agent": self.settings.rss_user_agent,
@@ -106,94 +192,442 @@ class RssScraper:
             follow_redirects=True,
         )
 
-    def fetch_feed(
+    async def fetch_feed(
         self,
         feed_url: str,
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
-    ) -> tuple[list[RssFeedEntry], RssFeedInfo, Optional[str]]:
+        validators: Optional[FeedValidators] = None,
+        seen_ids: Optional[AbstractSet[str]] = None,
+    ) -> RssFetchResult:
         """
         Fetch and parse RSS/Atom feed.
 
         Args:
             feed_url: URL of the RSS/Atom feed
             limit: Maximum number of entries to return
-            cursor: Last processed entry ID (entries after this will be skipped)
+            cursor: Newest entry ID processed by the previous poll; reading stops
+                at it (see EntryWindow)
+            validators: Validators from the previous fetch, used for a conditional GET
+            seen_ids: IDs already emitted for this source, skipped when found
 
         Returns:
-            Tuple of (list of entries, feed info, next cursor)
+            RssFetchResult with entries, feed info and next cursor. When the feed is
+            unchanged (304 or identical body) the result is marked not_modified, has
+            no entries and carries the incoming cursor through.
 
         Raises:
             RssFetchError: Error fetching the feed
+            HostThrottledError: The feed's host is throttled (with a limiter only)
             RssParseError: Error parsing the feed
         """
         logger.info(f"Fetching RSS feed: {feed_url} (limit={limit}, cursor={cursor})")
 
         try:
-            # Fetch the feed content
-            response = self.http_client.get(feed_url)
+            if self.settings.rss_parser_mode == "streaming":
+                return await self._fetch_streaming(feed_url, limit, cursor, validators, seen_ids)
+
+            return await self._fetch_buffered(feed_url, limit, cursor, validators, seen_ids)
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error fetching {feed_url}: {e}")
+            raise RssFetchError(f"HTTP error: {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            logger.error(f"Request error fetching {feed_url}: {e}")
+            raise RssFetchError(f"Request error: {str(e)}") from e
+        except (RssFetchError, RssParseError):
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error fetching {feed_url}: {e}")
+            raise RssFetchError(f"Unexpected error: {str(e)}") from e
+
+    def _host_slot(self, feed_url: str) -> AsyncContextManager[None]:
+        """
+        Get a request slot of the feed's host, or no limit without a limiter.
+
+        The slot is held while the response is read and released before parsing,
+        so a slow parse does not keep other fetches of the host waiting.
+        """
+        if self.host_limiter is None:
+            return nullcontext()
+        return self.host_limiter.slot(feed_url)
+
+    async def _check_throttled(self, feed_url: str, response: httpx.Response) -> None:
+        """
+        Block the feed's host when it answers 429/503, honoring Retry-After.
+
+        Raises:
+            HostThrottledError: The host asked us to back off
+        """
+        if self.host_limiter is None or response.status_code not in (
+            httpx.codes.TOO_MANY_REQUESTS,
+            httpx.codes.SERVICE_UNAVAILABLE,
+        ):
+            return
+
+        from src.scraper.host_limiter import HostThrottledError, parse_retry_after
+
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = self.settings.rss_host_retry_after_default
+
+        await self.host_limiter.block(feed_url, delay)
+        raise HostThrottledError(
+            f"HTTP {response.status_code} from {feed_url}, retry after {delay:.0f}s",
+            retry_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
+        )
+
+    async def _fetch_buffered(
+        self,
+        feed_url: str,
+        limit: Optional[int],
+        cursor: Optional[str],
+        validators: Optional[FeedValidators],
+        seen_ids: Optional[AbstractSet[str]],
+    ) -> RssFetchResult:
+        """Download the whole feed body and parse it."""
+        # Fetch the feed content, conditionally if we have validators
+        async with (
+            self._host_slot(feed_url),
+            self.http_client.stream(
+                "GET",
+                feed_url,
+                headers=self._build_conditional_headers(validators),
+            ) as response,
+        ):
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                logger.info(f"Feed {feed_url} not modified (304), skipping parse")
+                return RssFetchResult(
+                    feed_info=None,
+                    entries=[],
+                    next_cursor=cursor,
+                    not_modified=True,
+                )
+
+            await self._check_throttled(feed_url, response)
             response.raise_for_status()
-            feed_content = response.text
 
-            # Parse the feed using feedparser
-            parsed = feedparser.parse(feed_content)
+            body = b"".join([chunk async for chunk in self._checked_chunks(feed_url, response)])
+
+        return await self._parse_downloaded(
+            feed_url, body, response, limit, cursor, validators, seen_ids
+        )
+
+    async def _parse_downloaded(
+        self,
+        feed_url: str,
+        body: bytes,
+        response: httpx.Response,
+        limit: Optional[int],
+        cursor: Optional[str],
+        validators: Optional[FeedValidators],
+        seen_ids: Optional[AbstractSet[str]],
+    ) -> RssFetchResult:
+        """Parse a whole downloaded body, unless it is the same as last time."""
+        new_validators = FeedValidators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=hashlib.sha256(body).hexdigest(),
+        )
+
+        # Servers without validator support still let us skip identical bodies
+        if validators and validators.content_hash == new_validators.content_hash:
+            logger.info(f"Feed {feed_url} body unchanged, skipping parse")
+            return RssFetchResult(
+                feed_info=None,
+                entries=[],
+                next_cursor=cursor,
+                not_modified=True,
+                validators=new_validators,
+            )
+
+        feed_info, items = await self._parse_body(feed_url, body, response.encoding)
 
-            # Check for parsing errors
-            if parsed.bozo and parsed.bozo_exception:
-                # bozo=1 means there was a problem, but feedparser may still have parsed it
-                logger.warning(
-                    f"Feed parsing issue for {feed_url}: {parsed.bozo_exception}. "
-                    "Attempting to continue with partial data.",
+        # Extract entries
+        window = EntryWindow(limit, cursor, seen_ids)
+        for item in items:
+            if not window.add(item):
+                break
+
+        logger.info(
+            f"Fetched {len(window.entries)} entries from {feed_url}, "
+            f"next_cursor={window.next_cursor}",
+        )
+
+        return RssFetchResult(
+            feed_info=feed_info,
+            entries=list(window.entries),
+            next_cursor=window.next_cursor,
+            # Entries left behind by the limit must be re-read on the next poll,
+            # so an unchanged body is only skippable once it was fully consumed
+            validators=None if window.truncated else new_validators,
+        )
+
+    async def _parse_body(
+        self,
+        feed_url: str,
+        body: bytes,
+        encoding: Optional[str],
+    ) -> tuple[RssFeedInfo, list[RssFeedEntry]]:
+        """Parse a downloaded body, in the parse pool when there is one and the body is large."""
+        mode = self.settings.rss_parser_mode
+        if self.parse_pool is not None and len(body) >= self.settings.rss_parse_process_min_bytes:
+            return await self.parse_pool.parse(feed_url, body, encoding, mode)
+        return parse_feed_body(feed_url, body, encoding, mode)
+
+    @classmethod
+    def _parse_with_feedparser(
+        cls,
+        feed_url: str,
+        body: bytes,
+        encoding: Optional[str],
+    ) -> tuple[RssFeedInfo, list[RssFeedEntry]]:
+        """
+        Parse a document with feedparser.
+
+        Returns:
+            Feed info and entries
+
+        Raises:
+            RssParseError: No feed data found
+        """
+        # Same decoding as response.text, which is not available on a streamed body
+        feed_content = body.decode(encoding or "utf-8", errors="replace")
+
+        # Parse the feed using feedparser
+        parsed = feedparser.parse(feed_content)
+
+        # Check for parsing errors
+        if parsed.bozo and parsed.bozo_exception:
+            # bozo=1 means there was a problem, but feedparser may still have parsed it
+            logger.warning(
+                f"Feed parsing issue for {feed_url}: {parsed.bozo_exception}. "
+                "Attempting to continue with partial data.",
+            )
+
+        # Check if we got any entries
+        if not parsed.feed:
+            raise RssParseError(f"Failed to parse feed from {feed_url}: No feed data found")
+
+        feed_info = cls._extract_feed_info(parsed.feed, feed_url)
+        return feed_info, [cls._parse_entry(entry) for entry in parsed.entries]
+
+    async def _fetch_streaming(
+        self,
+        feed_url: str,
+        limit: Optional[int],
+        cursor: Optional[str],
+        validators: Optional[FeedValidators],
+        seen_ids: Optional[AbstractSet[str]],
+    ) -> RssFetchResult:
+        """
+        Parse the feed while it downloads and stop reading at the cursor or limit.
+
+        Entries are picked by EntryWindow like in buffered mode, so a cursor means
+        the same in both modes. Leaving the stream context early closes the
+        connection without reading the rest.
+
+        A feed the streaming parser gives up on (not RSS 2.0/Atom, or malformed)
+        is read to the end and parsed like in buffered mode, reusing the part of
+        the body already received instead of requesting it again.
+        """
+        from src.scraper.feed_stream import FeedStreamError, FeedStreamParser
+
+        # Entries are parsed as they arrive, so here the slot covers the parse too
+        async with (
+            self._host_slot(feed_url),
+            self.http_client.stream(
+                "GET",
+                feed_url,
+                headers=self._build_conditional_headers(validators),
+            ) as response,
+        ):
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                logger.info(f"Feed {feed_url} not modified (304), skipping parse")
+                return RssFetchResult(
+                    feed_info=None,
+                    entries=[],
+                    next_cursor=cursor,
+                    not_modified=True,
                 )
 
-            # Check if we got any entries
-            if not parsed.feed:
-                raise RssParseError(f"Failed to parse feed from {feed_url}: No feed data found")
+            await self._check_throttled(feed_url, response)
+            response.raise_for_status()
 
-            # Extract feed info
-            feed_info = self._extract_feed_info(parsed.feed, feed_url)
+            parser = FeedStreamParser(feed_url)
+            window = EntryWindow(limit, cursor, seen_ids)
+
+            received: list[bytes] = []
+            body: Optional[bytes] = None
+            async with aclosing(self._checked_chunks(feed_url, response)) as chunks:
+                try:
+                    stream = self._stream_entries(parser, chunks, received)
+                    async with aclosing(stream):
+                        async for entry in stream:
+                            if not window.add(entry):
+                                break
+                except FeedStreamError as e:
+                    logger.warning(
+                        f"Streaming parse failed for {feed_url}: {e}. "
+                        "Falling back to feedparser.",
+                    )
+                    received.extend([chunk async for chunk in chunks])
+                    body = b"".join(received)
+
+        if body is not None:
+            # Parsed once the host slot is released, like a buffered body
+            return await self._parse_downloaded(
+                feed_url, body, response, limit, cursor, validators, seen_ids
+            )
 
-            # Extract entries
-            entries = []
-            next_cursor = None
-            found_cursor = cursor is None  # If no cursor, start collecting immediately
+        feed_info = parser.feed_info()
+        new_validators = FeedValidators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
 
-            for entry in parsed.entries:
-                entry_id = self._get_entry_id(entry)
+        logger.info(
+            f"Streamed {len(window.entries)} entries from {feed_url}, "
+            f"next_cursor={window.next_cursor}",
+        )
 
-                # If we have a cursor, skip until we find it
-                if not found_cursor:
-                    if entry_id == cursor:
-                        found_cursor = True
-                    continue
+        return RssFetchResult(
+            feed_info=feed_info,
+            entries=list(window.entries),
+            next_cursor=window.next_cursor,
+            # The body is not fully read, so there is no content hash to compare
+            validators=None if window.truncated else new_validators,
+        )
+
+    @staticmethod
+    async def _stream_entries(
+        parser: "FeedStreamParser",
+        chunks: AsyncIterator[bytes],
+        received: list[bytes],
+    ) -> AsyncIterator[RssFeedEntry]:
+        """
+        Feed response chunks to the parser and yield entries as they complete.
+
+        Chunks are appended to received as they are read, so a body the parser
+        gives up on can be parsed another way. The caller closes chunks.
+        """
+        async for chunk in chunks:
+            received.append(chunk)
+            for entry in parser.feed(chunk):
+                yield entry
 
-                parsed_entry = self._parse_entry(entry)
-                entries.append(parsed_entry)
-                next_cursor = entry_id
+        for entry in parser.close():
+            yield entry
 
-                # Check limit
-                if limit and len(entries) >= limit:
-                    break
+    async def _checked_chunks(
+        self,
+        feed_url: str,
+        response: httpx.Response,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the decoded body, rejecting it as soon as it cannot be a feed.
 
-            logger.info(
-                f"Fetched {len(entries)} entries from {feed_url}, next_cursor={next_cursor}",
+        The declared type and length are checked before anything is read, the
+        first SNIFF_BYTES of the body are sniffed before they are yielded, and
+        reading stops once the body grows past rss_max_response_bytes.
+
+        Raises:
+            RssResponseRejectedError: The response is too large or not a feed
+        """
+        max_bytes = self.settings.rss_max_response_bytes
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type.startswith(REJECTED_CONTENT_TYPES):
+            raise RssResponseRejectedError(
+                f"Response from {feed_url} is {content_type}, not a feed",
+                code=NOT_A_FEED_ERROR,
             )
 
-            return entries, feed_info, next_cursor
+        content_length = response.headers.get("Content-Length", "")
+        if max_bytes and content_length.isdigit() and int(content_length) > max_bytes:
+            raise RssResponseRejectedError(
+                f"Response from {feed_url} is {content_length} bytes, "
+                f"more than the {max_bytes} allowed",
+                code=FEED_TOO_LARGE_ERROR,
+            )
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching {feed_url}: {e}")
-            raise RssFetchError(f"HTTP error: {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            logger.error(f"Request error fetching {feed_url}: {e}")
-            raise RssFetchError(f"Request error: {str(e)}") from e
-        except RssParseError:
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error fetching {feed_url}: {e}")
-            raise RssFetchError(f"Unexpected error: {str(e)}") from e
+        head: Optional[bytes] = b""
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if max_bytes and size > max_bytes:
+                raise RssResponseRejectedError(
+                    f"Response from {feed_url} is more than the {max_bytes} bytes allowed",
+                    code=FEED_TOO_LARGE_ERROR,
+                )
+
+            # Hold chunks back until there is enough of the body to sniff
+            if head is not None:
+                head += chunk
+                if len(head) < SNIFF_BYTES:
+                    continue
+                self._sniff(feed_url, head)
+                chunk, head = head, None
+
+            yield chunk
+
+        # Bodies shorter than SNIFF_BYTES
+        if head is not None:
+            self._sniff(feed_url, head)
+            if head:
+                yield head
+
+    @staticmethod
+    def _sniff(feed_url: str, head: bytes) -> None:
+        """
+        Check the start of a body looks like an XML or JSON feed.
+
+        Raises:
+            RssResponseRejectedError: The body is an HTML page, binary or empty
+        """
+        utf16_boms = ((codecs.BOM_UTF16_LE, "utf-16-le"), (codecs.BOM_UTF16_BE, "utf-16-be"))
+        for bom, encoding in utf16_boms:
+            if head.startswith(bom):
+                head = head[len(bom) :].decode(encoding, errors="ignore").encode("utf-8")
+                break
+        text = head.removeprefix(codecs.BOM_UTF8).lstrip().lower()
+
+        if text.startswith(b"<"):
+            # An HTML page without a feed in it, e.g. a site's homepage
+            if b"<html" in text and not any(marker in text for marker in FEED_MARKERS):
+                raise RssResponseRejectedError(
+                    f"Response from {feed_url} is an HTML page, not a feed",
+                    code=NOT_A_FEED_ERROR,
+                )
+            return
+
+        # JSON Feed
+        if text.startswith((b"{", b"[")):
+            return
+
+        raise RssResponseRejectedError(
+            f"Response from {feed_url} is neither XML nor JSON",
+            code=NOT_A_FEED_ERROR,
+        )
+
+    def _build_conditional_headers(
+        self,
+        validators: Optional[FeedValidators],
+    ) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from stored validators."""
+        headers: dict[str, str] = {}
+
+        if validators is None:
+            return headers
+
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+
+        return headers
 
-    def _extract_feed_info(self, feed: Any, feed_url: str) -> RssFeedInfo:
+    @classmethod
+    def _extract_feed_info(cls, feed: Any, feed_url: str) -> RssFeedInfo:
         """Extract feed metadata."""
         # Get and clean title
         raw_title = getattr(feed, "title", "") or feed_url
@@ -207,11 +641,12 @@ class RssScraper:
             title=clean_title,
             link=getattr(feed, "link", "") or feed_url,
             description=clean_description,
-            author=self._get_feed_author(feed),
-            image_url=self._get_feed_image(feed),
+            author=cls._get_feed_author(feed),
+            image_url=cls._get_feed_image(feed),
         )
 
-    def _get_feed_author(self, feed: Any) -> Optional[str]:
+    @staticmethod
+    def _get_feed_author(feed: Any) -> Optional[str]:
         """Get feed author name."""
         # Try different author fields
         if hasattr(feed, "author_detail") and feed.author_detail:
@@ -222,7 +657,8 @@ class RssScraper:
             return feed.publisher
         return None
 
-    def _get_feed_image(self, feed: Any) -> Optional[str]:
+    @staticmethod
+    def _get_feed_image(feed: Any) -> Optional[str]:
         """Get feed image URL."""
         # Try image
         if hasattr(feed, "image") and feed.image:
@@ -238,7 +674,8 @@ class RssScraper:
             return feed.icon
         return None
 
-    def _get_entry_id(self, entry: Any) -> str:
+    @staticmethod
+    def _get_entry_id(entry: Any) -> str:
         """Get unique identifier for entry."""
         # Prefer GUID/ID
         if hasattr(entry, "id") and entry.id:
@@ -251,25 +688,27 @@ class RssScraper:
             return entry.title
         return str(hash(str(entry)))
 
-    def _parse_entry(self, entry: Any) -> RssFeedEntry:
+    @classmethod
+    def _parse_entry(cls, entry: Any) -> RssFeedEntry:
         """Parse a feed entry into RssFeedEntry."""
         # Get and clean title (strip HTML tags)
         raw_title = getattr(entry, "title", "") or ""
         clean_title = strip_html_tags(raw_title)
 
         return RssFeedEntry(
-            id=self._get_entry_id(entry),
+            id=cls._get_entry_id(entry),
             title=clean_title,
-            content=self._get_entry_content(entry),
+            content=cls._get_entry_content(entry),
             link=getattr(entry, "link", "") or "",
-            published=self._parse_published_date(entry),
-            author=self._get_entry_author(entry),
-            author_email=self._get_entry_author_email(entry),
-            enclosures=self._get_enclosures(entry),
-            tags=self._get_tags(entry),
+            published=cls._parse_published_date(entry),
+            author=cls._get_entry_author(entry),
+            author_email=cls._get_entry_author_email(entry),
+            enclosures=cls._get_enclosures(entry),
+            tags=cls._get_tags(entry),
         )
 
-    def _get_entry_content(self, entry: Any) -> str:
+    @staticmethod
+    def _get_entry_content(entry: Any) -> str:
         """Get entry content, trying various fields."""
         # Try content field first (RSS 2.0 content:encoded or Atom content)
         if hasattr(entry, "content") and entry.content:
@@ -290,7 +729,8 @@ class RssScraper:
 
         return ""
 
-    def _parse_published_date(self, entry: Any) -> Optional[datetime]:
+    @staticmethod
+    def _parse_published_date(entry: Any) -> Optional[datetime]:
         """Parse published date from entry."""
         # Try published_parsed (struct_time)
         if hasattr(entry, "published_parsed") and entry.published_parsed:
@@ -321,7 +761,8 @@ class RssScraper:
 
         return None
 
-    def _get_entry_author(self, entry: Any) -> Optional[str]:
+    @staticmethod
+    def _get_entry_author(entry: Any) -> Optional[str]:
         """Get entry author name."""
         if hasattr(entry, "author_detail") and entry.author_detail:
             return entry.author_detail.get("name")
@@ -329,13 +770,15 @@ class RssScraper:
             return entry.author
         return None
 
-    def _get_entry_author_email(self, entry: Any) -> Optional[str]:
+    @staticmethod
+    def _get_entry_author_email(entry: Any) -> Optional[str]:
         """Get entry author email."""
         if hasattr(entry, "author_detail") and entry.author_detail:
             return entry.author_detail.get("email")
         return None
 
-    def _get_enclosures(self, entry: Any) -> list[dict[str, str]]:
+    @staticmethod
+    def _get_enclosures(entry: Any) -> list[dict[str, str]]:
         """Get media enclosures from entry."""
         enclosures = []
 
@@ -373,7 +816,8 @@ class RssScraper:
 
         return enclosures
 
-    def _get_tags(self, entry: Any) -> list[str]:
+    @staticmethod
+    def _get_tags(entry: Any) -> list[str]:
         """Get tags/categories from entry."""
         tags = []
 
@@ -386,6 +830,49 @@ class RssScraper:
 
         return tags
 
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self.http_client.close()
+    def connection_stats(self) -> ConnectionStats:
+        """Get request, connection and DNS counters of the HTTP client."""
+        return self.transport.stats
+
+    async def close(self) -> None:
+        """Close the HTTP client, the host limiter and the parse pool."""
+        await self.http_client.aclose()
+        if self.host_limiter:
+            await self.host_limiter.close()
+        if self.parse_pool:
+            self.parse_pool.close()
+
+
+def parse_feed_body(
+    feed_url: str,
+    body: bytes,
+    encoding: Optional[str],
+    parser_mode: str,
+) -> tuple[RssFeedInfo, list[RssFeedEntry]]:
+    """
+    Parse a whole feed body into feed info and entries in document order.
+
+    Well-formed RSS 2.0, Atom and JSON Feed documents take the fast path unless
+    parser_mode is feedparser; everything else is parsed with feedparser. Runs
+    in parse pool worker processes as well, so it only depends on its arguments.
+
+    Args:
+        feed_url: URL of the feed
+        body: Raw response body
+        encoding: Charset of the response, used to decode the body for feedparser
+        parser_mode: RSS_PARSER_MODE
+
+    Raises:
+        RssParseError: No feed data found
+    """
+    if parser_mode != "feedparser":
+        # Imported lazily: fast_parser builds on the dataclasses of this module
+        from src.scraper.fast_parser import parse_feed_document
+        from src.scraper.feed_stream import FeedStreamError
+
+        try:
+            return parse_feed_document(feed_url, body)
+        except FeedStreamError as e:
+            logger.warning(f"Fast parse failed for {feed_url}: {e}. Falling back to feedparser.")
+
+    return RssScraper._parse_with_feedparser(feed_url, body, encoding)
@@ -3,6 +3,16 @@
 import pytest
 
 
+@pytest.fixture
+def settings(monkeypatch):
+    """Settings instance built from a minimal test environment."""
+    from src.config import Settings
+
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+
+    return Settings(_env_file=None)
+
+
 @pytest.fixture
 def sample_rss_feed():
     """Sample RSS feed XML for testing."""
@@ -0,0 +1,152 @@
+"""Tests for per-host request limits."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from bullmq import DelayedError
+
+from src.scraper.host_limiter import HostLimiter, HostThrottledError, parse_retry_after
+from src.scraper.rss_scraper import RssFetchError, RssScraper
+from tests.test_queue_worker import make_job, make_worker
+
+
+def make_limiter(settings, acquire_results: list) -> HostLimiter:
+    """Create a limiter whose acquire script returns the given results in turn."""
+    redis = MagicMock()
+    acquire_script = AsyncMock(side_effect=acquire_results)
+    block_script = AsyncMock()
+    redis.register_script = MagicMock(side_effect=[acquire_script, block_script])
+    redis.zrem = AsyncMock()
+    return HostLimiter(settings, redis)
+
+
+class TestParseRetryAfter:
+    """Test parse_retry_after."""
+
+    def test_delay_seconds(self):
+        """Test a delay in seconds."""
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        """Test an HTTP date is turned into the seconds left until it."""
+        retry_at = datetime.now(timezone.utc) + timedelta(minutes=2)
+
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert 100 < delay <= 120
+
+    def test_missing_or_invalid(self):
+        """Test missing and unparsable values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestHostLimiter:
+    """Test HostLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_waits_until_host_accepts_request(self, settings):
+        """Test a request waits while its host is paced or full, and the delay is recorded."""
+        limiter = make_limiter(settings, [200, -1, 0])
+
+        started = time.perf_counter()
+        async with limiter.slot("https://example.substack.com/feed"):
+            elapsed = time.perf_counter() - started
+
+        assert 0.3 <= elapsed < 0.5
+        stats = limiter.stats()["example.substack.com"]
+        assert stats.requests == 1
+        assert stats.max_wait >= 0.3
+        # The slot is given back once the request is done
+        leases_key, token = limiter.redis.zrem.await_args.args
+        assert leases_key == "rss:host:{example.substack.com}:leases"
+        assert token == limiter._acquire_script.await_args.kwargs["args"][0]
+
+    @pytest.mark.asyncio
+    async def test_blocked_host_defers_instead_of_waiting(self, settings):
+        """Test a host blocked for longer than the max wait raises at once."""
+        limiter = make_limiter(settings, [120_000])
+
+        with pytest.raises(HostThrottledError) as exc_info:
+            async with limiter.slot("https://medium.com/feed/@someone"):
+                pass
+
+        delay = exc_info.value.retry_at - datetime.now(timezone.utc)
+        assert timedelta(seconds=110) < delay <= timedelta(seconds=120)
+        assert limiter.stats()["medium.com"].throttled == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_does_not_block_fetches(self, settings):
+        """Test the limit is skipped when Redis is unavailable."""
+        limiter = make_limiter(settings, [ConnectionError("redis down")])
+        limiter.redis.zrem = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        async with limiter.slot("https://example.com/feed.xml"):
+            pass
+
+        assert limiter.stats()["example.com"].requests == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_delay_does_not_block_host(self, settings):
+        """Test Retry-After: 0 (or a past date) leaves the host unblocked."""
+        limiter = make_limiter(settings, [])
+
+        await limiter.block("https://example.com/feed.xml", 0)
+
+        limiter._block_script.assert_not_awaited()
+
+
+class TestRetryAfter:
+    """A 429 blocks the host and defers the job."""
+
+    @pytest.mark.asyncio
+    async def test_too_many_requests_blocks_host_and_defers_job(self, settings):
+        """Test Retry-After blocks the host and the job is moved to delayed."""
+        limiter = make_limiter(settings, [0])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, headers={"Retry-After": "120"})
+
+        scraper = RssScraper(settings, limiter)
+        scraper.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        worker = make_worker(settings, scraper)
+        job = make_job("1", "https://feeds.feedburner.com/example")
+        job.moveToDelayed = AsyncMock()
+
+        with pytest.raises(DelayedError):
+            await worker._process_job(job, "token")
+
+        await scraper.http_client.aclose()
+
+        limiter._block_script.assert_awaited_once_with(
+            keys=["rss:host:{feeds.feedburner.com}:blocked"],
+            args=[120_000],
+        )
+        retry_at_ms = job.moveToDelayed.await_args.args[0]
+        delay = retry_at_ms / 1000 - datetime.now(timezone.utc).timestamp()
+        assert 110 < delay <= 120
+        worker.publisher.publish_error.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_job_past_max_defer_fails_instead(self, settings):
+        """Test a job throttled past RSS_HOST_MAX_DEFER after its creation is failed."""
+        limiter = make_limiter(settings, [120_000])
+        settings.rss_host_max_defer = 3600
+
+        scraper = RssScraper(settings, limiter)
+        worker = make_worker(settings, scraper)
+        job = make_job("1", "https://medium.com/feed/@someone")
+        job.timestamp -= 3590 * 1000
+        job.moveToDelayed = AsyncMock()
+
+        with pytest.raises(RssFetchError):
+            await worker._process_job(job, "token")
+
+        await scraper.http_client.aclose()
+
+        job.moveToDelayed.assert_not_awaited()
+        worker.publisher.publish_error.assert_awaited_once()
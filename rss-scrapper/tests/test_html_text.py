@@ -0,0 +1,48 @@
+"""Tests for HTML to text conversion."""
+
+from src.scraper.html_text import strip_html_tags
+
+
+class TestStripHtmlTags:
+    """Tests for strip_html_tags."""
+
+    def test_empty(self):
+        """Empty input gives an empty string."""
+        assert strip_html_tags("") == ""
+        assert strip_html_tags("", keep_paragraphs=True) == ""
+
+    def test_single_line(self):
+        """Tags are removed, entities decoded and whitespace collapsed."""
+        text = "<p>Hello <b>big</b>\n  world &amp; friends</p><p>Second</p>"
+
+        assert strip_html_tags(text) == "Hello big world & friends Second"
+
+    def test_inline_tags_do_not_split_words(self):
+        """Inline markup inside a word leaves the word intact."""
+        assert strip_html_tags("un<em>believ</em>able") == "unbelievable"
+
+    def test_keeps_paragraph_breaks(self):
+        """Block tags become paragraph breaks and <br> a line break."""
+        text = (
+            "<h2>Title</h2>\n<p>First  paragraph\twith <a href='#'>link</a>.</p>\n\n\n"
+            "<p>Line one<br/>\n   line two</p><ul><li>One</li><li>Two</li></ul>"
+        )
+
+        assert strip_html_tags(text, keep_paragraphs=True) == (
+            "Title\n\nFirst paragraph with link.\n\nLine one\nline two\n\nOne\n\nTwo"
+        )
+
+    def test_plain_text_keeps_lines(self):
+        """Plain text without markup keeps its own line structure."""
+        text = "  line one  \nline two\n\n\n\nline three  "
+
+        assert strip_html_tags(text, keep_paragraphs=True) == "line one\nline two\n\nline three"
+
+    def test_whitespace_entities_are_normalized(self):
+        """Entities decoding to whitespace are collapsed like literal whitespace."""
+        text = "<p>One&#10;two&#9;three&nbsp;&nbsp;four &#x20; five</p>"
+
+        assert strip_html_tags(text) == "One two three four five"
+        assert strip_html_tags("Line&#10;&#10;&#10;next&Tab;line", keep_paragraphs=True) == (
+            "Line\n\nnext line"
+        )
@@ -0,0 +1,155 @@
+"""Tests for the feed HTTP transport."""
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.scraper.http_transport import (
+    CachingNetworkBackend,
+    ConnectionStats,
+    PooledTransport,
+    proxy_mounts,
+)
+from src.scraper.rss_scraper import RssScraper
+
+
+@pytest_asyncio.fixture
+async def feed_server():
+    """Local keep-alive HTTP server answering every request with an empty feed."""
+    body = b"<rss version='2.0'><channel><title>t</title></channel></rss>"
+    response = b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+
+def make_transport(dns_cache_ttl: float = 300) -> PooledTransport:
+    """Create a transport with roomy pool limits."""
+    return PooledTransport(
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        http2=False,
+        dns_cache_ttl=dns_cache_ttl,
+    )
+
+
+class TestPooledTransport:
+    """Test PooledTransport."""
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_connection(self, feed_server):
+        """Test sequential requests to one host share a kept-alive connection."""
+        transport = make_transport()
+        async with httpx.AsyncClient(transport=transport) as client:
+            for i in range(5):
+                response = await client.get(f"http://localhost:{feed_server}/{i}.xml")
+                assert response.status_code == 200
+
+        assert transport.stats.requests == 5
+        assert transport.stats.connections == 1
+        assert transport.stats.reused == 4
+
+    def test_http2_requires_h2(self):
+        """Test enabling HTTP/2 without the h2 package fails with a hint."""
+        if importlib.util.find_spec("h2") is not None:
+            pytest.skip("h2 is installed")
+
+        with pytest.raises(RuntimeError, match="h2"):
+            PooledTransport(limits=httpx.Limits(), http2=True, dns_cache_ttl=0)
+
+
+class TestCachingNetworkBackend:
+    """Test DNS caching of CachingNetworkBackend."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connections_share_one_lookup(self, feed_server):
+        """Test connections opened together resolve the host once."""
+        stats = ConnectionStats()
+        backend = CachingNetworkBackend(ttl=300, stats=stats)
+
+        streams = await asyncio.gather(
+            *(backend.connect_tcp("localhost", feed_server) for _ in range(5)),
+        )
+        stream = await backend.connect_tcp("localhost", feed_server)
+        for opened in [*streams, stream]:
+            await opened.aclose()
+
+        assert stats.connections == 6
+        assert stats.dns_lookups == 1
+        assert stats.dns_cache_hits == 5
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_resolves_every_connection(self, feed_server):
+        """Test a TTL of 0 resolves the host for every new connection."""
+        stats = ConnectionStats()
+        backend = CachingNetworkBackend(ttl=0, stats=stats)
+
+        for _ in range(2):
+            stream = await backend.connect_tcp("localhost", feed_server)
+            await stream.aclose()
+
+        assert stats.dns_lookups == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_host_is_a_connect_error(self):
+        """Test resolution failures surface as httpx connect errors."""
+        transport = make_transport()
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://feeds.invalid/feed.xml")
+
+
+class TestProxyMounts:
+    """Test proxies from the environment still apply to feed requests."""
+
+    @pytest.fixture(autouse=True)
+    def clear_proxy_env(self, monkeypatch):
+        """Start from an environment without proxies."""
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+
+    def test_no_proxy_hosts_use_the_pooled_transport(self, monkeypatch):
+        """Test NO_PROXY hosts are mounted to the default transport."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost,127.0.0.1,example.org")
+
+        mounts = proxy_mounts(httpx.Limits(), http2=False)
+
+        assert isinstance(mounts["https://"], httpx.AsyncHTTPTransport)
+        assert mounts["all://localhost"] is None
+        assert mounts["all://127.0.0.1"] is None
+        assert mounts["all://*example.org"] is None
+        assert "http://" not in mounts
+
+    @pytest.mark.asyncio
+    async def test_feed_requests_go_through_the_environment_proxy(
+        self,
+        monkeypatch,
+        settings,
+        feed_server,
+    ):
+        """Test a host only reachable through HTTP_PROXY is fetched through it."""
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{feed_server}")
+        scraper = RssScraper(settings)
+
+        response = await scraper.http_client.get("http://feeds.invalid/feed.xml")
+        await scraper.close()
+
+        assert response.status_code == 200
+        assert scraper.connection_stats().requests == 0
@@ -0,0 +1,139 @@
+"""Tests for the media dedup index."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models import FetchedPost, MediaUploadJobData, PostAuthor
+from src.scraper.media_index import MediaIndex, normalize_media_url
+
+
+def make_index(settings) -> tuple[MediaIndex, dict[str, str]]:
+    """Create an index whose scripts run against a dict standing in for Redis."""
+    store: dict[str, str] = {}
+
+    async def claim(keys, args):
+        result = []
+        for key, target in zip(keys, args[1:]):
+            result.append(store.get(key))
+            store.setdefault(key, target)
+        return result
+
+    async def release(keys, args):
+        for key, target in zip(keys, args):
+            if store.get(key) == target:
+                del store[key]
+
+    redis = MagicMock()
+    redis.register_script = MagicMock(
+        side_effect=[AsyncMock(side_effect=claim), AsyncMock(side_effect=release)],
+    )
+    return MediaIndex(settings, redis), store
+
+
+def make_post(entry_id: str, urls: list[str]) -> tuple[FetchedPost, list[MediaUploadJobData]]:
+    """Build a post and its upload jobs, keyed per entry like the mapper does."""
+    jobs = [
+        MediaUploadJobData(
+            sourceType="rss",
+            sourceId="src-1",
+            postExternalId=entry_id,
+            mediaIndex=index,
+            targetPath=f"rss/src-1/{entry_id}/{index}.jpg",
+            contentType="image/jpeg",
+            source="url",
+            sourceUrl=url,
+        )
+        for index, url in enumerate(urls, start=1)
+    ]
+    post = FetchedPost(
+        externalId=entry_id,
+        content="",
+        mediaUrls=[job.targetPath for job in jobs],
+        publishedAt="2025-12-01T00:00:00+00:00",
+        author=PostAuthor(username="feed", displayName="Feed"),
+    )
+    return post, jobs
+
+
+def paths(jobs: list[MediaUploadJobData]) -> list[str]:
+    """Get the storage keys of upload jobs."""
+    return [job.targetPath for job in jobs]
+
+
+class TestNormalizeMediaUrl:
+    """Test normalize_media_url."""
+
+    def test_spellings_of_one_url_match(self):
+        """Test case, default port, fragment and parameter order are ignored."""
+        assert normalize_media_url(
+            "HTTPS://Example.COM:443/img/logo.png?b=2&a=1#top",
+        ) == normalize_media_url("https://example.com/img/logo.png?a=1&b=2")
+
+    def test_paths_and_parameters_are_kept(self):
+        """Test different files and renditions stay apart."""
+        assert normalize_media_url("https://example.com/a.png") != normalize_media_url(
+            "https://example.com/A.png",
+        )
+        assert normalize_media_url("https://example.com/a.png?w=100") != normalize_media_url(
+            "https://example.com/a.png?w=200",
+        )
+
+
+class TestMediaIndex:
+    """Test MediaIndex."""
+
+    @pytest.mark.asyncio
+    async def test_known_urls_resolve_to_existing_keys(self, settings):
+        """Test media queued for an earlier post is not queued again."""
+        index, _ = make_index(settings)
+        first, first_jobs = make_post("entry-1", ["https://example.com/logo.png"])
+        assert paths(await index.claim([first], first_jobs)) == paths(first_jobs)
+
+        second, second_jobs = make_post(
+            "entry-2",
+            ["https://EXAMPLE.com/logo.png", "https://example.com/photo.jpg"],
+        )
+        new_jobs = await index.claim([second], second_jobs)
+
+        assert paths(new_jobs) == paths(second_jobs[1:])
+        assert second.mediaUrls == ["rss/src-1/entry-1/1.jpg", "rss/src-1/entry-2/2.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_url_within_a_batch_is_queued_once(self, settings):
+        """Test two posts of one poll sharing an image produce one upload."""
+        index, _ = make_index(settings)
+        first, first_jobs = make_post("entry-1", ["https://example.com/logo.png"])
+        second, second_jobs = make_post("entry-2", ["https://example.com/logo.png"])
+
+        new_jobs = await index.claim([first, second], first_jobs + second_jobs)
+
+        assert paths(new_jobs) == paths(first_jobs)
+        assert second.mediaUrls == ["rss/src-1/entry-1/1.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_released_claims_are_queued_again(self, settings):
+        """Test jobs that failed to publish do not block later uploads of their URL."""
+        index, store = make_index(settings)
+        post, jobs = make_post("entry-1", ["https://example.com/logo.png"])
+        claimed = await index.claim([post], jobs)
+
+        await index.release(claimed)
+
+        assert store == {}
+        assert paths(await index.claim([post], jobs)) == paths(jobs)
+
+    @pytest.mark.asyncio
+    async def test_claims_are_pending_until_uploaded(self, settings):
+        """Test claims start with the pending TTL and jobs carry them for the media worker."""
+        settings.media_index_ttl = 30 * 24 * 3600
+        settings.media_index_pending_ttl = 3600
+        index, store = make_index(settings)
+        post, jobs = make_post("entry-1", ["https://example.com/logo.png"])
+
+        (job,) = await index.claim([post], jobs)
+
+        assert index._claim.await_args.kwargs["args"][0] == 3600
+        assert store == {job.mediaIndexKey: job.targetPath}
+        assert job.mediaIndexTtl == 30 * 24 * 3600
+        assert job.model_dump(by_alias=True)["mediaIndexKey"] == job.mediaIndexKey
@@ -0,0 +1,92 @@
+"""Tests for inlining small media into upload jobs."""
+
+import base64
+
+import httpx
+import pytest
+
+from src.models import MediaUploadJobData
+from src.scraper.media_inline import MediaInliner
+
+
+def make_inliner(settings, handler, job_budget: int = 1000) -> MediaInliner:
+    """Create an inliner whose downloads are answered by a handler."""
+    settings.media_inline_max_bytes = 100
+    settings.media_inline_job_budget = job_budget
+    return MediaInliner(
+        settings,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def make_jobs(urls: list[str]) -> list[MediaUploadJobData]:
+    """Create one upload job per URL."""
+    return [
+        MediaUploadJobData(
+            sourceType="rss",
+            sourceId="src-1",
+            postExternalId="entry-1",
+            mediaIndex=index,
+            targetPath=f"rss/src-1/entry-1/{index}.jpg",
+            contentType="image/jpeg",
+            source="url",
+            sourceUrl=url,
+        )
+        for index, url in enumerate(urls, start=1)
+    ]
+
+
+def image(size: int) -> httpx.Response:
+    """Build an image response of the given size."""
+    return httpx.Response(200, headers={"Content-Type": "image/jpeg"}, content=b"x" * size)
+
+
+class TestMediaInliner:
+    """Test MediaInliner."""
+
+    @pytest.mark.asyncio
+    async def test_small_media_is_shipped_as_buffer(self, settings):
+        """Test files under the size limit are inlined and keep their source URL."""
+        responses = {"/small.jpg": image(10), "/large.jpg": image(500)}
+        inliner = make_inliner(settings, lambda request: responses[request.url.path])
+        jobs = make_jobs([f"https://example.com{path}" for path in responses])
+
+        small, large = await inliner.inline(jobs)
+        await inliner.close()
+
+        assert small.source == "buffer"
+        assert base64.b64decode(small.buffer) == b"x" * 10
+        assert small.sourceUrl == "https://example.com/small.jpg"
+        assert large == jobs[1]
+
+    @pytest.mark.asyncio
+    async def test_job_budget_limits_inlined_bytes(self, settings):
+        """Test files past the per-job budget stay URL jobs."""
+        inliner = make_inliner(settings, lambda request: image(60), job_budget=100)
+        jobs = make_jobs([f"https://example.com/{index}.jpg" for index in range(3)])
+
+        inlined = await inliner.inline(jobs)
+        await inliner.close()
+
+        assert [job.source for job in inlined].count("buffer") == 1
+
+    @pytest.mark.asyncio
+    async def test_pages_and_failures_stay_url_jobs(self, settings):
+        """Test error pages, HTTP errors and timeouts leave the job to the media worker."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/page.jpg":
+                return httpx.Response(200, headers={"Content-Type": "text/html"}, content=b"<p>")
+            if request.url.path == "/gone.jpg":
+                return httpx.Response(404)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        inliner = make_inliner(settings, handler)
+        jobs = make_jobs(
+            [f"https://example.com/{name}.jpg" for name in ("page", "gone", "slow")],
+        )
+
+        inlined = await inliner.inline(jobs)
+        await inliner.close()
+
+        assert inlined == jobs
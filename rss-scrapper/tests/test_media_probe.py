@@ -0,0 +1,143 @@
+"""Tests for the media pre-flight probe."""
+
+import httpx
+import pytest
+
+from src.models import FetchedPost, MediaUploadJobData, PostAuthor
+from src.scraper.media_probe import MediaProbe
+
+
+def make_probe(settings, handler) -> MediaProbe:
+    """Create a probe whose requests are answered by a handler."""
+    settings.media_probe_max_bytes = 1000
+    return MediaProbe(
+        settings,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def make_post(urls: list[str]) -> tuple[FetchedPost, list[MediaUploadJobData]]:
+    """Build a post with one upload job per URL, typed from the URL like the mapper."""
+    jobs = [
+        MediaUploadJobData(
+            sourceType="rss",
+            sourceId="src-1",
+            postExternalId="entry-1",
+            mediaIndex=index,
+            targetPath=f"rss/src-1/entry-1/{index}.jpg",
+            contentType="image/jpeg",
+            source="url",
+            sourceUrl=url,
+        )
+        for index, url in enumerate(urls, start=1)
+    ]
+    post = FetchedPost(
+        externalId="entry-1",
+        content="",
+        mediaUrls=[job.targetPath for job in jobs],
+        publishedAt="2025-12-01T00:00:00+00:00",
+        author=PostAuthor(username="feed", displayName="Feed"),
+    )
+    return post, jobs
+
+
+class TestMediaProbe:
+    """Test MediaProbe."""
+
+    @pytest.mark.asyncio
+    async def test_drops_dead_non_media_and_oversized_urls(self, settings):
+        """Test 404s, HTML pages and files past the size limit are not queued."""
+        responses = {
+            "/ok.jpg": httpx.Response(200, headers={"Content-Type": "image/jpeg"}),
+            "/gone.jpg": httpx.Response(404),
+            "/page.jpg": httpx.Response(200, headers={"Content-Type": "text/html"}),
+            "/huge.mp4": httpx.Response(
+                200,
+                headers={"Content-Type": "video/mp4", "Content-Length": "5000"},
+            ),
+        }
+        probe = make_probe(settings, lambda request: responses[request.url.path])
+        post, jobs = make_post([f"https://example.com{path}" for path in responses])
+
+        kept = await probe.check([post], jobs)
+        await probe.close()
+
+        assert kept == jobs[:1]
+        assert post.mediaUrls == ["rss/src-1/entry-1/1.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_probed_type_sets_content_type_and_extension(self, settings):
+        """Test a guessed extension is replaced by the one of the served type."""
+        probe = make_probe(
+            settings,
+            lambda request: httpx.Response(
+                200,
+                headers={"Content-Type": "image/png; charset=binary", "Content-Length": "10"},
+            ),
+        )
+        post, jobs = make_post(["https://example.com/image?id=1"])
+
+        (job,) = await probe.check([post], jobs)
+        await probe.close()
+
+        assert (job.contentType, job.targetPath) == ("image/png", "rss/src-1/entry-1/1.png")
+        assert post.mediaUrls == ["rss/src-1/entry-1/1.png"]
+
+    @pytest.mark.asyncio
+    async def test_extension_is_set_on_the_file_name_only(self, settings):
+        """Test dots in directories are kept when the file name has no extension."""
+        probe = make_probe(
+            settings,
+            lambda request: httpx.Response(200, headers={"Content-Type": "image/png"}),
+        )
+        post, jobs = make_post(["https://example.com/image?id=1"])
+        jobs = [jobs[0].model_copy(update={"targetPath": "rss/src-1/post-1.2/1"})]
+        post.mediaUrls = ["rss/src-1/post-1.2/1"]
+
+        (job,) = await probe.check([post], jobs)
+        await probe.close()
+
+        assert job.targetPath == "rss/src-1/post-1.2/1.png"
+        assert post.mediaUrls == ["rss/src-1/post-1.2/1.png"]
+
+    @pytest.mark.asyncio
+    async def test_refused_head_falls_back_to_range_request(self, settings):
+        """Test servers refusing HEAD report the size through a one byte Range GET."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.headers.get("Range")))
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(
+                206,
+                headers={"Content-Type": "video/mp4", "Content-Range": "bytes 0-0/5000"},
+                content=b"\0",
+            )
+
+        probe = make_probe(settings, handler)
+        post, jobs = make_post(["https://example.com/video"])
+
+        kept = await probe.check([post], jobs)
+        await probe.close()
+
+        assert requests == [("HEAD", None), ("GET", "bytes=0-0")]
+        assert kept == []
+
+    @pytest.mark.asyncio
+    async def test_probe_failures_keep_the_job(self, settings):
+        """Test unreachable servers and errors leave the job for the media worker."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "down.example.com":
+                raise httpx.ConnectTimeout("timed out", request=request)
+            return httpx.Response(503)
+
+        probe = make_probe(settings, handler)
+        post, jobs = make_post(["https://down.example.com/a.jpg", "https://example.com/b.jpg"])
+
+        kept = await probe.check([post], jobs)
+        await probe.close()
+
+        assert kept == jobs
+        assert post.mediaUrls == ["rss/src-1/entry-1/1.jpg", "rss/src-1/entry-1/2.jpg"]
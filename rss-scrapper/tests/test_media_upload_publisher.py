@@ -0,0 +1,104 @@
+"""Tests for the media upload publisher."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.models import MediaUploadJobData
+from src.scraper.media_upload_publisher import (
+    MediaUploadPublisher,
+    job_options,
+    media_job_id,
+)
+
+
+def make_publisher(settings) -> tuple[MediaUploadPublisher, dict[str, dict]]:
+    """
+    Create a publisher whose queue keeps jobs by ID, like BullMQ does.
+
+    A job whose dict has state "failed" reports that state to getJobState.
+    """
+    with patch("src.scraper.media_upload_publisher.Queue"):
+        publisher = MediaUploadPublisher(settings)
+    jobs: dict[str, dict] = {}
+
+    async def get_job_state(job_id: str) -> str:
+        return jobs[job_id].get("state", "waiting") if job_id in jobs else "unknown"
+
+    async def remove(job_id: str) -> None:
+        jobs.pop(job_id, None)
+
+    async def add_bulk(bulk_jobs: list[dict]) -> list[SimpleNamespace]:
+        # A job ID that already exists returns the existing job instead of adding one
+        added = []
+        for job in bulk_jobs:
+            job_id = job["opts"]["jobId"]
+            jobs.setdefault(job_id, job)
+            added.append(SimpleNamespace(id=job_id))
+        return added
+
+    publisher.queue.addBulk = AsyncMock(side_effect=add_bulk)
+    publisher.queue.getJobState = AsyncMock(side_effect=get_job_state)
+    publisher.queue.remove = AsyncMock(side_effect=remove)
+    return publisher, jobs
+
+
+def make_job(entry_id: str, index: int) -> MediaUploadJobData:
+    """Create an upload job for an entry's media file."""
+    return MediaUploadJobData(
+        sourceType="rss",
+        sourceId="src-1",
+        postExternalId=entry_id,
+        mediaIndex=index,
+        targetPath=f"rss/src-1/{entry_id}/{index}.jpg",
+        contentType="image/jpeg",
+        source="url",
+        sourceUrl=f"https://example.com/{entry_id}/{index}.jpg",
+    )
+
+
+class TestMediaUploadPublisher:
+    """Test MediaUploadPublisher."""
+
+    def test_job_id_depends_on_target_path_only(self):
+        """Test uploads to the same path share a job ID."""
+        job = make_job("entry-1", 1)
+        same_path = job.model_copy(update={"sourceUrl": "https://cdn.example.com/1.jpg"})
+
+        assert media_job_id(job) == media_job_id(same_path)
+        assert media_job_id(job) != media_job_id(make_job("entry-1", 2))
+        assert ":" not in media_job_id(job)
+
+    @pytest.mark.asyncio
+    async def test_publishing_a_batch_twice_enqueues_it_once(self, settings):
+        """Test a retried collector job adds no second set of uploads."""
+        publisher, queued = make_publisher(settings)
+        batch = [make_job("entry-1", 1), make_job("entry-1", 2), make_job("entry-2", 1)]
+
+        first_ids = await publisher.publish_bulk(batch)
+        second_ids = await publisher.publish_bulk(batch)
+
+        assert first_ids == second_ids
+        assert len(queued) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_enqueued_again(self, settings):
+        """Test publishing an upload whose job failed replaces the failed job."""
+        publisher, queued = make_publisher(settings)
+        batch = [make_job("entry-1", 1), make_job("entry-1", 2)]
+        failed_id = media_job_id(batch[0])
+
+        await publisher.publish_bulk(batch)
+        queued[failed_id]["state"] = "failed"
+        await publisher.publish_bulk(batch)
+
+        publisher.queue.remove.assert_awaited_once_with(failed_id)
+        assert "state" not in queued[failed_id]
+        assert len(queued) == 2
+
+    def test_failed_jobs_are_kept_as_long_as_index_claims(self, settings):
+        """Test failed jobs expire with the media index rather than by count alone."""
+        options = job_options(make_job("entry-1", 1), settings.media_index_ttl)
+
+        assert options["removeOnFail"]["age"] == settings.media_index_ttl
@@ -0,0 +1,72 @@
+"""Tests for the feed parse process pool."""
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.scraper.parse_pool import ParsePool
+from src.scraper.rss_scraper import RssParseError, RssScraper, parse_feed_body
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+@pytest_asyncio.fixture
+async def parse_pool():
+    """Pool of one worker process."""
+    pool = ParsePool(processes=1)
+    yield pool
+    pool.close()
+
+
+class TestParsePool:
+    """Test ParsePool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parser_mode", ["fast", "feedparser"])
+    async def test_matches_parsing_in_process(self, parse_pool, sample_rss_feed, parser_mode):
+        """Test entries parsed by a worker equal the ones parsed in the event loop process."""
+        body = sample_rss_feed.encode()
+
+        pooled = await parse_pool.parse(FEED_URL, body, "utf-8", parser_mode)
+
+        assert pooled == parse_feed_body(FEED_URL, body, "utf-8", parser_mode)
+        assert [entry.id for entry in pooled[1]] == [
+            "https://example.com/article/1",
+            "https://example.com/article/2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parse_errors_propagate(self, parse_pool):
+        """Test a body without feed data raises RssParseError from the worker."""
+        with pytest.raises(RssParseError, match="No feed data"):
+            await parse_pool.parse(FEED_URL, b"not a feed", "utf-8", "feedparser")
+
+    @pytest.mark.asyncio
+    async def test_scraper_parses_large_bodies_in_pool(
+        self, settings, parse_pool, sample_rss_feed, monkeypatch
+    ):
+        """Test the scraper sends bodies past the size threshold to the pool."""
+        settings.rss_parse_process_min_bytes = len(sample_rss_feed.encode())
+        sent = []
+        parse = parse_pool.parse
+
+        async def spy(*args):
+            sent.append(args[0])
+            return await parse(*args)
+
+        monkeypatch.setattr(parse_pool, "parse", spy)
+        scraper = RssScraper(settings, parse_pool=parse_pool)
+        scraper.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text=sample_rss_feed),
+            ),
+        )
+
+        result = await scraper.fetch_feed(FEED_URL, limit=1)
+        settings.rss_parse_process_min_bytes += 1
+        await scraper.fetch_feed(FEED_URL, limit=1)
+        await scraper.http_client.aclose()
+
+        assert sent == [FEED_URL]
+        assert result.feed_info.title == "Test Feed"
+        assert [entry.id for entry in result.entries] == ["https://example.com/article/1"]
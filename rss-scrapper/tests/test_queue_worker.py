@@ -0,0 +1,192 @@
+"""Tests for the RSS queue worker."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from bullmq import UnrecoverableError
+
+from src.scraper.media_index import MediaIndex
+from src.scraper.queue_worker import RssQueueWorker
+from src.scraper.rss_scraper import RssScraper
+
+from tests.test_media_index import make_index
+
+
+def make_job(job_id: str, feed_url: str) -> SimpleNamespace:
+    """Build a minimal BullMQ-like job for a collector request."""
+    return SimpleNamespace(
+        id=job_id,
+        timestamp=int(time.time() * 1000),
+        data={
+            "sourceId": f"src-{job_id}",
+            "sourceType": "rss",
+            "externalId": feed_url,
+            "priority": 1,
+            "metadata": {
+                "orchestratorJobId": "orch-1",
+                "scheduledAt": datetime.now(timezone.utc).isoformat(),
+                "sourceMetadata": {},
+            },
+        },
+    )
+
+
+def make_worker(
+    settings,
+    scraper: RssScraper,
+    media_index: Optional[MediaIndex] = None,
+) -> RssQueueWorker:
+    """Create a worker with mocked publishers."""
+    publisher = MagicMock()
+    publisher.publish_success = AsyncMock()
+    publisher.publish_error = AsyncMock()
+    media_publisher = MagicMock()
+    media_publisher.publish_bulk = AsyncMock(return_value=[])
+
+    return RssQueueWorker(settings, scraper, publisher, media_publisher, media_index=media_index)
+
+
+class TestConcurrentFetching:
+    """Feed fetches must not block each other on the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_finish_in_time_of_slowest_feed(
+        self,
+        settings,
+        sample_rss_feed,
+    ):
+        """N concurrent jobs take about as long as the slowest feed, not the sum."""
+        delays = {f"https://feeds.example.com/{i}.xml": 0.1 * (i + 1) for i in range(5)}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(delays[str(request.url)])
+            return httpx.Response(200, text=sample_rss_feed)
+
+        scraper = RssScraper(settings)
+        scraper.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        worker = make_worker(settings, scraper)
+
+        jobs = [make_job(str(i), url) for i, url in enumerate(delays)]
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker._process_job(job, "token") for job in jobs))
+        elapsed = time.perf_counter() - started
+
+        await scraper.close()
+
+        assert worker.publisher.publish_success.await_count == len(jobs)
+        assert elapsed < max(delays.values()) + 0.25
+        assert elapsed < sum(delays.values())
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_during_slow_fetch(
+        self,
+        settings,
+        sample_rss_feed,
+    ):
+        """Other coroutines (heartbeats, lock renewals) keep running while a fetch waits."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.5)
+            return httpx.Response(200, text=sample_rss_feed)
+
+        scraper = RssScraper(settings)
+        scraper.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        worker = make_worker(settings, scraper)
+
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        await worker._process_job(make_job("slow", "https://feeds.example.com/slow.xml"), "token")
+        heartbeat_task.cancel()
+
+        await scraper.close()
+
+        assert ticks >= 5
+
+
+class TestRejectedResponses:
+    """Responses that cannot be a feed fail the job without retries."""
+
+    @pytest.mark.asyncio
+    async def test_html_page_fails_job_unrecoverably(self, settings):
+        """An HTML page publishes a non-retryable error and is not retried by BullMQ."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="<!DOCTYPE html><html><body>Welcome</body></html>")
+
+        scraper = RssScraper(settings)
+        scraper.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        worker = make_worker(settings, scraper)
+
+        with pytest.raises(UnrecoverableError):
+            await worker._process_job(make_job("1", "https://example.com/"), "token")
+
+        await scraper.close()
+
+        error = worker.publisher.publish_error.await_args.kwargs["error"]
+        assert error.code == "NOT_A_FEED_ERROR"
+
+
+SHARED_MEDIA_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Media</title><link>https://example.com</link>
+<item><guid>entry-2</guid><title>Second</title>
+<enclosure url="https://example.com/logo.png" type="image/png" length="1"/></item>
+<item><guid>entry-1</guid><title>First</title>
+<enclosure url="https://example.com/logo.png" type="image/png" length="1"/></item>
+</channel></rss>"""
+
+
+class TestMediaDedup:
+    """Media already queued is referenced instead of uploaded again."""
+
+    @pytest.mark.asyncio
+    async def test_shared_media_is_queued_once(self, settings):
+        """Entries sharing an image publish one upload job and reference its key."""
+        scraper = RssScraper(settings)
+        scraper.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text=SHARED_MEDIA_FEED),
+            ),
+        )
+        media_index, _ = make_index(settings)
+        worker = make_worker(settings, scraper, media_index)
+
+        await worker._process_job(make_job("1", "https://example.com/feed.xml"), "token")
+        await scraper.close()
+
+        (jobs,) = worker.media_publisher.publish_bulk.await_args.args
+        assert [job.targetPath for job in jobs] == ["rss/src-1/entry-2/1.png"]
+        posts = worker.publisher.publish_success.await_args.kwargs["posts"]
+        assert [post.mediaUrls for post in posts] == [["rss/src-1/entry-2/1.png"]] * 2
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_releases_claims(self, settings):
+        """Uploads that never reached the queue can be queued by the next poll."""
+        scraper = RssScraper(settings)
+        scraper.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text=SHARED_MEDIA_FEED),
+            ),
+        )
+        media_index, store = make_index(settings)
+        worker = make_worker(settings, scraper, media_index)
+        worker.media_publisher.publish_bulk.side_effect = ConnectionError("redis down")
+
+        with pytest.raises(ConnectionError):
+            await worker._process_job(make_job("1", "https://example.com/feed.xml"), "token")
+        await scraper.close()
+
+        assert store == {}
@@ -0,0 +1,47 @@
+"""Tests for the shared Redis client factory."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.redis_client import RedisClientFactory
+
+
+class TestRedisClientFactory:
+    """Test RedisClientFactory."""
+
+    def test_clients_share_pool(self, settings):
+        """Test every client draws from the same bounded pool."""
+        factory = RedisClientFactory(settings)
+
+        first = factory.client()
+        second = factory.client()
+
+        assert first is not second
+        assert first.connection_pool is factory.pool
+        assert second.connection_pool is factory.pool
+        assert factory.pool.max_connections == settings.redis_max_connections
+
+    @pytest.mark.asyncio
+    async def test_closing_client_keeps_pool(self, settings):
+        """Test closing one client (as BullMQ does) does not close the pool."""
+        factory = RedisClientFactory(settings)
+        client = factory.client()
+
+        with patch.object(factory.pool, "disconnect", AsyncMock()) as disconnect:
+            await client.aclose()
+            disconnect.assert_not_awaited()
+
+            await factory.close()
+            disconnect.assert_awaited_once()
+
+    def test_stats_empty_pool(self, settings):
+        """Test stats before any connection is opened."""
+        factory = RedisClientFactory(settings)
+
+        assert factory.stats() == {
+            "max": settings.redis_max_connections,
+            "open": 0,
+            "in_use": 0,
+            "idle": 0,
+        }
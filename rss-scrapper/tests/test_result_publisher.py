@@ -0,0 +1,219 @@
+"""Tests for the result publisher."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.models import FetchedPost, PostAuthor
+from src.scraper.result_encoding import decode_posts
+from src.scraper.result_publisher import ResultPublisher
+
+
+def make_publisher(settings) -> ResultPublisher:
+    """Create a publisher with a mocked BullMQ queue."""
+    with patch("src.scraper.result_publisher.Queue"):
+        publisher = ResultPublisher(settings)
+    publisher.queue.add = AsyncMock()
+    publisher.queue.addBulk = AsyncMock()
+    publisher.queue.close = AsyncMock()
+    return publisher
+
+
+def make_post(external_id: str, content: str = "") -> FetchedPost:
+    """Create a minimal fetched post."""
+    return FetchedPost(
+        externalId=external_id,
+        content=content,
+        mediaUrls=[],
+        publishedAt="2025-12-01T00:00:00+00:00",
+        author=PostAuthor(username="feed", displayName="Feed"),
+    )
+
+
+async def publish(
+    publisher: ResultPublisher,
+    source_id: str,
+    posts: list[FetchedPost] | None = None,
+    next_cursor: str | None = None,
+) -> None:
+    """Publish a success result for a source."""
+    await publisher.publish_success(
+        source_id=source_id,
+        source_type="rss",
+        collector_job_id=f"collector-{source_id}",
+        orchestrator_job_id=f"orchestrator-{source_id}",
+        posts=posts or [],
+        next_cursor=next_cursor,
+        processing_time=10,
+        priority=1,
+    )
+
+
+class TestResultBatching:
+    """Tests for micro-batched result publishing."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_adds_each_result(self, settings):
+        """Without batching every result is its own queue.add call."""
+        publisher = make_publisher(settings)
+
+        await publish(publisher, "a")
+        await publish(publisher, "b")
+
+        assert publisher.queue.add.await_count == 2
+        publisher.queue.addBulk.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self, settings):
+        """Concurrent results are written with a single addBulk call."""
+        settings.result_batch_enabled = True
+        settings.result_batch_max_size = 3
+        settings.result_batch_max_delay_ms = 60_000
+        publisher = make_publisher(settings)
+
+        await asyncio.gather(*(publish(publisher, source_id) for source_id in "abc"))
+
+        publisher.queue.add.assert_not_called()
+        publisher.queue.addBulk.assert_awaited_once()
+        jobs = publisher.queue.addBulk.await_args.args[0]
+        assert [job["data"]["sourceId"] for job in jobs] == ["a", "b", "c"]
+        assert all(job["name"] == "process-result" for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_delay(self, settings):
+        """A partial batch is written once the maximum delay has passed."""
+        settings.result_batch_enabled = True
+        settings.result_batch_max_size = 100
+        settings.result_batch_max_delay_ms = 10
+        publisher = make_publisher(settings)
+
+        await asyncio.wait_for(publish(publisher, "a"), timeout=1)
+
+        publisher.queue.addBulk.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_results(self, settings):
+        """Closing the publisher writes buffered results before closing the queue."""
+        settings.result_batch_enabled = True
+        settings.result_batch_max_size = 100
+        settings.result_batch_max_delay_ms = 60_000
+        publisher = make_publisher(settings)
+
+        pending = asyncio.create_task(publish(publisher, "a"))
+        await asyncio.sleep(0)
+        await publisher.close()
+        await pending
+
+        publisher.queue.addBulk.assert_awaited_once()
+        publisher.queue.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_raises_for_every_caller(self, settings):
+        """A failed addBulk is reported to each publisher call in the batch."""
+        settings.result_batch_enabled = True
+        settings.result_batch_max_size = 2
+        publisher = make_publisher(settings)
+        publisher.queue.addBulk.side_effect = ConnectionError("redis down")
+
+        results = await asyncio.gather(
+            publish(publisher, "a"),
+            publish(publisher, "b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+
+class TestResultChunking:
+    """Tests for splitting large results over several jobs."""
+
+    @pytest.mark.asyncio
+    async def test_small_result_is_a_single_unchunked_job(self, settings):
+        """Results under the size limit keep the original job shape."""
+        publisher = make_publisher(settings)
+
+        await publish(publisher, "a", [make_post("1"), make_post("2")], next_cursor="2")
+
+        publisher.queue.add.assert_awaited_once()
+        job_data = publisher.queue.add.await_args.args[1]
+        assert len(job_data["posts"]) == 2
+        assert job_data["nextCursor"] == "2"
+        assert job_data["chunkIndex"] is None
+        assert job_data["chunkTotal"] is None
+
+    @pytest.mark.asyncio
+    async def test_large_result_is_split_with_cursor_on_last_chunk(self, settings):
+        """Posts are split by size and only the last chunk carries the cursor."""
+        settings.result_chunk_max_bytes = 2500
+        publisher = make_publisher(settings)
+        posts = [make_post(str(i), "x" * 1000) for i in range(5)]
+
+        await publish(publisher, "a", posts, next_cursor="4")
+
+        jobs = [call.args[1] for call in publisher.queue.add.await_args_list]
+        assert [len(job["posts"]) for job in jobs] == [2, 2, 1]
+        assert [job["chunkIndex"] for job in jobs] == [0, 1, 2]
+        assert all(job["chunkTotal"] == 3 for job in jobs)
+        assert [job["nextCursor"] for job in jobs] == [None, None, "4"]
+        assert [post["externalId"] for job in jobs for post in job["posts"]] == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+
+    def test_oversized_post_gets_its_own_chunk(self):
+        """A post larger than the limit is not dropped or merged."""
+        posts = [make_post("small"), make_post("big", "x" * 5000), make_post("small-2")]
+
+        chunks = ResultPublisher._chunk_posts(posts, max_bytes=1000)
+
+        assert [[post.externalId for post in chunk] for chunk in chunks] == [
+            ["small"],
+            ["big"],
+            ["small-2"],
+        ]
+
+
+class TestResultEncoding:
+    """Tests for compressed result payloads."""
+
+    @pytest.mark.asyncio
+    async def test_gzip_encodes_posts(self, settings):
+        """With gzip encoding posts are moved into postsEncoded and round-trip."""
+        settings.result_encoding = "gzip"
+        publisher = make_publisher(settings)
+        posts = [make_post("1", "body " * 200), make_post("2", "другий")]
+
+        await publish(publisher, "a", posts, next_cursor="2")
+
+        job_data = publisher.queue.add.await_args.args[1]
+        assert job_data["posts"] is None
+        assert job_data["encoding"] == "gzip"
+        assert job_data["nextCursor"] == "2"
+        assert len(job_data["postsEncoded"]) < len("body " * 200)
+        assert decode_posts(job_data["postsEncoded"], "gzip") == [
+            post.model_dump(mode="json", by_alias=True) for post in posts
+        ]
+
+    @pytest.mark.asyncio
+    async def test_json_encoding_keeps_posts_inline(self, settings):
+        """The default encoding leaves the job data unchanged."""
+        publisher = make_publisher(settings)
+
+        await publish(publisher, "a", [make_post("1")])
+
+        job_data = publisher.queue.add.await_args.args[1]
+        assert job_data["posts"][0]["externalId"] == "1"
+        assert job_data["encoding"] is None
+        assert job_data["postsEncoded"] is None
+
+    def test_zstd_without_zstandard_fails_at_startup(self, settings):
+        """A missing zstandard package is reported before any job is processed."""
+        settings.result_encoding = "zstd"
+
+        with patch.dict("sys.modules", {"zstandard": None}):
+            with pytest.raises(RuntimeError, match="zstandard"):
+                make_publisher(settings)
@@ -0,0 +1,507 @@
+"""Tests for the RSS scraper."""
+
+import re
+from unittest.mock import patch
+
+import feedparser
+import httpx
+import pytest
+
+from src.scraper.feed_cache import FeedValidators
+from src.scraper.result_publisher import ResultPublisher
+from src.scraper.rss_scraper import (
+    FEED_TOO_LARGE_ERROR,
+    NOT_A_FEED_ERROR,
+    SNIFF_BYTES,
+    RssResponseRejectedError,
+    RssScraper,
+)
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+def make_scraper(settings, handler) -> RssScraper:
+    """Create a scraper whose HTTP client is served by a mock transport."""
+    scraper = RssScraper(settings)
+    scraper.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return scraper
+
+
+class TestConditionalFetch:
+    """Tests for conditional GET and unchanged-body short-circuits."""
+
+    @pytest.mark.asyncio
+    async def test_sends_validators_and_short_circuits_on_304(self, settings):
+        """A 304 response is returned as not modified without parsing."""
+        seen_headers = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.update(request.headers)
+            return httpx.Response(304)
+
+        scraper = make_scraper(settings, handler)
+        validators = FeedValidators(etag='"abc"', last_modified="Mon, 01 Dec 2025 00:00:00 GMT")
+
+        with patch("src.scraper.rss_scraper.feedparser.parse") as parse:
+            result = await scraper.fetch_feed(FEED_URL, cursor="entry-1", validators=validators)
+
+        await scraper.close()
+
+        parse.assert_not_called()
+        assert seen_headers["if-none-match"] == '"abc"'
+        assert seen_headers["if-modified-since"] == "Mon, 01 Dec 2025 00:00:00 GMT"
+        assert result.not_modified
+        assert result.entries == []
+        assert result.next_cursor == "entry-1"
+
+    @pytest.mark.asyncio
+    async def test_identical_body_hash_skips_parse(self, settings, sample_rss_feed):
+        """A 200 with the same body as last time is treated as not modified."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_rss_feed, headers={"ETag": '"v2"'})
+
+        scraper = make_scraper(settings, handler)
+
+        first = await scraper.fetch_feed(FEED_URL)
+        assert len(first.entries) == 2
+        assert first.validators.etag == '"v2"'
+
+        with patch("src.scraper.rss_scraper.feedparser.parse") as parse:
+            second = await scraper.fetch_feed(FEED_URL, validators=first.validators)
+
+        await scraper.close()
+
+        parse.assert_not_called()
+        assert second.not_modified
+        assert second.entries == []
+
+    @pytest.mark.asyncio
+    async def test_truncated_fetch_does_not_return_validators(self, settings, sample_rss_feed):
+        """Entries left behind by the limit keep the body from being skipped next time."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_rss_feed)
+
+        scraper = make_scraper(settings, handler)
+        result = await scraper.fetch_feed(FEED_URL, limit=1)
+        await scraper.close()
+
+        assert len(result.entries) == 1
+        assert result.validators is None
+
+
+class TestSeenDedup:
+    """Tests for seen-set deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_returns_unseen_entries_when_cursor_left_the_window(
+        self,
+        settings,
+        sample_rss_feed,
+    ):
+        """Unseen entries are returned even if the cursor entry is no longer in the feed."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_rss_feed)
+
+        scraper = make_scraper(settings, handler)
+        result = await scraper.fetch_feed(
+            FEED_URL,
+            cursor="https://example.com/article/0",
+            seen_ids={"https://example.com/article/1"},
+        )
+        await scraper.close()
+
+        assert [entry.id for entry in result.entries] == ["https://example.com/article/2"]
+        assert result.next_cursor == "https://example.com/article/1"
+
+    @pytest.mark.asyncio
+    async def test_keeps_cursor_when_everything_was_seen(self, settings, sample_rss_feed):
+        """With no new entries the incoming cursor is passed through."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_rss_feed)
+
+        scraper = make_scraper(settings, handler)
+        result = await scraper.fetch_feed(
+            FEED_URL,
+            cursor="https://example.com/article/1",
+            seen_ids={"https://example.com/article/1", "https://example.com/article/2"},
+        )
+        await scraper.close()
+
+        assert result.entries == []
+        assert result.next_cursor == "https://example.com/article/1"
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_honored_with_an_empty_seen_set(self, settings, sample_rss_feed):
+        """A seen set that was never filled (or expired) does not re-emit old entries."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_rss_feed)
+
+        scraper = make_scraper(settings, handler)
+        result = await scraper.fetch_feed(
+            FEED_URL,
+            cursor="https://example.com/article/2",
+            seen_ids=set(),
+        )
+        await scraper.close()
+
+        assert [entry.id for entry in result.entries] == ["https://example.com/article/1"]
+        assert result.next_cursor == "https://example.com/article/1"
+
+    @pytest.mark.asyncio
+    async def test_backlog_larger_than_limit_is_worked_off_across_polls(self, settings):
+        """A poll cut by the limit loses no entry; the backlog goes out oldest first."""
+        items = "".join(
+            f"<item><title>Article {i}</title><guid>article-{i}</guid></item>"
+            for i in range(30, 0, -1)
+        )
+        feed = f'<rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'
+        scraper = make_scraper(settings, lambda request: httpx.Response(200, text=feed))
+
+        emitted: list[str] = []
+        cursor = "article-5"
+        for _ in range(4):
+            result = await scraper.fetch_feed(FEED_URL, limit=10, cursor=cursor)
+            emitted.extend(entry.id for entry in result.entries)
+            cursor = result.next_cursor
+        await scraper.close()
+
+        assert emitted[:10] == [f"article-{i}" for i in range(15, 5, -1)]
+        assert sorted(emitted) == sorted(f"article-{i}" for i in range(6, 31))
+        assert cursor == "article-30"
+
+
+class TestStreamingParser:
+    """Tests for the incremental parser mode."""
+
+    @staticmethod
+    def build_archive(item_count: int) -> list[bytes]:
+        """Build a large RSS document split into one chunk per item."""
+        chunks = [
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b"<rss version=\"2.0\"><channel><title>Archive</title>"
+            b"<link>https://example.com</link><description>Full archive</description>",
+        ]
+        for i in range(item_count):
+            chunks.append(
+                f"<item><title>Article {i}</title><guid>article-{i}</guid>"
+                f"<description>{'x' * 1000}</description></item>".encode(),
+            )
+        chunks.append(b"</channel></rss>")
+        return chunks
+
+    def make_streaming_scraper(self, settings, chunks, pulled):
+        """Create a streaming-mode scraper that counts the chunks it reads."""
+        settings.rss_parser_mode = "streaming"
+
+        async def body():
+            for chunk in chunks:
+                pulled.append(chunk)
+                yield chunk
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body(), headers={"ETag": '"v1"'})
+
+        return make_scraper(settings, handler)
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_limit(self, settings):
+        """The body is not read further once the limit is exceeded."""
+        chunks = self.build_archive(1000)
+        pulled: list[bytes] = []
+        scraper = self.make_streaming_scraper(settings, chunks, pulled)
+
+        result = await scraper.fetch_feed(FEED_URL, limit=3)
+        await scraper.close()
+
+        assert [entry.id for entry in result.entries] == ["article-0", "article-1", "article-2"]
+        assert result.feed_info.title == "Archive"
+        assert result.next_cursor == "article-0"
+        assert result.validators is None
+        assert len(pulled) < 10
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_cursor(self, settings):
+        """Entries from the cursor on are neither returned nor downloaded."""
+        chunks = self.build_archive(1000)
+        pulled: list[bytes] = []
+        scraper = self.make_streaming_scraper(settings, chunks, pulled)
+
+        result = await scraper.fetch_feed(FEED_URL, limit=50, cursor="article-2")
+        await scraper.close()
+
+        assert [entry.id for entry in result.entries] == ["article-0", "article-1"]
+        assert result.next_cursor == "article-0"
+        assert result.validators.etag == '"v1"'
+        assert len(pulled) < 10
+
+    @pytest.mark.asyncio
+    async def test_parses_atom(self, settings, sample_atom_feed):
+        """Atom feeds are parsed incrementally as well."""
+        pulled: list[bytes] = []
+        scraper = self.make_streaming_scraper(settings, [sample_atom_feed.encode()], pulled)
+
+        with patch("src.scraper.rss_scraper.feedparser.parse") as parse:
+            result = await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        parse.assert_not_called()
+        assert result.feed_info.title
+        assert result.entries
+        assert all(entry.id for entry in result.entries)
+
+    @pytest.mark.asyncio
+    async def test_entry_without_guid_link_or_title_gets_a_stable_id(self, settings):
+        """The last-resort ID is a content digest, the same in every process."""
+        feed = (
+            '<rss version="2.0"><channel><title>Feed</title>'
+            "<item><description>Untitled note</description></item></channel></rss>"
+        )
+        scraper = self.make_streaming_scraper(settings, [feed.encode()], [])
+
+        result = await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        (entry,) = result.entries
+        assert re.fullmatch(r"[0-9a-f]{40}", entry.id)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_feedparser_for_unsupported_documents(self, settings):
+        """Documents the streaming parser does not understand go through feedparser."""
+        rdf = (
+            '<?xml version="1.0"?>'
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+            'xmlns="http://purl.org/rss/1.0/">'
+            '<channel rdf:about="https://example.com"><title>RDF</title>'
+            "<link>https://example.com</link><description>d</description></channel>"
+            '<item rdf:about="https://example.com/a"><title>A</title>'
+            "<link>https://example.com/a</link></item>"
+            "</rdf:RDF>"
+        )
+        settings.rss_parser_mode = "streaming"
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text=rdf)
+
+        scraper = make_scraper(settings, handler)
+        result = await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        assert [entry.link for entry in result.entries] == ["https://example.com/a"]
+        # The body read by the streaming parser is reused rather than requested again
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_cursor_means_the_same_after_falling_back(self, settings):
+        """Streaming and its feedparser fallback pick the same entries and cursor."""
+        items = "".join(
+            f"<item><title>Article {i}</title><guid>article-{i}</guid></item>" for i in range(4)
+        )
+        feed = f'<rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'
+        scraper = self.make_streaming_scraper(settings, [feed.encode()], [])
+        streamed = await scraper.fetch_feed(FEED_URL, limit=1, cursor="article-2")
+        await scraper.close()
+
+        # Mismatched tags make the streaming parser give up, feedparser copes with them
+        scraper = self.make_streaming_scraper(
+            settings,
+            [feed.replace("<title>Feed</title>", "<title>Feed</b></title>").encode()],
+            [],
+        )
+        with patch.object(RssScraper, "_parse_body", wraps=scraper._parse_body) as parse_body:
+            fallback = await scraper.fetch_feed(FEED_URL, limit=1, cursor="article-2")
+        await scraper.close()
+
+        parse_body.assert_called_once()
+        assert parse_body.call_args.args[1] == feed.replace(
+            "<title>Feed</title>", "<title>Feed</b></title>"
+        ).encode()
+        # Cut by the limit, both return the oldest new entry and keep article-0 pending
+        assert [entry.id for entry in streamed.entries] == ["article-1"]
+        assert [entry.id for entry in fallback.entries] == ["article-1"]
+        assert fallback.next_cursor == streamed.next_cursor == "article-1"
+
+
+class TestFastParser:
+    """Tests for the fast path of the default parser mode."""
+
+    @pytest.mark.asyncio
+    async def test_well_formed_rss_skips_feedparser(self, settings, sample_rss_feed):
+        """Well-formed RSS is parsed without feedparser."""
+        scraper = make_scraper(settings, lambda request: httpx.Response(200, text=sample_rss_feed))
+
+        with patch("src.scraper.rss_scraper.feedparser.parse") as parse:
+            result = await scraper.fetch_feed(FEED_URL, limit=1)
+        await scraper.close()
+
+        parse.assert_not_called()
+        assert result.feed_info.title == "Test Feed"
+        assert [entry.id for entry in result.entries] == ["https://example.com/article/1"]
+        assert result.entries[0].published.isoformat() == "2025-12-01T10:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_parses_json_feed(self, settings):
+        """JSON Feed items become entries with attachments as enclosures."""
+        document = {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": "JSON Feed",
+            "home_page_url": "https://example.com",
+            "items": [
+                {
+                    "id": 2,
+                    "url": "https://example.com/2",
+                    "title": "Second",
+                    "content_html": "<p>Hello</p>",
+                    "date_published": "2025-12-01T10:00:00Z",
+                    "authors": [{"name": "Jane", "url": "mailto:jane@example.com"}],
+                    "tags": ["news"],
+                    "attachments": [
+                        {"url": "https://example.com/2.mp3", "mime_type": "audio/mpeg"},
+                    ],
+                },
+                {"id": "1", "content_text": "First"},
+            ],
+        }
+        scraper = make_scraper(settings, lambda request: httpx.Response(200, json=document))
+
+        result = await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        assert result.feed_info.title == "JSON Feed"
+        assert result.feed_info.link == "https://example.com"
+        assert [entry.id for entry in result.entries] == ["2", "1"]
+        assert result.entries[1].content == "First"
+        entry = result.entries[0]
+        assert entry.content == "<p>Hello</p>"
+        assert (entry.author, entry.author_email) == ("Jane", "jane@example.com")
+        assert entry.tags == ["news"]
+        assert entry.enclosures == [
+            {"url": "https://example.com/2.mp3", "type": "audio/mpeg", "length": ""},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_malformed_xml_falls_back_to_feedparser(self, settings):
+        """Documents expat rejects (HTML entities here) are parsed by feedparser."""
+        rss = (
+            '<rss version="2.0"><channel><title>Loose&nbsp;Feed</title>'
+            "<item><title>A&nbsp;B</title><guid>a</guid></item></channel></rss>"
+        )
+        scraper = make_scraper(settings, lambda request: httpx.Response(200, text=rss))
+
+        with patch(
+            "src.scraper.rss_scraper.feedparser.parse",
+            wraps=feedparser.parse,
+        ) as parse:
+            result = await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        parse.assert_called_once()
+        assert [entry.id for entry in result.entries] == ["a"]
+
+
+class TestResponseRejection:
+    """Oversized and non-feed responses fail fast without being parsed."""
+
+    @staticmethod
+    def make_counting_scraper(settings, chunks, pulled, headers=None):
+        """Create a scraper serving chunks and counting the ones it reads."""
+
+        async def body():
+            for chunk in chunks:
+                pulled.append(chunk)
+                yield chunk
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body(), headers=headers)
+
+        return make_scraper(settings, handler)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parser_mode", ["feedparser", "streaming"])
+    async def test_oversized_body_is_aborted(self, settings, parser_mode):
+        """Reading stops as soon as the body exceeds the limit."""
+        settings.rss_parser_mode = parser_mode
+        settings.rss_max_response_bytes = 64 * 1024
+        chunks = [b"<rss version='2.0'><channel>"] + [b"<item>" + b"x" * 8192 + b"</item>"] * 1000
+        pulled: list[bytes] = []
+        scraper = self.make_counting_scraper(settings, chunks, pulled)
+
+        with pytest.raises(RssResponseRejectedError) as exc_info:
+            await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        assert exc_info.value.code == FEED_TOO_LARGE_ERROR
+        assert len(pulled) < 20
+
+    @pytest.mark.asyncio
+    async def test_declared_length_is_rejected_before_reading(self, settings):
+        """A Content-Length above the limit is rejected without reading the body."""
+        settings.rss_max_response_bytes = 1024
+        pulled: list[bytes] = []
+        scraper = self.make_counting_scraper(
+            settings,
+            [b"ID3" + b"\x00" * 4096],
+            pulled,
+            headers={"Content-Length": "209715200"},
+        )
+
+        with pytest.raises(RssResponseRejectedError) as exc_info:
+            await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        assert exc_info.value.code == FEED_TOO_LARGE_ERROR
+        assert pulled == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body,headers",
+        [
+            (b"<!DOCTYPE html><html><head><title>Home</title></head><body>", {}),
+            (b"ID3\x04\x00\x00\x00\x00\x00" + b"\xff" * 2048, {}),
+            (b"\xff\xfb\x90\x00" * 512, {"Content-Type": "audio/mpeg"}),
+        ],
+        ids=["html", "binary", "audio"],
+    )
+    async def test_non_feed_body_is_rejected(self, settings, body, headers):
+        """HTML pages and binary files are rejected from their first bytes."""
+        pulled: list[bytes] = []
+        scraper = self.make_counting_scraper(settings, [body] * 100, pulled, headers=headers)
+
+        with patch("src.scraper.rss_scraper.feedparser.parse") as parse:
+            with pytest.raises(RssResponseRejectedError) as exc_info:
+                await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        parse.assert_not_called()
+        assert exc_info.value.code == NOT_A_FEED_ERROR
+        # Only about the sniffed first KB is downloaded
+        assert len(b"".join(pulled)) < 2 * SNIFF_BYTES + len(body)
+
+    @pytest.mark.asyncio
+    async def test_feeds_pass_sniffing(self, settings, sample_rss_feed):
+        """XML feeds with a BOM or served as text/html are still parsed."""
+        body = b"\xef\xbb\xbf" + sample_rss_feed.encode()
+        scraper = self.make_counting_scraper(
+            settings,
+            [body[:10], body[10:]],
+            [],
+            headers={"Content-Type": "text/html"},
+        )
+
+        result = await scraper.fetch_feed(FEED_URL)
+        await scraper.close()
+
+        assert len(result.entries) == 2
+
+    def test_rejected_response_is_not_retryable(self):
+        """The error result carries the rejection code and is not retryable."""
+        error = RssResponseRejectedError("HTML page", code=NOT_A_FEED_ERROR)
+
+        assert ResultPublisher._get_error_code(error) == NOT_A_FEED_ERROR
+        assert ResultPublisher._is_retryable_error(error) is False
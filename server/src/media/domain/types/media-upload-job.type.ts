@@ -7,6 +7,8 @@ export type BaseMediaUploadJobData = {
   mediaIndex: number;
   targetPath: string;
   contentType: string;
+  mediaIndexKey?: string; // Media index claim of the source URL, held while pending
+  mediaIndexTtl?: number; // Seconds to keep the claim once the upload is done
 };
 
 export type BufferMediaUploadJobData = BaseMediaUploadJobData & {
@@ -17,6 +19,7 @@ export type BufferMediaUploadJobData = BaseMediaUploadJobData & {
 export type UrlMediaUploadJobData = BaseMediaUploadJobData & {
   source: 'url';
   sourceUrl: string;
+  expiresAt?: string; // ISO date after which sourceUrl no longer works
 };
 
 export type MediaUploadJobData =
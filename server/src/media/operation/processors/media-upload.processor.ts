@@ -1,17 +1,31 @@
 import { Processor, WorkerHost } from '@nestjs/bullmq';
-import { Job } from 'bullmq';
+import { Job, UnrecoverableError } from 'bullmq';
 
+import { RedisService } from '@/commons/redis';
 import { LoggerService } from '@/logger';
 import { MediaQueue } from '@/media/domain/queues';
 import { MediaUploadJobData } from '@/media/domain/types';
 import { MediaUploadService } from '@/media/service/media-upload-service';
 
+// Keeps (ARGV[2] > 0: for ARGV[2] seconds) or drops the media index claim in
+// KEYS[1], unless a later upload of the URL has claimed it since (value ARGV[1])
+const SETTLE_CLAIM_SCRIPT = `
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+if tonumber(ARGV[2]) > 0 then
+  return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return redis.call('DEL', KEYS[1])
+`;
+
 @Processor(MediaQueue.MEDIA_UPLOAD, {
   concurrency: 5,
 })
 export class MediaUploadProcessor extends WorkerHost {
   constructor(
     private readonly mediaUploadService: MediaUploadService,
+    private readonly redisService: RedisService,
     private readonly logger: LoggerService,
   ) {
     super();
@@ -24,8 +38,22 @@ export class MediaUploadProcessor extends WorkerHost {
       `Processing media upload job ${id} for ${data.targetPath}`,
     );
 
+    // An expired signed URL only answers 403, so retrying it is pointless
+    if (
+      data.source === 'url' &&
+      data.expiresAt &&
+      Date.parse(data.expiresAt) <= Date.now()
+    ) {
+      this.logger.warn(
+        `Skipping media upload job ${id} for ${data.targetPath}: source URL expired at ${data.expiresAt}`,
+      );
+      await this.settleMediaIndexClaim(data, false);
+      throw new UnrecoverableError(`Source URL expired at ${data.expiresAt}`);
+    }
+
     try {
       await this.mediaUploadService.processUploadJob(data);
+      await this.settleMediaIndexClaim(data, true);
 
       this.logger.debug(
         `Successfully processed media upload job ${id} for ${data.targetPath}`,
@@ -35,7 +63,43 @@ export class MediaUploadProcessor extends WorkerHost {
         `Failed to process media upload job ${id} for ${data.targetPath}: ${error instanceof Error ? error.message : String(error)}`,
         error instanceof Error ? error.stack : undefined,
       );
+      // After the last attempt, posts must stop resolving to this upload
+      if (job.attemptsMade + 1 >= (job.opts.attempts ?? 1)) {
+        await this.settleMediaIndexClaim(data, false);
+      }
       throw error; // Re-throw to trigger BullMQ retry
     }
   }
+
+  /**
+   * Scrapers claim a media URL for the upload's target path with a short
+   * TTL while the job is pending. Once the upload is done, the claim is kept
+   * for mediaIndexTtl so later posts reuse the file; when it failed for good,
+   * the claim is dropped so the next post queues its own upload.
+   */
+  private async settleMediaIndexClaim(
+    data: MediaUploadJobData,
+    uploaded: boolean,
+  ): Promise<void> {
+    if (!data.mediaIndexKey) {
+      return;
+    }
+
+    try {
+      await this.redisService
+        .getClient()
+        .eval(
+          SETTLE_CLAIM_SCRIPT,
+          1,
+          data.mediaIndexKey,
+          data.targetPath,
+          uploaded ? (data.mediaIndexTtl ?? 0) : 0,
+        );
+    } catch (error) {
+      // The claim then simply expires with its pending TTL
+      this.logger.warn(
+        `Failed to update media index claim for ${data.targetPath}: ${error instanceof Error ? error.message : String(error)}`,
+      );
+    }
+  }
 }
@@ -6,6 +6,9 @@ import { LoggerService } from '@/logger';
 import { MediaQueue } from '@/media/domain/queues';
 import { MediaUploadJobData } from '@/media/domain/types';
 
+// Lowest BullMQ priority, so uploads of expiring signed URLs go first
+const MEDIA_JOB_PRIORITY = 2 ** 21;
+
 @Injectable()
 export class MediaUploadQueueService {
   constructor(
@@ -19,6 +22,7 @@ export class MediaUploadQueueService {
    */
   async addJob(data: MediaUploadJobData): Promise<string> {
     const job = await this.mediaUploadQueue.add('upload-media', data, {
+      priority: MEDIA_JOB_PRIORITY,
       attempts: 5,
       backoff: {
         type: 'exponential',
@@ -43,6 +47,7 @@ export class MediaUploadQueueService {
       name: 'upload-media',
       data,
       opts: {
+        priority: MEDIA_JOB_PRIORITY,
         attempts: 5,
         backoff: {
           type: 'exponential' as const,
@@ -1,4 +1,5 @@
 import { Injectable } from '@nestjs/common';
+import * as zlib from 'zlib';
 
 import { LoggerService } from '@/logger';
 import { CacheService } from '@/commons/cache';
@@ -11,7 +12,7 @@ import { Content } from '@/raw-posts/domain/types';
 
 import { SourceId } from '@/sources/domain/schemas';
 import { SourceStatus } from '@/sources/domain/enums';
-import { ResultJobData, FetchedPost } from './types';
+import { ResultJobData, FetchedPost, ResultEncoding } from './types';
 
 @Injectable()
 export class SourcesResultService {
@@ -26,10 +27,15 @@ export class SourcesResultService {
    * Process result job: store posts, update cache, update source metadata
    */
   async processResultJob(jobData: ResultJobData): Promise<void> {
-    const { sourceId, status, posts, nextCursor, error } = jobData;
+    const { sourceId, status, nextCursor, error } = jobData;
+    const posts = this.decodePosts(jobData);
+    const isFinalChunk = this.isFinalChunk(jobData);
 
     this.logger.debug(
-      `Processing result job for source ${sourceId}, status=${status}, postsCount=${posts?.length || 0}`,
+      `Processing result job for source ${sourceId}, status=${status}, postsCount=${posts?.length || 0}` +
+        (jobData.chunkTotal
+          ? `, chunk=${(jobData.chunkIndex ?? 0) + 1}/${jobData.chunkTotal}`
+          : ''),
     );
 
     if (status === 'error') {
@@ -39,11 +45,7 @@ export class SourcesResultService {
 
     if (!posts || posts.length === 0) {
       this.logger.debug(`No posts to process for source ${sourceId}`);
-      await this.updateSourceMetadata(sourceId, {
-        lastFetchedAt: new Date(),
-        cursor: nextCursor,
-        lastFetchSuccess: true,
-      });
+      await this.completeFetch(sourceId, nextCursor, isFinalChunk);
       return;
     }
 
@@ -54,11 +56,7 @@ export class SourcesResultService {
       this.logger.debug(
         `All ${posts.length} posts for source ${sourceId} are duplicates`,
       );
-      await this.updateSourceMetadata(sourceId, {
-        lastFetchedAt: new Date(),
-        cursor: nextCursor,
-        lastFetchSuccess: true,
-      });
+      await this.completeFetch(sourceId, nextCursor, isFinalChunk);
       return;
     }
 
@@ -82,14 +80,76 @@ export class SourcesResultService {
     );
 
     // 4. Update source metadata in database
+    await this.completeFetch(sourceId, nextCursor, isFinalChunk);
+
+    // 5. Update cache with new posts (5 minute TTL)
+    await this.updateCache(sourceId, newPosts);
+  }
+
+  /**
+   * Get posts from a result job, decompressing them if the collector encoded them
+   */
+  private decodePosts(jobData: ResultJobData): FetchedPost[] | undefined {
+    if (!jobData.encoding || !jobData.postsEncoded) {
+      return jobData.posts;
+    }
+
+    const compressed = Buffer.from(jobData.postsEncoded, 'base64');
+    const json = this.decompress(compressed, jobData.encoding).toString('utf8');
+
+    return JSON.parse(json) as FetchedPost[];
+  }
+
+  /**
+   * Decompress an encoded posts payload
+   */
+  private decompress(data: Buffer, encoding: ResultEncoding): Buffer {
+    if (encoding === 'gzip') {
+      return zlib.gunzipSync(data);
+    }
+
+    // zlib gained zstd support in Node 22.15 / 23.8
+    const zstdDecompressSync = (
+      zlib as unknown as { zstdDecompressSync?: (buffer: Buffer) => Buffer }
+    ).zstdDecompressSync;
+    if (!zstdDecompressSync) {
+      throw new Error(
+        `Result encoding ${encoding} is not supported by Node ${process.version}`,
+      );
+    }
+
+    return zstdDecompressSync(data);
+  }
+
+  /**
+   * Whether a result job is the last (or only) chunk of a fetch
+   */
+  private isFinalChunk(jobData: ResultJobData): boolean {
+    if (jobData.chunkTotal == null) {
+      return true;
+    }
+
+    return (jobData.chunkIndex ?? 0) === jobData.chunkTotal - 1;
+  }
+
+  /**
+   * Record a successful fetch. Only the final chunk carries the next cursor,
+   * so earlier chunks must not touch the metadata (a missing cursor resets it).
+   */
+  private async completeFetch(
+    sourceId: SourceId,
+    nextCursor: string | undefined,
+    isFinalChunk: boolean,
+  ): Promise<void> {
+    if (!isFinalChunk) {
+      return;
+    }
+
     await this.updateSourceMetadata(sourceId, {
       lastFetchedAt: new Date(),
       cursor: nextCursor,
       lastFetchSuccess: true,
     });
-
-    // 5. Update cache with new posts (5 minute TTL)
-    await this.updateCache(sourceId, newPosts);
   }
 
   /**
@@ -360,6 +420,8 @@ export class SourcesResultService {
       'FEED_NOT_FOUND_ERROR',
       'FEED_ACCESS_DENIED_ERROR',
       'PARSE_ERROR',
+      'FEED_TOO_LARGE_ERROR',
+      'NOT_A_FEED_ERROR',
     ];
 
     return !error.retryable || permanentErrorCodes.includes(error.code);
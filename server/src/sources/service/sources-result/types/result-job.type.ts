@@ -21,6 +21,8 @@ export type FetchedPost = {
   };
 };
 
+export type ResultEncoding = 'gzip' | 'zstd';
+
 /**
  * Job data for results queue
  * Created by Collector Workers after fetching posts
@@ -31,6 +33,18 @@ export type ResultJobData = {
   status: 'success' | 'error';
   posts?: FetchedPost[];
   nextCursor?: string;
+  /**
+   * Set when the posts of one fetch are split over several result jobs.
+   * Chunks are processed independently; only the last one carries nextCursor.
+   */
+  chunkIndex?: number | null; // 0-based
+  chunkTotal?: number | null;
+  /**
+   * Set when posts are compressed: `posts` is null and `postsEncoded` holds
+   * the base64 of the compressed JSON array.
+   */
+  encoding?: ResultEncoding | null;
+  postsEncoded?: string | null;
   error?: {
     code: string;
     message: string;
@@ -2,7 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +17,27 @@ class Settings(BaseSettings):
         description="Redis connection URL for BullMQ queues",
         alias="REDIS_URL",
     )
+    redis_max_connections: int = Field(
+        default=20,
+        description="Size of the Redis connection pool shared by all queues, the worker "
+        "and stores (keep above WORKER_CONCURRENCY + 2)",
+        alias="REDIS_MAX_CONNECTIONS",
+    )
+    redis_pool_timeout: float = Field(
+        default=10.0,
+        description="Seconds to wait for a free pooled Redis connection",
+        alias="REDIS_POOL_TIMEOUT",
+    )
+    redis_health_check_interval: int = Field(
+        default=30,
+        description="PING pooled Redis connections idle for longer than this many seconds",
+        alias="REDIS_HEALTH_CHECK_INTERVAL",
+    )
+    redis_stats_interval: int = Field(
+        default=300,
+        description="Log Redis pool statistics every this many seconds (0 disables)",
+        alias="REDIS_STATS_INTERVAL",
+    )
 
     # Queue Names (matching NestJS SourceQueue enum)
     twitter_fetcher_queue: str = Field(
@@ -45,12 +66,169 @@ class Settings(BaseSettings):
         alias="TWITTER_MAX_TWEETS",
     )
 
+    # Deduplication (already emitted tweets per source)
+    seen_index_enabled: bool = Field(
+        default=True,
+        description="Skip tweets already emitted for a source instead of scanning for the cursor",
+        alias="SEEN_INDEX_ENABLED",
+    )
+    seen_index_max_size: int = Field(
+        default=2000,
+        description="Maximum number of emitted tweet IDs remembered per source",
+        alias="SEEN_INDEX_MAX_SIZE",
+    )
+    seen_index_ttl: int = Field(
+        default=30 * 24 * 60 * 60,
+        description="How long emitted tweet IDs are remembered, in seconds",
+        alias="SEEN_INDEX_TTL",
+    )
+    seen_stop_after: int = Field(
+        default=4,
+        description="Stop paging a timeline after this many consecutive already-seen tweets "
+        "(must exceed the number of pinned tweets, which appear first out of order)",
+        alias="SEEN_STOP_AFTER",
+    )
+
+    # Media deduplication (uploads already queued, by URL, shared by all sources)
+    media_index_enabled: bool = Field(
+        default=True,
+        description="Reuse the storage key of media whose URL was already uploaded or queued "
+        "instead of publishing another upload job",
+        alias="MEDIA_INDEX_ENABLED",
+    )
+    media_index_ttl: int = Field(
+        default=30 * 24 * 60 * 60,
+        description="How long uploaded media URLs are remembered, in seconds",
+        alias="MEDIA_INDEX_TTL",
+    )
+    media_index_pending_ttl: int = Field(
+        default=24 * 60 * 60,
+        description="How long media URLs are remembered while their upload is pending, in "
+        "seconds (the media worker extends it to MEDIA_INDEX_TTL once uploaded)",
+        alias="MEDIA_INDEX_PENDING_TTL",
+    )
+
+    # Media pre-flight probe (HEAD/Range request per media URL before queueing its upload)
+    media_probe_enabled: bool = Field(
+        default=False,
+        description="Check media URLs before queueing uploads: drop dead, non-media and "
+        "oversized files and take content type and extension from the response",
+        alias="MEDIA_PROBE_ENABLED",
+    )
+    media_probe_concurrency: int = Field(
+        default=10,
+        description="Maximum number of media probe requests in flight",
+        alias="MEDIA_PROBE_CONCURRENCY",
+    )
+    media_probe_timeout: float = Field(
+        default=5.0,
+        description="Timeout of a media probe request in seconds (media is kept on timeout)",
+        alias="MEDIA_PROBE_TIMEOUT",
+    )
+    media_probe_max_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        description="Drop media larger than this many bytes (0 disables the limit)",
+        alias="MEDIA_PROBE_MAX_BYTES",
+    )
+
+    # Inline small media (downloaded at scrape time, shipped as a buffer upload job)
+    media_inline_enabled: bool = Field(
+        default=False,
+        description="Download small media while scraping and send it inside the upload job, "
+        "so the media worker does not fetch it from the origin again",
+        alias="MEDIA_INLINE_ENABLED",
+    )
+    media_inline_max_bytes: int = Field(
+        default=128 * 1024,
+        description="Largest media file inlined, in bytes",
+        alias="MEDIA_INLINE_MAX_BYTES",
+    )
+    media_inline_job_budget: int = Field(
+        default=1024 * 1024,
+        description="Bytes of media inlined per fetch job at most (base64 adds a third in Redis)",
+        alias="MEDIA_INLINE_JOB_BUDGET",
+    )
+    media_inline_concurrency: int = Field(
+        default=10,
+        description="Maximum number of inline media downloads in flight",
+        alias="MEDIA_INLINE_CONCURRENCY",
+    )
+    media_inline_timeout: float = Field(
+        default=10.0,
+        description="Timeout of an inline media download in seconds (falls back to a URL job)",
+        alias="MEDIA_INLINE_TIMEOUT",
+    )
+
+    # User cache (username -> user ID and profile)
+    user_cache_enabled: bool = Field(
+        default=True,
+        description="Cache username lookups in Redis instead of resolving before every fetch",
+        alias="USER_CACHE_ENABLED",
+    )
+    user_cache_ttl: int = Field(
+        default=24 * 60 * 60,
+        description="How long a cached user is fresh, in seconds",
+        alias="USER_CACHE_TTL",
+    )
+    user_cache_stale_ttl: int = Field(
+        default=7 * 24 * 60 * 60,
+        description="How long an expired user is still served while it is refreshed, in seconds",
+        alias="USER_CACHE_STALE_TTL",
+    )
+
+    # Result publishing
+    result_batch_enabled: bool = Field(
+        default=False,
+        description="Buffer results and write them to the results queue with addBulk",
+        alias="RESULT_BATCH_ENABLED",
+    )
+    result_batch_max_size: int = Field(
+        default=50,
+        description="Flush the result batch once it holds this many results",
+        alias="RESULT_BATCH_MAX_SIZE",
+    )
+    result_batch_max_delay_ms: int = Field(
+        default=50,
+        description="Flush the result batch at most this many milliseconds after its first result",
+        alias="RESULT_BATCH_MAX_DELAY_MS",
+    )
+
+    result_chunk_max_bytes: int = Field(
+        default=512 * 1024,
+        description="Split posts of one fetch into result jobs of at most this many bytes "
+        "of post JSON (0 disables chunking)",
+        alias="RESULT_CHUNK_MAX_BYTES",
+    )
+    result_encoding: Literal["json", "gzip", "zstd"] = Field(
+        default="json",
+        description="Store result posts as plain JSON or compressed (gzip, or zstd with the zstd "
+        "extra installed) and base64 encoded",
+        alias="RESULT_ENCODING",
+    )
+
     # Worker Configuration
     worker_concurrency: int = Field(
         default=1,
         description="Number of concurrent jobs to process",
         alias="WORKER_CONCURRENCY",
     )
+    twitter_account_scheduling: bool = Field(
+        default=True,
+        description="Run one fetch per active account at once (at least WORKER_CONCURRENCY) "
+        "and defer jobs while every account is rate limited",
+        alias="TWITTER_ACCOUNT_SCHEDULING",
+    )
+    twitter_defer_delay: int = Field(
+        default=60,
+        description="Seconds a job is deferred when no account rate limit reset is known",
+        alias="TWITTER_DEFER_DELAY",
+    )
+    twitter_max_defer: float = Field(
+        default=3600.0,
+        description="Seconds after its creation a job waiting for an account stops being "
+        "deferred and fails instead",
+        alias="TWITTER_MAX_DEFER",
+    )
 
     # S3/MinIO Configuration
     s3_endpoint: str = Field(
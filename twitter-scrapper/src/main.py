@@ -6,10 +6,17 @@ import signal
 import sys
 
 from src.config import get_settings
+from src.redis_client import RedisClientFactory
+from src.scraper.account_scheduler import AccountScheduler
 from src.scraper.twitter_scraper import TwitterScraper
 from src.scraper.queue_worker import TwitterQueueWorker
 from src.scraper.result_publisher import ResultPublisher
 from src.scraper.media_upload_publisher import MediaUploadPublisher
+from src.scraper.media_index import MediaIndex
+from src.scraper.media_inline import MediaInliner
+from src.scraper.media_probe import MediaProbe
+from src.scraper.seen_index import SeenIndex
+from src.scraper.user_cache import UserCache
 
 
 def setup_logging() -> None:
@@ -30,6 +37,8 @@ class TwitterScrapperApp:
         self.logger = logging.getLogger(__name__)
         self.worker: TwitterQueueWorker | None = None
         self.scraper: TwitterScraper | None = None
+        self.redis_factory: RedisClientFactory | None = None
+        self.stats_task: asyncio.Task | None = None
         self.shutdown_event = asyncio.Event()
 
     def setup_signal_handlers(self) -> None:
@@ -47,22 +56,65 @@ class TwitterScrapperApp:
         self.logger.info("Twitter Scrapper starting...")
 
         try:
+            # One connection pool for every queue, the worker and the stores
+            self.redis_factory = RedisClientFactory(self.settings)
+            redis_factory = self.redis_factory
+
             # Initialize components
-            self.scraper = TwitterScraper(self.settings)
+            user_cache = (
+                UserCache(self.settings, redis_factory.client())
+                if self.settings.user_cache_enabled
+                else None
+            )
+            self.scraper = TwitterScraper(self.settings, user_cache)
             await self.scraper.initialize()
 
-            publisher = ResultPublisher(self.settings)
-            media_publisher = MediaUploadPublisher(self.settings)
+            account_scheduler = None
+            if self.settings.twitter_account_scheduling and self.scraper.api:
+                account_scheduler = AccountScheduler(self.settings, self.scraper.api.pool)
+                await account_scheduler.initialize()
+
+            publisher = ResultPublisher(self.settings, redis_factory.client())
+            media_publisher = MediaUploadPublisher(self.settings, redis_factory.client())
+            seen_index = (
+                SeenIndex(self.settings, redis_factory.client())
+                if self.settings.seen_index_enabled
+                else None
+            )
+            media_index = (
+                MediaIndex(self.settings, redis_factory.client())
+                if self.settings.media_index_enabled
+                else None
+            )
+            media_probe = (
+                MediaProbe(self.settings)
+                if self.settings.media_probe_enabled
+                else None
+            )
+            media_inliner = (
+                MediaInliner(self.settings)
+                if self.settings.media_inline_enabled
+                else None
+            )
             self.worker = TwitterQueueWorker(
                 self.settings,
                 self.scraper,
                 publisher,
                 media_publisher,
+                seen_index,
+                account_scheduler,
+                media_index=media_index,
+                media_probe=media_probe,
+                media_inliner=media_inliner,
+                redis=redis_factory.client(),
             )
 
             # Start the worker
             self.worker.start()
 
+            if self.settings.redis_stats_interval > 0:
+                self.stats_task = asyncio.create_task(self._log_redis_stats())
+
             self.logger.info("Twitter Scrapper initialized successfully")
             self.logger.info(
                 f"Worker listening on queue: {self.settings.twitter_fetcher_queue}",
@@ -83,13 +135,31 @@ class TwitterScrapperApp:
         finally:
             await self.stop()
 
+    async def _log_redis_stats(self) -> None:
+        """Periodically log Redis connection pool usage."""
+        while True:
+            await asyncio.sleep(self.settings.redis_stats_interval)
+            if self.redis_factory:
+                stats = self.redis_factory.stats()
+                self.logger.info(
+                    f"Redis pool: {stats['in_use']} in use, {stats['idle']} idle, "
+                    f"max {stats['max']}",
+                )
+
     async def stop(self) -> None:
         """Stop the Twitter scraper application gracefully."""
         self.logger.info("Shutting down Twitter Scrapper...")
 
+        if self.stats_task:
+            self.stats_task.cancel()
+
         if self.worker:
             await self.worker.stop()
 
+        # Close the pool last, once the worker and publishers released their clients
+        if self.redis_factory:
+            await self.redis_factory.close()
+
         self.logger.info("Twitter Scrapper stopped")
 
 
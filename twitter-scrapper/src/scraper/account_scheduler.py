@@ -0,0 +1,104 @@
+"""Scheduling of timeline fetches over the twscrape account pool."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+
+from twscrape import AccountsPool
+
+from src.config import Settings
+from src.scraper.twitter_scraper import TwitterScraperError
+
+logger = logging.getLogger(__name__)
+
+# twscrape queue (GraphQL operation) used for user timelines
+TIMELINE_QUEUE = "UserTweets"
+
+
+class AccountsExhaustedError(TwitterScraperError):
+    """Every account is busy or rate limited; the job should be retried later."""
+
+    def __init__(self, message: str, retry_at: datetime):
+        """Initialize error with the time an account is expected to be free."""
+        super().__init__(message)
+        self.retry_at = retry_at
+
+
+class AccountScheduler:
+    """
+    Admits at most one timeline fetch per healthy account at a time.
+
+    This is a concurrency gate, not a rate budget: twscrape leases an account
+    per timeline request and, when a response reports the rate limit as
+    exhausted, locks the account in accounts.db until the reset time. The
+    scheduler reads those locks and only lets a fetch start while an account
+    is free for it, so fetches never queue up inside twscrape waiting for an
+    account, and jobs are deferred until the earliest reset instead.
+    """
+
+    def __init__(self, settings: Settings, pool: AccountsPool):
+        """Initialize scheduler over a twscrape account pool."""
+        self.settings = settings
+        self.pool = pool
+        self.active_accounts = 0
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        """Count the active accounts, which bounds how many fetches run at once."""
+        self.active_accounts = len(await self._timeline_locks())
+        logger.info(f"Account scheduler: {self.active_accounts} active account(s)")
+
+    async def _timeline_locks(self) -> list[Optional[datetime]]:
+        """Get until when each active account is locked for timelines (None when free)."""
+        return [
+            account.locks.get(TIMELINE_QUEUE)
+            for account in await self.pool.get_all()
+            if account.active
+        ]
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[None]:
+        """
+        Admit one timeline fetch while an account is free for it.
+
+        Raises:
+            AccountsExhaustedError: No healthy account is free
+        """
+        async with self._lock:
+            locks = await self._timeline_locks()
+            now = datetime.now(timezone.utc)
+            locked = [until for until in locks if until is not None and until > now]
+
+            # Accounts leased by our own fetches are locked too; only the locks
+            # beyond those are rate limits (or fetches of other processes)
+            rate_limited = max(0, len(locked) - self._in_flight)
+            free = len(locks) - len(locked)
+
+            if free <= 0 or self._in_flight >= len(locks):
+                raise AccountsExhaustedError(
+                    f"All {len(locks)} Twitter account(s) are busy or rate limited",
+                    retry_at=self._next_reset(locked, rate_limited, now),
+                )
+
+            self._in_flight += 1
+
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+
+    def _next_reset(
+        self,
+        locked: list[datetime],
+        rate_limited: int,
+        now: datetime,
+    ) -> datetime:
+        """Get when the first locked account is expected to be free again."""
+        # Accounts busy with fetches free up in seconds, long before their lock
+        # (set for the worst case) expires, so only rate limits are waited out
+        if not rate_limited or not locked:
+            return now + timedelta(seconds=self.settings.twitter_defer_delay)
+        return min(locked)
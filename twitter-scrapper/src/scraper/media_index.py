@@ -0,0 +1,161 @@
+"""Index of media URLs already uploaded or queued, shared by every source."""
+
+import hashlib
+import logging
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from redis.asyncio import Redis
+
+from src.config import Settings
+from src.models import FetchedPost, MediaUploadJobData
+
+logger = logging.getLogger(__name__)
+
+# KEYS: one index key per job; ARGV[1]: pending TTL in seconds, ARGV[1 + i]: storage key
+# of job i.
+# Claims unclaimed URLs for their job and returns, per job, the storage key an
+# earlier job already claimed, or nil for the ones claimed now
+CLAIM_SCRIPT = """
+local result = {}
+for i, key in ipairs(KEYS) do
+    if redis.call('SET', key, ARGV[i + 1], 'NX', 'EX', ARGV[1]) then
+        result[i] = false
+    else
+        result[i] = redis.call('GET', key)
+    end
+end
+return result
+"""
+
+# KEYS: index keys; ARGV[i]: storage key the claim of KEYS[i] must still hold
+RELEASE_SCRIPT = """
+for i, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[i] then
+        redis.call('DEL', key)
+    end
+end
+return true
+"""
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_media_url(url: str) -> str:
+    """
+    Normalize a media URL so spellings of the same URL share one index entry.
+
+    Scheme and host are lowercased, default ports and fragments dropped and
+    query parameters sorted.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+class MediaIndex:
+    """
+    Maps normalized media URLs to the storage key their upload was queued under.
+
+    Storage keys are built per tweet, so the same photo (a retweet of a tweet
+    already scraped from another account, a tweet seen again after its cursor
+    was lost) would otherwise be uploaded once per tweet and poll. The first
+    job for a URL claims it; later ones resolve to the claimed key and are not
+    published.
+    """
+
+    KEY_PREFIX = "media:url"
+
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
+        """Initialize media index with settings."""
+        self.settings = settings
+        self.ttl = settings.media_index_ttl
+        self.pending_ttl = settings.media_index_pending_ttl
+        self.redis = (
+            redis
+            if redis is not None
+            else Redis.from_url(settings.redis_url, decode_responses=True)
+        )
+        self._claim = self.redis.register_script(CLAIM_SCRIPT)
+        self._release = self.redis.register_script(RELEASE_SCRIPT)
+
+    def _key(self, url: str) -> str:
+        """Build the Redis key for a media URL (hashed, URLs can be long)."""
+        digest = hashlib.sha1(normalize_media_url(url).encode()).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    async def claim(
+        self,
+        posts: list[FetchedPost],
+        jobs: list[MediaUploadJobData],
+    ) -> list[MediaUploadJobData]:
+        """
+        Claim the URLs of upload jobs and drop jobs for media already claimed.
+
+        mediaUrls of the posts are rewritten to the existing storage keys of
+        the dropped jobs.
+
+        Args:
+            posts: Posts the jobs were created for
+            jobs: Upload jobs of the posts
+
+        Returns:
+            Jobs whose URL was not uploaded or queued before, to be published
+        """
+        # Uploads from a buffer have no URL to index
+        indexed = [job for job in jobs if job.sourceUrl]
+        if not indexed:
+            return jobs
+
+        existing = await self._claim(
+            keys=[self._key(job.sourceUrl) for job in indexed],
+            args=[self.pending_ttl, *(job.targetPath for job in indexed)],
+        )
+        resolved = {job.targetPath: key for job, key in zip(indexed, existing) if key is not None}
+        new_jobs = [self._with_claim(job) for job in jobs if job.targetPath not in resolved]
+
+        if resolved:
+            for post in posts:
+                post.mediaUrls = [resolved.get(path, path) for path in post.mediaUrls]
+            logger.debug(f"Resolved {len(resolved)} media files to already queued uploads")
+
+        return new_jobs
+
+    def _with_claim(self, job: MediaUploadJobData) -> MediaUploadJobData:
+        """
+        Attach the claim of a job's URL to the job.
+
+        Claims start with the pending TTL, so a failed upload does not leave
+        later posts pointing at a file that was never written for long; the
+        media worker extends the claim to the full TTL once the file is uploaded
+        and drops it when the upload fails for good.
+        """
+        if not job.sourceUrl:
+            return job
+        return job.model_copy(
+            update={"mediaIndexKey": self._key(job.sourceUrl), "mediaIndexTtl": self.ttl},
+        )
+
+    async def release(self, jobs: list[MediaUploadJobData]) -> None:
+        """
+        Give up the claims of jobs that could not be published.
+
+        Args:
+            jobs: Jobs returned by claim
+        """
+        indexed = [job for job in jobs if job.sourceUrl]
+        if not indexed:
+            return
+
+        await self._release(
+            keys=[self._key(job.sourceUrl) for job in indexed],
+            args=[job.targetPath for job in indexed],
+        )
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.redis.aclose()
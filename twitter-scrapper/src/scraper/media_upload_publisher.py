@@ -1,25 +1,65 @@
 """Publisher for media upload jobs to BullMQ queue."""
 
+import asyncio
+import hashlib
 import logging
+from typing import Optional
 
 from bullmq import Queue
+from redis.asyncio import Redis
 
 from src.config import Settings
 from src.models import MediaUploadJobData
 
 logger = logging.getLogger(__name__)
 
+# Completed jobs are kept this long (up to the count) so re-adding them stays a no-op
+COMPLETED_JOB_RETENTION = {"age": 60 * 60, "count": 10000}
+# Lowest BullMQ priority. These URLs do not expire, so uploads of signed URLs, which
+# are prioritized by expiry, go first; jobs without a priority would run before them
+MEDIA_JOB_PRIORITY = 2**21
+
+
+def media_job_id(job_data: MediaUploadJobData) -> str:
+    """
+    Build the BullMQ job ID of an upload from its target path.
+
+    Adding a job whose ID already exists returns the existing job, so
+    publishing the uploads of a retried or re-polled post enqueues nothing.
+    """
+    digest = hashlib.sha1(job_data.targetPath.encode()).hexdigest()
+    return f"media-{digest}"
+
+
+def job_options(job_data: MediaUploadJobData, failed_retention: int) -> dict:
+    """
+    Build the BullMQ options of an upload.
+
+    Failed jobs are kept for failed_retention seconds (up to 1000 of them).
+    """
+    return {
+        "jobId": media_job_id(job_data),
+        "priority": MEDIA_JOB_PRIORITY,
+        "attempts": 5,
+        "backoff": {
+            "type": "exponential",
+            "delay": 2000,
+        },
+        "removeOnComplete": COMPLETED_JOB_RETENTION,
+        "removeOnFail": {"age": failed_retention, "count": 1000},
+    }
+
 
 class MediaUploadPublisher:
     """Publisher for posting media upload jobs to BullMQ queue."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
         """Initialize media upload publisher with settings."""
         self.settings = settings
         self.queue = Queue(
             settings.media_upload_queue,
             {
-                "connection": settings.redis_url,
+                "connection": redis if redis is not None else settings.redis_url,
             },
         )
 
@@ -35,18 +75,11 @@ class MediaUploadPublisher:
         """
         data = job_data.model_dump(mode="json", by_alias=True)
 
+        await self._drop_failed([job_data])
         job = await self.queue.add(
             "upload-media",
             data,
-            {
-                "attempts": 5,
-                "backoff": {
-                    "type": "exponential",
-                    "delay": 2000,
-                },
-                "removeOnComplete": 100,
-                "removeOnFail": 1000,
-            },
+            job_options(job_data, self.settings.media_index_ttl),
         )
 
         logger.debug(f"Published media upload job {job.id} for {job_data.targetPath}")
@@ -66,19 +99,12 @@ class MediaUploadPublisher:
         if not jobs:
             return []
 
+        await self._drop_failed(jobs)
         bulk_jobs = [
             {
                 "name": "upload-media",
                 "data": job.model_dump(mode="json", by_alias=True),
-                "opts": {
-                    "attempts": 5,
-                    "backoff": {
-                        "type": "exponential",
-                        "delay": 2000,
-                    },
-                    "removeOnComplete": 100,
-                    "removeOnFail": 1000,
-                },
+                "opts": job_options(job, self.settings.media_index_ttl),
             }
             for job in jobs
         ]
@@ -89,6 +115,21 @@ class MediaUploadPublisher:
 
         return [job.id for job in added_jobs]
 
+    async def _drop_failed(self, jobs: list[MediaUploadJobData]) -> None:
+        """
+        Remove failed jobs that have the IDs of jobs about to be published.
+
+        BullMQ ignores a job whose ID already exists, and failed jobs are kept
+        for a while, so an upload that failed before would never be retried.
+        """
+        job_ids = [media_job_id(job) for job in jobs]
+        states = await asyncio.gather(*(self.queue.getJobState(job_id) for job_id in job_ids))
+        failed = [job_id for job_id, state in zip(job_ids, states) if state == "failed"]
+        for job_id in failed:
+            await self.queue.remove(job_id)
+        if failed:
+            logger.info(f"Queueing {len(failed)} media uploads that failed before again")
+
     async def close(self) -> None:
         """Close the queue connection."""
         await self.queue.close()
@@ -151,3 +192,17 @@ def get_content_type_from_extension(extension: str) -> str:
     }
     return mapping.get(extension, "application/octet-stream")
 
+
+def get_extension_from_content_type(content_type: str) -> str:
+    """Get file extension from content type."""
+    mapping = {
+        "image/jpeg": "jpg",
+        "image/jpg": "jpg",
+        "image/png": "png",
+        "image/gif": "gif",
+        "image/webp": "webp",
+        "video/mp4": "mp4",
+        "video/quicktime": "mov",
+        "video/webm": "webm",
+    }
+    return mapping.get(content_type.lower(), "bin")
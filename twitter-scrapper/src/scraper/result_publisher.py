@@ -1,12 +1,16 @@
 """Result publisher for posting results to BullMQ results queue."""
 
+import asyncio
 import logging
 from datetime import datetime
+from typing import Any, Optional
 
 from bullmq import Queue
+from redis.asyncio import Redis
 
 from src.config import Settings
 from src.models import ErrorData, FetchedPost, ResultJobData, ResultJobMetadata
+from src.scraper.result_encoding import check_codec, encode_posts
 
 logger = logging.getLogger(__name__)
 
@@ -14,15 +18,20 @@ logger = logging.getLogger(__name__)
 class ResultPublisher:
     """Publisher for posting fetch results to BullMQ results queue."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
         """Initialize result publisher with settings."""
+        check_codec(settings.result_encoding)
         self.settings = settings
         self.queue = Queue(
             settings.fetch_results_queue,
             {
-                "connection": settings.redis_url,
+                "connection": redis if redis is not None else settings.redis_url,
             },
         )
+        # Pending results when batching is enabled: (job data, job options, future
+        # resolved once the batch containing the result has been added)
+        self._batch: list[tuple[dict[str, Any], dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def publish_success(
         self,
@@ -47,41 +56,50 @@ class ResultPublisher:
             next_cursor: Next cursor for pagination
             processing_time: Processing time in milliseconds
             priority: Job priority
+
+        Posts larger than result_chunk_max_bytes in total are split over several
+        result jobs. Each carries chunkIndex/chunkTotal, and only the last one
+        carries next_cursor so the consumer advances the cursor once.
         """
-        result_job = ResultJobData(
-            sourceId=source_id,
-            sourceType=source_type,
-            status="success",
-            posts=posts,
-            nextCursor=next_cursor,
-            processingTime=processing_time,
-            metadata=ResultJobMetadata(
-                collectorJobId=collector_job_id,
-                orchestratorJobId=orchestrator_job_id,
-                fetchedAt=datetime.utcnow(),
-            ),
-        )
+        chunks = self._chunk_posts(posts, self.settings.result_chunk_max_bytes)
+        chunked = len(chunks) > 1
+        fetched_at = datetime.utcnow()
 
-        # Convert to dict for BullMQ (handling datetime serialization)
-        job_data = result_job.model_dump(mode="json", by_alias=True)
+        jobs_data = []
+        for index, chunk in enumerate(chunks):
+            is_last = index == len(chunks) - 1
+            result_job = ResultJobData(
+                sourceId=source_id,
+                sourceType=source_type,
+                status="success",
+                posts=chunk,
+                nextCursor=next_cursor if is_last else None,
+                chunkIndex=index if chunked else None,
+                chunkTotal=len(chunks) if chunked else None,
+                processingTime=processing_time,
+                metadata=ResultJobMetadata(
+                    collectorJobId=collector_job_id,
+                    orchestratorJobId=orchestrator_job_id,
+                    fetchedAt=fetched_at,
+                ),
+            )
 
-        await self.queue.add(
-            "process-result",
-            job_data,
-            {
-                "priority": priority,
-                "attempts": 5,
-                "backoff": {
-                    "type": "exponential",
-                    "delay": 2000,
-                },
-                "removeOnComplete": 100,
-                "removeOnFail": 1000,
-            },
-        )
+            # Convert to dict for BullMQ (handling datetime serialization)
+            job_data = result_job.model_dump(mode="json", by_alias=True)
+            if self.settings.result_encoding != "json":
+                job_data["postsEncoded"] = encode_posts(
+                    job_data.pop("posts"),
+                    self.settings.result_encoding,
+                )
+                job_data["posts"] = None
+                job_data["encoding"] = self.settings.result_encoding
+            jobs_data.append(job_data)
+
+        await self._add(jobs_data, priority)
 
         logger.info(
-            f"Published success result for source {source_id}: {len(posts)} posts",
+            f"Published success result for source {source_id}: {len(posts)} posts"
+            + (f" in {len(chunks)} chunks" if chunked else ""),
         )
 
     async def publish_error(
@@ -131,27 +149,116 @@ class ResultPublisher:
         # Convert to dict for BullMQ
         job_data = result_job.model_dump(mode="json", by_alias=True)
 
-        await self.queue.add(
-            "process-result",
-            job_data,
-            {
-                "priority": priority,
-                "attempts": 5,
-                "backoff": {
-                    "type": "exponential",
-                    "delay": 2000,
-                },
-                "removeOnComplete": 100,
-                "removeOnFail": 1000,
-            },
-        )
+        await self._add([job_data], priority)
 
         logger.info(
             f"Published error result for source {source_id}: {error_code} - {str(error)}",
         )
 
+    @staticmethod
+    def _chunk_posts(posts: list[FetchedPost], max_bytes: int) -> list[list[FetchedPost]]:
+        """
+        Split posts into consecutive chunks of at most max_bytes of JSON each.
+
+        A single post larger than max_bytes gets a chunk of its own. There is
+        always at least one (possibly empty) chunk.
+        """
+        if max_bytes <= 0:
+            return [posts]
+
+        chunks: list[list[FetchedPost]] = []
+        current: list[FetchedPost] = []
+        current_size = 0
+
+        for post in posts:
+            size = len(post.model_dump_json(by_alias=True).encode())
+            if current and current_size + size > max_bytes:
+                chunks.append(current)
+                current = []
+                current_size = 0
+            current.append(post)
+            current_size += size
+
+        chunks.append(current)
+        return chunks
+
+    async def _add(self, jobs_data: list[dict[str, Any]], priority: int) -> None:
+        """
+        Add result jobs, either directly or through the current batch.
+
+        With batching enabled the call returns once the batch holding the results
+        has been written, so callers can rely on the results being queued.
+        """
+        opts = {
+            "priority": priority,
+            "attempts": 5,
+            "backoff": {
+                "type": "exponential",
+                "delay": 2000,
+            },
+            "removeOnComplete": 100,
+            "removeOnFail": 1000,
+        }
+
+        if not self.settings.result_batch_enabled:
+            # One by one, in order, so the chunk carrying the cursor is queued last
+            for job_data in jobs_data:
+                await self.queue.add("process-result", job_data, opts)
+            return
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for job_data in jobs_data:
+            future = loop.create_future()
+            self._batch.append((job_data, opts, future))
+            futures.append(future)
+
+        if len(self._batch) >= self.settings.result_batch_max_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+        await asyncio.gather(*futures)
+
+    async def _flush_after_delay(self) -> None:
+        """Flush the current batch once the maximum delay has passed."""
+        await asyncio.sleep(self.settings.result_batch_max_delay_ms / 1000)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered results to the queue in a single addBulk call."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        try:
+            await self.queue.addBulk(
+                [
+                    {"name": "process-result", "data": job_data, "opts": opts}
+                    for job_data, opts, _ in batch
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish batch of {len(batch)} results: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+        logger.debug(f"Published batch of {len(batch)} results")
+
     async def close(self) -> None:
-        """Close the queue connection."""
+        """Flush buffered results and close the queue connection."""
+        await self.flush()
         await self.queue.close()
 
     @staticmethod
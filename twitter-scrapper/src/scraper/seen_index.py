@@ -0,0 +1,77 @@
+"""Per-source index of external IDs that were already emitted."""
+
+import logging
+import time
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class SeenIndex:
+    """
+    Bounded, expiring set of external IDs already published for each source.
+
+    Stored as a Redis sorted set scored by insertion time so the oldest IDs are
+    trimmed first once the set grows past the configured size.
+    """
+
+    KEY_PREFIX = "twitter:seen"
+
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
+        """Initialize seen index with settings."""
+        self.settings = settings
+        self.max_size = settings.seen_index_max_size
+        self.ttl = settings.seen_index_ttl
+        self.redis = (
+            redis
+            if redis is not None
+            else Redis.from_url(settings.redis_url, decode_responses=True)
+        )
+
+    def _key(self, source_id: str) -> str:
+        """Build the Redis key for a source."""
+        return f"{self.KEY_PREFIX}:{source_id}"
+
+    async def load(self, source_id: str) -> set[str]:
+        """
+        Load the seen IDs for a source into memory for O(1) lookups.
+
+        Args:
+            source_id: Source ID
+
+        Returns:
+            Set of external IDs already emitted for the source
+        """
+        members = await self.redis.zrange(self._key(source_id), 0, -1)
+        return set(members)
+
+    async def add(self, source_id: str, external_ids: list[str]) -> None:
+        """
+        Mark external IDs as emitted for a source.
+
+        Args:
+            source_id: Source ID
+            external_ids: External IDs that were published in a result
+        """
+        if not external_ids:
+            return
+
+        key = self._key(source_id)
+        now = time.time()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {external_id: now for external_id in external_ids})
+            # Keep only the newest max_size members
+            pipe.zremrangebyrank(key, 0, -(self.max_size + 1))
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+        logger.debug(f"Marked {len(external_ids)} entries as seen for source {source_id}")
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.redis.aclose()
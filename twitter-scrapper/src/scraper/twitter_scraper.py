@@ -1,15 +1,21 @@
 """Twitter scraper using twscrape."""
 
+import asyncio
 import logging
+from collections import deque
+from contextlib import aclosing
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, AbstractSet, Optional
 
-from twscrape import API, gather
+from twscrape import API
 from twscrape.models import Tweet, User
 
 from src.config import Settings
 
+if TYPE_CHECKING:
+    from src.scraper.user_cache import UserCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,10 +76,13 @@ class TwitterAuthError(TwitterScraperError):
 class TwitterScraper:
     """Wrapper around twscrape for fetching Twitter posts."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, user_cache: Optional["UserCache"] = None):
         """Initialize Twitter scraper with settings."""
         self.settings = settings
         self.api: Optional[API] = None
+        self.user_cache = user_cache
+        # Background refreshes of stale cache entries, by username
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
 
     async def initialize(self) -> None:
         """Initialize the twscrape API with accounts from database."""
@@ -106,14 +115,25 @@ class TwitterScraper:
         username: str,
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
+        seen_ids: Optional[AbstractSet[str]] = None,
     ) -> tuple[list[TwitterPost], Optional[str]]:
         """
         Fetch tweets from a Twitter user.
 
+        The timeline is consumed lazily, newest first, and paging stops as soon as
+        the cursor or a run of already-seen tweets is reached, so an incremental poll
+        only requests the pages holding new tweets. When more tweets than the limit
+        are newer than the cursor, the oldest of them are returned and the cursor
+        moves to the newest returned one; the following polls work off the rest.
+        Without a cursor, the newest tweets up to the limit are returned.
+
         Args:
             username: Twitter username (without @)
             limit: Maximum number of tweets to fetch
-            cursor: Cursor for pagination (tweet ID)
+            cursor: Newest tweet ID processed by the previous poll; this tweet and
+                anything older are not fetched again
+            seen_ids: Tweet IDs already emitted for this source. When given, they
+                are skipped and paging stops after a run of seen tweets
 
         Returns:
             Tuple of (list of TwitterPost objects, next cursor/tweet ID)
@@ -131,36 +151,31 @@ class TwitterScraper:
         )
 
         try:
-            # Get user ID from username
-            user = await api.user_by_login(username)
-            if user is None:
-                raise TwitterAccountNotFoundError(f"Twitter user @{username} not found")
-
-            user_profile = self._parse_user(user)
+            # Get user ID from username, from the user cache when possible
+            user_profile, from_cache = await self._resolve_user(api, username)
 
             # Fetch tweets
-            tweets_data = await gather(api.user_tweets(user.id, limit=limit))
-
-            posts = []
-            next_cursor = None
-            found_cursor = cursor is None  # If no cursor, start collecting immediately
-
-            for tweet in tweets_data:
-                # If we have a cursor, skip until we find it
-                if not found_cursor:
-                    if str(tweet.id) == cursor:
-                        found_cursor = True
-                    continue
-
-                post = self._parse_tweet(tweet, user_profile)
-                posts.append(post)
-
-                # Store the tweet ID as next cursor
-                next_cursor = str(tweet.id)
-
-                # Check limit
-                if len(posts) >= limit:
-                    break
+            try:
+                posts, next_cursor = await self._collect_tweets(
+                    api,
+                    user_profile,
+                    limit,
+                    cursor,
+                    seen_ids,
+                )
+            except Exception as e:
+                # The cached ID may be outdated (account deleted or recreated)
+                if not from_cache or not self._is_not_found_error(e):
+                    raise
+                logger.info(f"Timeline of cached user @{username} not found, resolving again")
+                user_profile = await self._lookup_user(api, username)
+                posts, next_cursor = await self._collect_tweets(
+                    api,
+                    user_profile,
+                    limit,
+                    cursor,
+                    seen_ids,
+                )
 
             logger.info(
                 f"Fetched {len(posts)} tweets for @{username}, next_cursor={next_cursor}",
@@ -184,13 +199,151 @@ class TwitterScraper:
                 raise TwitterAuthError(f"Authentication error: {e}")
 
             # Check for user not found
-            if "not found" in error_msg or "404" in error_msg:
+            if self._is_not_found_error(e):
                 logger.error(f"User @{username} not found: {e}")
                 raise TwitterAccountNotFoundError(f"User @{username} not found: {e}")
 
             logger.error(f"Unexpected error fetching @{username}: {e}")
             raise TwitterScraperError(f"Error fetching tweets: {e}")
 
+    async def _collect_tweets(
+        self,
+        api: API,
+        user_profile: TwitterProfile,
+        limit: int,
+        cursor: Optional[str],
+        seen_ids: Optional[AbstractSet[str]],
+    ) -> tuple[list[TwitterPost], Optional[str]]:
+        """
+        Read the user's timeline until the cursor or a run of seen tweets.
+
+        Returns:
+            Tuple of (list of TwitterPost objects, next cursor/tweet ID)
+        """
+        # Tweet IDs grow over time, so anything not newer than the cursor is old
+        cursor_id = int(cursor) if cursor and cursor.isdigit() else None
+
+        # Once full, the window drops its newest tweets: with a cursor, a backlog is
+        # returned oldest first so the cursor can move up without skipping any tweet
+        window: deque[Tweet] = deque(maxlen=limit)
+        newest_id: Optional[int] = None
+        truncated = False
+        consecutive_seen = 0
+
+        # twscrape requests a page only when the previous one is used up; leaving
+        # the loop closes the generator, so no further pages are requested
+        async with aclosing(api.user_tweets(int(user_profile.id))) as timeline:
+            position = 0
+            async for tweet in timeline:
+                position += 1
+                tweet_id = int(tweet.id)
+                if newest_id is None or tweet_id > newest_id:
+                    newest_id = tweet_id
+
+                if str(tweet.id) == cursor or (cursor_id is not None and tweet_id < cursor_id):
+                    # A pinned tweet comes first, out of order; it is skipped, not an end
+                    if position == 1:
+                        continue
+                    break
+
+                if seen_ids is not None and str(tweet.id) in seen_ids:
+                    consecutive_seen += 1
+                    if consecutive_seen >= self.settings.seen_stop_after:
+                        break
+                    continue
+                consecutive_seen = 0
+
+                if len(window) >= limit:
+                    truncated = True
+                    if cursor is None:
+                        break
+                window.append(tweet)
+
+        posts = [self._parse_tweet(tweet, user_profile) for tweet in window]
+
+        if truncated and cursor is not None:
+            # Newer tweets are still pending; they are read from here on the next poll
+            newest_id = max(int(tweet.id) for tweet in window)
+        return posts, self._next_cursor(newest_id, cursor, cursor_id)
+
+    @staticmethod
+    def _next_cursor(
+        newest_id: Optional[int],
+        cursor: Optional[str],
+        cursor_id: Optional[int],
+    ) -> Optional[str]:
+        """Get the cursor after a poll: its newest tweet, unless that is not past the cursor."""
+        if newest_id is None or (cursor_id is not None and newest_id <= cursor_id):
+            return cursor
+        return str(newest_id)
+
+    async def _resolve_user(self, api: API, username: str) -> tuple[TwitterProfile, bool]:
+        """
+        Resolve a username to its profile, serving cached profiles when possible.
+
+        Stale cache entries are still served and refreshed in the background.
+
+        Returns:
+            Tuple of (profile, whether it came from the cache)
+        """
+        if self.user_cache:
+            cached = await self.user_cache.get(username)
+            if cached is not None:
+                profile, is_stale = cached
+                if is_stale:
+                    self._schedule_refresh(api, username)
+                return profile, True
+
+        return await self._lookup_user(api, username), False
+
+    async def _lookup_user(self, api: API, username: str) -> TwitterProfile:
+        """
+        Resolve a username with the API and cache the result.
+
+        Raises:
+            TwitterAccountNotFoundError: User not found
+        """
+        user = await api.user_by_login(username)
+        if user is None:
+            if self.user_cache:
+                await self.user_cache.invalidate(username)
+            raise TwitterAccountNotFoundError(f"Twitter user @{username} not found")
+
+        profile = self._parse_user(user)
+        if self.user_cache:
+            await self.user_cache.put(username, profile)
+        return profile
+
+    def _schedule_refresh(self, api: API, username: str) -> None:
+        """Refresh a stale cache entry in the background, once per username."""
+        if username in self._refresh_tasks:
+            return
+
+        task = asyncio.create_task(self._refresh_user(api, username))
+        self._refresh_tasks[username] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(username, None))
+
+    async def _refresh_user(self, api: API, username: str) -> None:
+        """Resolve a username again, keeping the stale entry if that fails."""
+        try:
+            await self._lookup_user(api, username)
+            logger.debug(f"Refreshed cached user @{username}")
+        except Exception as e:
+            logger.warning(f"Failed to refresh cached user @{username}: {e}")
+
+    @staticmethod
+    def _is_not_found_error(error: Exception) -> bool:
+        """Check whether an API error means the user or timeline does not exist."""
+        error_msg = str(error).lower()
+        return "not found" in error_msg or "404" in error_msg
+
+    async def close(self) -> None:
+        """Cancel pending cache refreshes and close the user cache."""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        if self.user_cache:
+            await self.user_cache.close()
+
     def _parse_user(self, user: User) -> TwitterProfile:
         """Parse twscrape User into TwitterProfile."""
         return TwitterProfile(
@@ -0,0 +1,84 @@
+"""Cache of username -> Twitter user profile resolutions."""
+
+import json
+import logging
+import time
+from dataclasses import asdict
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.config import Settings
+from src.scraper.twitter_scraper import TwitterProfile
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """
+    Redis-backed username -> TwitterProfile cache with stale-while-revalidate.
+
+    Entries are fresh for user_cache_ttl seconds. For user_cache_stale_ttl seconds
+    after that they are still served, flagged as stale so the caller can refresh
+    them in the background, and then they expire from Redis.
+    """
+
+    KEY_PREFIX = "twitter:user"
+
+    def __init__(self, settings: Settings, redis: Optional[Redis] = None):
+        """Initialize user cache with settings."""
+        self.settings = settings
+        self.ttl = settings.user_cache_ttl
+        self.stale_ttl = settings.user_cache_stale_ttl
+        self.redis = (
+            redis
+            if redis is not None
+            else Redis.from_url(settings.redis_url, decode_responses=True)
+        )
+
+    def _key(self, username: str) -> str:
+        """Build the Redis key for a username (usernames are case-insensitive)."""
+        return f"{self.KEY_PREFIX}:{username.lower().lstrip('@')}"
+
+    async def get(self, username: str) -> Optional[tuple[TwitterProfile, bool]]:
+        """
+        Get the cached profile for a username.
+
+        Args:
+            username: Twitter username (without @)
+
+        Returns:
+            Tuple of (profile, is_stale), or None when not cached
+        """
+        value = await self.redis.get(self._key(username))
+        if value is None:
+            return None
+
+        try:
+            entry = json.loads(value)
+            profile = TwitterProfile(**entry["profile"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed user cache entry for @{username}: {e}")
+            return None
+
+        is_stale = time.time() - entry.get("cachedAt", 0) >= self.ttl
+        return profile, is_stale
+
+    async def put(self, username: str, profile: TwitterProfile) -> None:
+        """
+        Cache the profile a username resolves to.
+
+        Args:
+            username: Twitter username (without @)
+            profile: Resolved profile
+        """
+        value = json.dumps({"profile": asdict(profile), "cachedAt": time.time()})
+        await self.redis.set(self._key(username), value, ex=self.ttl + self.stale_ttl)
+
+    async def invalidate(self, username: str) -> None:
+        """Forget the cached profile for a username."""
+        await self.redis.delete(self._key(username))
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.redis.aclose()
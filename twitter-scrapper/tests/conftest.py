@@ -17,6 +17,7 @@ def mock_settings():
     settings.twitter_accounts_db = "test_accounts.db"
     settings.twitter_rate_limit_delay = 0.1
     settings.twitter_max_tweets = 10
+    settings.seen_stop_after = 4
     settings.worker_concurrency = 1
     settings.s3_endpoint = "http://localhost:9001"
     settings.s3_access_key = "test"
@@ -0,0 +1,164 @@
+"""Tests for scheduling timeline fetches over the account pool."""
+
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bullmq import DelayedError
+
+from src.scraper.account_scheduler import (
+    TIMELINE_QUEUE,
+    AccountScheduler,
+    AccountsExhaustedError,
+)
+from src.scraper.queue_worker import TwitterQueueWorker
+from src.scraper.twitter_scraper import TwitterScraperError
+
+
+def make_account(username: str, locked_until: datetime | None = None, active: bool = True):
+    """Build a minimal twscrape-like Account."""
+    return SimpleNamespace(
+        username=username,
+        active=active,
+        locks={TIMELINE_QUEUE: locked_until} if locked_until else {},
+    )
+
+
+def make_scheduler(mock_settings, accounts: list) -> AccountScheduler:
+    """Create a scheduler over a pool holding the given accounts."""
+    mock_settings.twitter_defer_delay = 60
+    mock_settings.twitter_max_defer = 3600
+    pool = MagicMock()
+    pool.get_all = AsyncMock(return_value=accounts)
+    return AccountScheduler(mock_settings, pool)
+
+
+class TestAccountScheduler:
+    """Test AccountScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_counts_active_accounts(self, mock_settings):
+        """Test the scheduler counts only active accounts."""
+        scheduler = make_scheduler(
+            mock_settings,
+            [make_account("a"), make_account("b"), make_account("c", active=False)],
+        )
+
+        await scheduler.initialize()
+
+        assert scheduler.active_accounts == 2
+
+    @pytest.mark.asyncio
+    async def test_one_lease_per_healthy_account(self, mock_settings):
+        """Test as many fetches are admitted as there are healthy accounts."""
+        now = datetime.now(timezone.utc)
+        reset_at = now + timedelta(minutes=5)
+        accounts = [make_account("a"), make_account("b"), make_account("c", locked_until=reset_at)]
+        scheduler = make_scheduler(mock_settings, accounts)
+
+        async with AsyncExitStack() as stack:
+            for account in accounts[:2]:
+                await stack.enter_async_context(scheduler.lease())
+                # twscrape locks the account while it is in use
+                account.locks[TIMELINE_QUEUE] = now + timedelta(minutes=15)
+
+            with pytest.raises(AccountsExhaustedError) as exc_info:
+                await stack.enter_async_context(scheduler.lease())
+
+        assert exc_info.value.retry_at == reset_at
+
+        # Leases are released once the fetches are done
+        for account in accounts[:2]:
+            account.locks.clear()
+        async with scheduler.lease():
+            pass
+
+    @pytest.mark.asyncio
+    async def test_busy_accounts_defer_shortly(self, mock_settings):
+        """Test accounts busy with our own fetches defer by the default delay."""
+        busy_until = datetime.now(timezone.utc) + timedelta(minutes=15)
+        accounts = [make_account("a")]
+        scheduler = make_scheduler(mock_settings, accounts)
+
+        async with scheduler.lease():
+            # twscrape locks the account while it is in use
+            accounts[0].locks[TIMELINE_QUEUE] = busy_until
+
+            with pytest.raises(AccountsExhaustedError) as exc_info:
+                async with scheduler.lease():
+                    pass
+
+        delay = exc_info.value.retry_at - datetime.now(timezone.utc)
+        assert timedelta(seconds=50) < delay <= timedelta(seconds=60)
+
+
+def make_worker(mock_settings, scheduler: AccountScheduler) -> TwitterQueueWorker:
+    """Create a worker with a mocked scraper and publisher."""
+    scraper = MagicMock()
+    scraper.fetch_user_tweets = AsyncMock()
+    publisher = MagicMock()
+    publisher.publish_error = AsyncMock()
+    return TwitterQueueWorker(
+        mock_settings,
+        scraper,
+        publisher,
+        MagicMock(),
+        account_scheduler=scheduler,
+    )
+
+
+def make_job(created_at: datetime) -> MagicMock:
+    """Build a BullMQ-like fetch job created at the given time."""
+    job = MagicMock()
+    job.id = "1"
+    job.timestamp = int(created_at.timestamp() * 1000)
+    job.data = {
+        "sourceId": "src-1",
+        "sourceType": "twitter",
+        "externalId": "testuser",
+        "priority": 1,
+        "metadata": {
+            "orchestratorJobId": "orch-1",
+            "scheduledAt": created_at.isoformat(),
+            "sourceMetadata": {},
+        },
+    }
+    job.moveToDelayed = AsyncMock()
+    return job
+
+
+class TestJobDeferral:
+    """Jobs are deferred, not failed, while every account is exhausted."""
+
+    @pytest.mark.asyncio
+    async def test_exhausted_accounts_defer_job(self, mock_settings):
+        """Test the job is moved to delayed until the next rate limit reset."""
+        now = datetime.now(timezone.utc)
+        reset_at = now + timedelta(minutes=5)
+        scheduler = make_scheduler(mock_settings, [make_account("a", locked_until=reset_at)])
+        worker = make_worker(mock_settings, scheduler)
+        job = make_job(now)
+
+        with pytest.raises(DelayedError):
+            await worker._process_job(job, "token")
+
+        job.moveToDelayed.assert_awaited_once_with(int(reset_at.timestamp() * 1000), "token")
+        worker.scraper.fetch_user_tweets.assert_not_awaited()
+        worker.publisher.publish_error.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_job_past_max_defer_fails_instead(self, mock_settings):
+        """Test a job still without an account TWITTER_MAX_DEFER after its creation fails."""
+        now = datetime.now(timezone.utc)
+        reset_at = now + timedelta(minutes=5)
+        scheduler = make_scheduler(mock_settings, [make_account("a", locked_until=reset_at)])
+        worker = make_worker(mock_settings, scheduler)
+        job = make_job(now - timedelta(minutes=58))
+
+        with pytest.raises(TwitterScraperError):
+            await worker._process_job(job, "token")
+
+        job.moveToDelayed.assert_not_awaited()
+        worker.publisher.publish_error.assert_awaited_once()
@@ -0,0 +1,154 @@
+"""Tests for lazy timeline consumption in the Twitter scraper."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.scraper.twitter_scraper import TwitterScraper
+
+PAGE_SIZE = 20
+
+
+def make_tweet(tweet_id: int) -> SimpleNamespace:
+    """Build a minimal twscrape-like Tweet."""
+    return SimpleNamespace(
+        id=tweet_id,
+        rawContent=f"tweet {tweet_id}",
+        date=datetime(2024, 1, 15, 12, 0, 0),
+        media=None,
+        likeCount=0,
+        retweetCount=0,
+        replyCount=0,
+        quoteCount=0,
+        viewCount=None,
+    )
+
+
+class FakeTimeline:
+    """Timeline served in pages of PAGE_SIZE tweets, newest first."""
+
+    def __init__(self, tweet_ids: list[int]):
+        self.tweet_ids = tweet_ids
+        self.pages_requested = 0
+
+    async def user_tweets(self, uid, limit=-1):
+        for start in range(0, len(self.tweet_ids), PAGE_SIZE):
+            self.pages_requested += 1
+            for tweet_id in self.tweet_ids[start : start + PAGE_SIZE]:
+                yield make_tweet(tweet_id)
+
+
+def make_scraper(mock_settings, timeline: FakeTimeline) -> TwitterScraper:
+    """Create an initialized scraper reading the given timeline."""
+    api = MagicMock()
+    api.user_by_login = AsyncMock(
+        return_value=SimpleNamespace(id=1, username="testuser", displayname="Test User"),
+    )
+    api.user_tweets = MagicMock(side_effect=timeline.user_tweets)
+
+    scraper = TwitterScraper(mock_settings)
+    scraper.api = api
+    return scraper
+
+
+class TestLazyTimeline:
+    """Paging stops as soon as the new tweets have been read."""
+
+    @pytest.mark.asyncio
+    async def test_stops_at_cursor(self, mock_settings):
+        """Test only tweets newer than the cursor are fetched, from the first page."""
+        timeline = FakeTimeline(list(range(1000, 900, -1)))
+        scraper = make_scraper(mock_settings, timeline)
+
+        posts, next_cursor = await scraper.fetch_user_tweets("testuser", cursor="995")
+
+        assert [post.id for post in posts] == ["1000", "999", "998", "997", "996"]
+        assert next_cursor == "1000"
+        assert timeline.pages_requested == 1
+
+    @pytest.mark.asyncio
+    async def test_no_new_tweets_keeps_cursor(self, mock_settings):
+        """Test a poll without new tweets returns nothing and keeps the cursor."""
+        timeline = FakeTimeline(list(range(1000, 900, -1)))
+        scraper = make_scraper(mock_settings, timeline)
+
+        posts, next_cursor = await scraper.fetch_user_tweets("testuser", cursor="1000")
+
+        assert posts == []
+        assert next_cursor == "1000"
+        assert timeline.pages_requested == 1
+
+    @pytest.mark.asyncio
+    async def test_pinned_tweet_is_not_an_end(self, mock_settings):
+        """Test an old pinned tweet at the top does not end the poll."""
+        timeline = FakeTimeline([500, 1000, 999, 998])
+        scraper = make_scraper(mock_settings, timeline)
+
+        posts, next_cursor = await scraper.fetch_user_tweets("testuser", cursor="998")
+
+        assert [post.id for post in posts] == ["1000", "999"]
+        assert next_cursor == "1000"
+
+    @pytest.mark.asyncio
+    async def test_limit_stops_paging(self, mock_settings):
+        """Test paging stops once limit tweets were collected."""
+        timeline = FakeTimeline(list(range(1000, 900, -1)))
+        scraper = make_scraper(mock_settings, timeline)
+
+        posts, next_cursor = await scraper.fetch_user_tweets("testuser", limit=25)
+
+        assert len(posts) == 25
+        assert next_cursor == "1000"
+        assert timeline.pages_requested == 2
+
+    @pytest.mark.asyncio
+    async def test_run_of_seen_tweets_stops_paging(self, mock_settings):
+        """Test paging stops after seen_stop_after consecutive seen tweets."""
+        timeline = FakeTimeline(list(range(1000, 900, -1)))
+        scraper = make_scraper(mock_settings, timeline)
+        seen_ids = {str(tweet_id) for tweet_id in range(998, 900, -1)}
+
+        posts, _ = await scraper.fetch_user_tweets("testuser", seen_ids=seen_ids)
+
+        assert [post.id for post in posts] == ["1000", "999"]
+        assert timeline.pages_requested == 1
+
+    @pytest.mark.asyncio
+    async def test_backlog_larger_than_limit_is_worked_off_across_polls(self, mock_settings):
+        """Test a poll cut by the limit loses no tweet, with or without a seen set."""
+        for use_seen in (False, True):
+            timeline = FakeTimeline(list(range(1100, 900, -1)))
+            scraper = make_scraper(mock_settings, timeline)
+            seen_ids: set[str] = set()
+            emitted: list[str] = []
+            cursor = "1000"
+
+            for _ in range(6):
+                posts, cursor = await scraper.fetch_user_tweets(
+                    "testuser",
+                    limit=20,
+                    cursor=cursor,
+                    seen_ids=seen_ids if use_seen else None,
+                )
+                emitted.extend(post.id for post in posts)
+                seen_ids.update(post.id for post in posts)
+
+            assert sorted(emitted) == [str(tweet_id) for tweet_id in range(1001, 1101)]
+            assert cursor == "1100"
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_honored_with_an_empty_seen_set(self, mock_settings):
+        """Test a seen set that was never filled (or expired) does not re-emit old tweets."""
+        timeline = FakeTimeline(list(range(1000, 900, -1)))
+        scraper = make_scraper(mock_settings, timeline)
+
+        posts, next_cursor = await scraper.fetch_user_tweets(
+            "testuser",
+            cursor="998",
+            seen_ids=set(),
+        )
+
+        assert [post.id for post in posts] == ["1000", "999"]
+        assert next_cursor == "1000"
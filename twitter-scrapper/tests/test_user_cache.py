@@ -0,0 +1,176 @@
+"""Tests for the username -> user cache and its use by the scraper."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.scraper.twitter_scraper import TwitterAccountNotFoundError, TwitterScraper
+from src.scraper.user_cache import UserCache
+
+
+def make_redis() -> MagicMock:
+    """Create a dict-backed stand-in for the Redis client."""
+    store: dict[str, str] = {}
+    redis = MagicMock()
+    redis.store = store
+    redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+    redis.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value))
+    redis.delete = AsyncMock(side_effect=lambda key: store.pop(key, None))
+    return redis
+
+
+def make_cache(mock_settings) -> UserCache:
+    """Create a user cache with a 60s TTL and a 600s stale window."""
+    mock_settings.user_cache_ttl = 60
+    mock_settings.user_cache_stale_ttl = 600
+    return UserCache(mock_settings, make_redis())
+
+
+def make_user(user_id: int, username: str = "testuser") -> SimpleNamespace:
+    """Build a minimal twscrape-like User."""
+    return SimpleNamespace(
+        id=user_id,
+        username=username,
+        displayname="Test User",
+        profileImageUrl=None,
+        verified=False,
+        followersCount=0,
+        friendsCount=0,
+        statusesCount=0,
+    )
+
+
+def make_api(user_id: int = 12345) -> MagicMock:
+    """Create a twscrape API mock whose timelines are empty."""
+
+    async def user_tweets(uid, limit=-1):
+        return
+        yield
+
+    api = MagicMock()
+    api.user_by_login = AsyncMock(return_value=make_user(user_id))
+    api.user_tweets = MagicMock(side_effect=user_tweets)
+    return api
+
+
+def make_scraper(mock_settings, user_cache: UserCache, api: MagicMock) -> TwitterScraper:
+    """Create an initialized scraper backed by the given API mock."""
+    scraper = TwitterScraper(mock_settings, user_cache)
+    scraper.api = api
+    return scraper
+
+
+class TestUserCache:
+    """Test UserCache."""
+
+    @pytest.mark.asyncio
+    async def test_put_then_get_is_fresh(self, mock_settings, mock_twitter_profile):
+        """Test a just cached profile is returned and not stale."""
+        cache = make_cache(mock_settings)
+
+        await cache.put("TestUser", mock_twitter_profile)
+
+        assert await cache.get("testuser") == (mock_twitter_profile, False)
+        cache.redis.set.assert_awaited_once()
+        assert cache.redis.set.await_args.kwargs["ex"] == 660
+
+    @pytest.mark.asyncio
+    async def test_entry_past_ttl_is_stale(self, mock_settings, mock_twitter_profile):
+        """Test an entry older than the TTL is still served, flagged as stale."""
+        cache = make_cache(mock_settings)
+        await cache.put("testuser", mock_twitter_profile)
+
+        with patch("src.scraper.user_cache.time.time", return_value=10**12):
+            assert await cache.get("testuser") == (mock_twitter_profile, True)
+
+    @pytest.mark.asyncio
+    async def test_miss_and_malformed_entry(self, mock_settings):
+        """Test missing and unreadable entries are reported as misses."""
+        cache = make_cache(mock_settings)
+        cache.redis.store["twitter:user:broken"] = "{not json"
+
+        assert await cache.get("missing") is None
+        assert await cache.get("broken") is None
+
+
+class TestScraperUserResolution:
+    """The scraper only resolves usernames on cache misses or not-found timelines."""
+
+    @pytest.mark.asyncio
+    async def test_cached_user_skips_lookup(self, mock_settings):
+        """Test consecutive fetches resolve the username once."""
+        api = make_api()
+        scraper = make_scraper(mock_settings, make_cache(mock_settings), api)
+
+        for _ in range(3):
+            await scraper.fetch_user_tweets("testuser")
+
+        api.user_by_login.assert_awaited_once()
+        assert api.user_tweets.call_count == 3
+        assert all(call.args[0] == 12345 for call in api.user_tweets.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_stale_user_is_served_and_refreshed(
+        self,
+        mock_settings,
+        mock_twitter_profile,
+    ):
+        """Test a stale entry is used right away and refreshed in the background."""
+        api = make_api(user_id=999)
+        cache = make_cache(mock_settings)
+        await cache.put("testuser", mock_twitter_profile)
+        scraper = make_scraper(mock_settings, cache, api)
+
+        with patch("src.scraper.user_cache.time.time", return_value=10**12):
+            await scraper.fetch_user_tweets("testuser")
+            # Served from the stale entry
+            assert api.user_tweets.call_args.args[0] == 12345
+
+            await asyncio.gather(*scraper._refresh_tasks.values())
+
+        api.user_by_login.assert_awaited_once()
+        profile, is_stale = await cache.get("testuser")
+        assert profile.id == "999"
+        assert is_stale is False
+
+    @pytest.mark.asyncio
+    async def test_not_found_timeline_resolves_again(
+        self,
+        mock_settings,
+        mock_twitter_profile,
+    ):
+        """Test a cached ID whose timeline is not found is resolved again."""
+        api = make_api(user_id=999)
+        timelines = []
+
+        async def user_tweets(uid, limit=-1):
+            timelines.append(uid)
+            if uid == 12345:
+                raise Exception("404 Not Found")
+            return
+            yield
+
+        api.user_tweets = MagicMock(side_effect=user_tweets)
+        cache = make_cache(mock_settings)
+        await cache.put("testuser", mock_twitter_profile)
+        scraper = make_scraper(mock_settings, cache, api)
+
+        await scraper.fetch_user_tweets("testuser")
+
+        assert timelines == [12345, 999]
+        api.user_by_login.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_not_cached(self, mock_settings):
+        """Test a username that does not resolve raises and stays uncached."""
+        api = make_api()
+        api.user_by_login = AsyncMock(return_value=None)
+        cache = make_cache(mock_settings)
+        scraper = make_scraper(mock_settings, cache, api)
+
+        with pytest.raises(TwitterAccountNotFoundError):
+            await scraper.fetch_user_tweets("testuser")
+
+        assert await cache.get("testuser") is None